@@ -12,14 +12,214 @@ to employ vectorized computation for faster execution when processing large
 sets of trees. Non-vectorized versions are retained for comparative and testing
 purposes.
 """
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 
+# 10**x is computed as exp(ln(10) * x), which is faster than np.power
+_LN10 = float(np.log(10.0))
+
+# 0.5523**x is computed as exp(log(0.5523) * x) for the same reason
+_LOG_0_5523 = float(np.log(0.5523))
+
+# as is 0.65**x, used by the 8-inch top sawlog ratio of the hardwood equations
+_LOG_0_65 = float(np.log(0.65))
+
+# and 0.62**x, 0.484**x and 0.485**x, used by the boardfoot conversion ratios
+_LOG_0_62 = float(np.log(0.62))
+_LOG_0_484 = float(np.log(0.484))
+_LOG_0_485 = float(np.log(0.485))
+
+# constants shared by the tarif volume system (Brackett 1977, Chambers and
+# Foltz 1979), named so that they are defined in one place
+_BA_COEF = 0.005454154  # basal area (sq. ft) = _BA_COEF * dbh**2 (inches)
+_BA_4IN = 0.087266  # basal area of a 4-inch tree, in square feet
+_BA_4IN_X2 = 0.174533  # twice the basal area of a 4-inch tree
+_TARIF_COEF = 0.912733  # scales CV4 per square foot to a tarif number
+_INV_TARIF_COEF = 1.0 / _TARIF_COEF  # multiplying is cheaper than dividing
+_BRACKETT_A = 1.382937  # coefficients of the exponential term in
+_BRACKETT_B = 4.015292  # _brackett_term
+
+# diameter of the tree that small-tree tarif numbers are adjusted from in the
+# MacLean and Berger (1976) equations, in inches
+_TMP_DBH = 6.0
+
+# upper bounds of the diameter classes (inches) that FVS default form factors
+# are assigned by in the Pillsbury and Kirkley (1984) equations
+_FF_DBH_BREAKS = np.array([11, 21, 31, 41])
+
+# weight that interpolates the form factor at 9 ft between 100 at breast
+# height (4.5 ft) and the form factor at 16 ft, divided by 100 so that it
+# converts the form factor from percent at the same time
+_FF_9FT_WEIGHT = (9 - 4.5) / (16 - 4.5) / 100.0
+
+
+def _as_float_array(x):
+    """Converts input to an array of at least one dimension, with a floating
+    point dtype. Arrays that are already floating point (e.g., float32) keep
+    their dtype.
+    """
+    x = np.atleast_1d(x)
+    if not np.issubdtype(x.dtype, np.floating):
+        x = x.astype(float)
+    return x
+
+
+def _brackett_term(dbh, ba):
+    """Denominator shared by the Brackett (1977) tarif, CVTS, and CVT
+    equations.
+
+    Parameters
+    ----------
+    dbh : numeric or array of numerics
+      diameter at breast height, in inches
+    ba : numeric or array of numerics
+      basal area of the tree, in square feet
+    """
+    return _tarif_denominator(dbh / 10.0, ba)
+
+
+def _tarif_denominator(x, ba):
+    """Evaluates 1.033 * (1 + _BRACKETT_A * exp(-_BRACKETT_B * x))
+    * (ba + _BA_4IN) - _BA_4IN_X2 in place, without allocating a temporary
+    array for each operation. The tarif equations use x = dbh, while
+    _brackett_term uses x = dbh / 10.
+
+    Parameters
+    ----------
+    x : array of numerics
+      dbh, in inches, or dbh / 10
+    ba : numeric or array of numerics
+      basal area of the tree, in square feet
+    """
+    term = np.exp(-_BRACKETT_B * x)
+    term *= _BRACKETT_A
+    term += 1.0
+    term *= 1.033
+    term *= ba + _BA_4IN
+    term -= _BA_4IN_X2
+    return term
+
+
+def _butt_shape(dbh):
+    """Ratio of cubic volume above stump to total cubic volume (RTS).
+
+    Parameters
+    ----------
+    dbh : numeric or array of numerics
+      diameter at breast height, in inches
+    """
+    return 0.9679 - 0.1051 * np.exp(_LOG_0_5523 * (dbh - 1.5))
+
+
+def _power_volume(coefs, dbh, ht):
+    """Evaluates a volume equation of the form a * dbh**b * ht**c as
+    a * exp(b*ln(dbh) + c*ln(ht)), which needs two logarithms and one
+    exponential instead of two calls to np.power.
+
+    Parameters
+    ----------
+    coefs : tuple
+      the coefficients (a, b, c)
+    dbh : numeric or array of numerics
+      diameter at breast height, in inches
+    ht : numeric or array of numerics
+      total height, in feet
+    """
+    a, b, c = coefs
+    return a * np.exp(b * np.log(dbh) + c * np.log(ht))
+
+
+def _rc8(dbh):
+    """Ratio of 8-inch top sawlog volume to 4-inch top cubic volume (RC8) of
+    a hardwood tree.
+
+    Parameters
+    ----------
+    dbh : numeric or array of numerics
+      diameter at breast height, in inches
+    """
+    return 0.983 - 0.983 * np.exp(_LOG_0_65 * (dbh - 8.6))
+
+
+def _tarif_from_cv8(cv8, dbh):
+    """Tarif number derived from the sawlog volume (CV8) of a hardwood tree.
+    Trees whose denominator is zero (e.g., dbh of 4 or 8.6 inches) get a
+    tarif number of 0.01, as in the scalar equations.
+
+    Parameters
+    ----------
+    cv8 : array of numerics
+      cubic foot volume, sawlog (8-inch top)
+    dbh : array of numerics
+      diameter at breast height, in inches
+    """
+    denom = _rc8(dbh) * (_BA_COEF * (dbh**2) - _BA_4IN)
+    tarif = np.full_like(denom, 0.01)
+    np.divide(cv8 * _TARIF_COEF, denom, out=tarif, where=denom != 0)
+    return tarif
+
+
+def _diam_9ft_ratio(dbh, form_factors):
+    """Ratio of the diameter at 9 feet to DBH, interpolated from the FVS
+    default form factor for the diameter class of each tree.
+
+    The ratio is evaluated once per diameter class and then looked up, rather
+    than recomputed from the form factor for every tree.
+
+    Parameters
+    ----------
+    dbh : numeric or array of numerics
+      diameter at breast height, in inches
+    form_factors : tuple
+      form factors for the diameter classes bounded by _FF_DBH_BREAKS,
+      smallest class first
+    """
+    ff = np.asarray(form_factors, dtype=float)
+    ratios = 1.0 + (ff - 100) * _FF_9FT_WEIGHT
+    idx = np.searchsorted(_FF_DBH_BREAKS, dbh, side='right')
+    return ratios[idx]
+
+
+def _form_class_factor(dbh, ht, form_factors, fc_factor):
+    """FC**k term of the Pillsbury (1984) sawlog (CV8) equations.
+
+    FC is 10 when a tree is at least 9 feet tall and its diameter at 9 feet
+    is at least 9 inches, and 1 otherwise, so FC**k is either 10**k or 1.
+
+    Parameters
+    ----------
+    dbh : numeric or array of numerics
+      diameter at breast height, in inches
+    ht : numeric or array of numerics
+      total tree height, in feet
+    form_factors : tuple
+      form factors for the diameter classes bounded by _FF_DBH_BREAKS,
+      smallest class first
+    fc_factor : float
+      10**k, the FC**k term of a tree with FC = 10
+    """
+    diam_9ft = dbh * _diam_9ft_ratio(dbh, form_factors)
+    return np.where((diam_9ft >= 9) & (ht >= 9), fc_factor, 1.0)
+
+
+# name of the VolumeEquation method that calculates each volume metric
+_METRIC_METHODS = {
+    'CVTS': 'calc_cvts', 'TARIF': 'calc_tarif', 'CVT': 'calc_cvt',
+    'CV4': 'calc_cv4', 'CV6': 'calc_cv6', 'CV8': 'calc_cv8',
+    'SV616': 'calc_sv616', 'SV816': 'calc_sv816', 'SV632': 'calc_sv632',
+    'XINT6': 'calc_xint6', 'XINT8': 'calc_xint8'
+}
+
 
 class VolumeEquation(object):
     """A generic template for tree volume equations. Specific volume equations
     should be implemented as child classes, and have any formulas defined as
     methods for that class.
+
+    Child classes whose equations cap tree height set `max_ht`, in feet.
     """
+    max_ht = None
 
     # TARIF NUMBER
     def calc_tarif(self, dbh, ht):
@@ -195,77 +395,61 @@ class VolumeEquation(object):
         XINT8   International 1/4-inch boardfoot volume to 8-inch top with
                 16-foot logs
         ======  ============
+
+        Floating point inputs keep their dtype, so float32 arrays can be used
+        to halve memory use for very large sets of trees. Cubic volumes
+        calculated in float32 stay within 0.1% of float64 results, but
+        boardfoot volumes can differ by a few percent.
         """
-        AVAILABLE_METRICS = [
-            'CVTS', 'TARIF', 'CVT', 'CV4', 'CV6', 'CV8', 'SV616', 'SV816',
-            'SV632', 'XINT6', 'XINT8'
-        ]
         metric = metric.upper()
-        if metric not in AVAILABLE_METRICS:
+        if metric not in _METRIC_METHODS:
             raise ValueError(
                 "Unrecognized metric provided. Must be one of: {}".format(
-                    ', '.join(AVAILABLE_METRICS)))
-
-        dbh = np.atleast_1d(dbh)
-        ht = np.atleast_1d(ht)
-
-        if metric == 'CVTS':
-            return self.calc_cvts(dbh, ht)
-        elif metric == 'TARIF':
-            return self.calc_tarif(dbh, ht)
-        elif metric == 'CVT':
-            return self.calc_cvt(dbh, ht)
-        elif metric == 'CV4':
-            return self.calc_cv4(dbh, ht)
-        elif metric == 'CV6':
-            return self.calc_cv6(dbh, ht)
-        elif metric == 'CV8':
-            return self.calc_cv8(dbh, ht)
-        elif metric == 'SV616':
-            return self.calc_sv616(dbh, ht)
-        elif metric == 'SV816':
-            return self.calc_sv816(dbh, ht)
-        elif metric == 'SV632':
-            return self.calc_sv632(dbh, ht)
-        elif metric == 'XINT6':
-            return self.calc_xint6(dbh, ht)
-        elif metric == 'XINT8':
-            return self.calc_xint8(dbh, ht)
+                    ', '.join(_METRIC_METHODS)))
+
+        dbh = _as_float_array(dbh)
+        ht = _as_float_array(ht)
+        if self.max_ht is not None:
+            ht = np.minimum(ht, self.max_ht)
+
+        return getattr(self, _METRIC_METHODS[metric])(dbh, ht)
 
 
 class SoftwoodVolumeEquation(VolumeEquation):
     def calc_cv6(self, dbh, ht):
-        rc6 = 0.993 - (0.993 * 0.62**(dbh - 6.0))
+        rc6 = 0.993 - (0.993 * np.exp(_LOG_0_62 * (dbh - 6.0)))
         cv4 = self.calc_cv4(dbh, ht)
 
-        cv6 = np.where((rc6 * cv4) > cv4, cv4, rc6 * cv4)
+        cv6 = np.minimum(rc6 * cv4, cv4)
         cv6[np.logical_or(dbh < 9, ht <= 0)] = 0
 
         return cv6
 
-    def calc_sv616(self, dbh, ht):
+    def calc_sv616(self, dbh, ht, tarif=None):
         cv6 = self.calc_cv6(dbh, ht)
-        tarif = self.calc_tarif(dbh, ht)
-        tarif = np.clip(tarif, 0.01, None)
-
-        b4 = tarif / 0.912733
-        rs616l = 0.174439 + 0.117594 * np.log10(dbh) * np.log10(
-            b4) - 8.210585 / dbh**2 + 0.236693 * np.log10(b4) - 0.00001345 * (
+        if tarif is None:
+            tarif = self.calc_tarif(dbh, ht)
+        tarif = np.maximum(tarif, 0.01)
+
+        b4 = tarif * _INV_TARIF_COEF
+        log_b4 = np.log10(b4)
+        rs616l = 0.174439 + 0.117594 * np.log10(dbh) * log_b4 - 8.210585 / (
+            dbh**2) + 0.236693 * log_b4 - 0.00001345 * (
                 b4**2) - 0.00001937 * dbh**2
-        rs616 = 10.0**rs616l
+        rs616 = np.exp(_LN10 * rs616l)
 
-        sv616 = np.clip(rs616 * cv6, 0, None)
+        sv616 = np.maximum(rs616 * cv6, 0)
         sv616[np.logical_or(dbh < 9, ht <= 0)] = 0
 
         return sv616
 
     def calc_sv632(self, dbh, ht):
         tarif = self.calc_tarif(dbh, ht)
-        tarif = np.clip(tarif, 0.01, None)
-        sv616 = self.calc_sv616(dbh, ht)
+        sv616 = self.calc_sv616(dbh, ht, tarif=tarif)
+        tarif = np.maximum(tarif, 0.01)
 
         rs632 = 1.001491 - 6.924097 / tarif + 0.00001351 * dbh**2
-        sv632 = np.clip(rs632 * sv616, 0, None)
+        sv632 = np.maximum(rs632 * sv616, 0)
         sv632[np.logical_or(dbh < 9, ht <= 0)] = 0
 
         return sv632
@@ -277,7 +461,7 @@ class SoftwoodVolumeEquation(VolumeEquation):
         ri6 = -2.904154 + 3.466328 * np.log10(
             dbh * tarif
         ) - 0.02765985 * dbh - 0.00008205 * tarif**2 + 11.29598 / dbh**2
-        xint6 = np.clip(ri6 * cv6, 0, None)
+        xint6 = np.maximum(ri6 * cv6, 0)
         xint6[np.logical_or(dbh < 9, ht <= 0)] = 0
 
         return xint6
@@ -295,8 +479,8 @@ class HardwoodVolumeEquation(VolumeEquation):
     def calc_cv6(self, dbh, ht):
         cv4x = self.calc_cv4x(dbh, ht)
 
-        rc6 = 0.993 - 0.993 * 0.62**(dbh - 6.0)
-        cv6 = np.clip(rc6 * cv4x, 0, None)
+        rc6 = 0.993 - 0.993 * np.exp(_LOG_0_62 * (dbh - 6.0))
+        cv6 = np.maximum(rc6 * cv4x, 0)
         cv6[np.logical_or(dbh < 9, ht <= 0)] = 0
 
         return cv6
@@ -304,13 +488,13 @@ class HardwoodVolumeEquation(VolumeEquation):
     def calc_sv616(self, dbh, ht):
         tarifx = self.calc_tarifx(dbh, ht)
         cv6 = self.calc_cv6(dbh, ht)
-        b4 = tarifx / 0.912733
+        b4 = tarifx * _INV_TARIF_COEF
+        log_b4 = np.log10(b4)
 
-        rs616l = 0.174439 + 0.117594 * np.log10(
-            b4) - 8.210585 / dbh**2 + 0.236693 * np.log10(
-                b4) - 0.00001345 * b4**2 - 0.00001937 * dbh**2
-        rs616 = 10.0**rs616l
-        sv616 = np.clip(rs616 * cv6, 0, None)
+        rs616l = 0.174439 + 0.117594 * log_b4 - 8.210585 / dbh**2 + (
+            0.236693 * log_b4) - 0.00001345 * b4**2 - 0.00001937 * dbh**2
+        rs616 = np.exp(_LN10 * rs616l)
+        sv616 = np.maximum(rs616 * cv6, 0)
         sv616[np.logical_or(dbh < 9, ht <= 0)] = 0
 
         return sv616
@@ -318,8 +502,8 @@ class HardwoodVolumeEquation(VolumeEquation):
     def calc_sv816(self, dbh, ht):
         sv616 = self.calc_sv616(dbh, ht)
 
-        rs816 = 0.990 - 0.58 * (0.484**(dbh - 9.5))
-        sv816 = np.clip(rs816 * sv616, 0, None)
+        rs816 = 0.990 - 0.58 * np.exp(_LOG_0_484 * (dbh - 9.5))
+        sv816 = np.maximum(rs816 * sv616, 0)
         sv816[np.logical_or(dbh < 11, ht <= 0)] = 0
 
         return sv816
@@ -331,7 +515,7 @@ class HardwoodVolumeEquation(VolumeEquation):
         ri6 = -2.904154 + 3.466328 * np.log10(
             dbh * tarifx
         ) - 0.02765985 * dbh - 0.00008205 * tarifx**2 + 11.29598 / dbh**2
-        xint6 = np.clip(ri6 * cv6, 0, None)
+        xint6 = np.maximum(ri6 * cv6, 0)
         xint6[np.logical_or(dbh < 9, ht <= 0)] = 0
 
         return xint6
@@ -339,8 +523,8 @@ class HardwoodVolumeEquation(VolumeEquation):
     def calc_xint8(self, dbh, ht):
         xint6 = self.calc_xint6(dbh, ht)
 
-        ri8 = 0.990 - 0.55 * (0.485**(dbh - 9.5))
-        xint8 = np.clip(xint6 * ri8, 0, None)
+        ri8 = 0.990 - 0.55 * np.exp(_LOG_0_485 * (dbh - 9.5))
+        xint8 = np.maximum(xint6 * ri8, 0)
         xint8[np.logical_or(dbh < 11, ht <= 0)] = 0
 
         return xint8
@@ -349,18 +533,13 @@ class HardwoodVolumeEquation(VolumeEquation):
 class HardwoodVolumeEquation_NoX(HardwoodVolumeEquation):
     def calc_cv4x(self, dbh, ht):
         cvt = self.calc_cvt(dbh, ht)
-        cv4x = cvt * (0.99875 - 43.336 / dbh**3 - 124.717 / dbh**4
-                      + 0.193437 * ht / dbh**3 + 479.83 / (dbh**3 * ht))
+        dbh3 = dbh * dbh * dbh
+        cv4x = cvt * (0.99875 - 43.336 / dbh3 - 124.717 / (dbh3 * dbh)
+                      + 0.193437 * ht / dbh3 + 479.83 / (dbh3 * ht))
         return cv4x
 
     def calc_tarifx(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        cv8 = self.calc_cv8(dbh, ht)
-
-        tarifx = cv8 * 0.912733 / (0.983 - 0.983 * 0.65**(dbh - 8.6) * ba
-                                   - 0.087266)
-
-        return tarifx
+        return _tarif_from_cv8(self.calc_cv8(dbh, ht), dbh)
 
 
 class HardwoodVolumeEquation_WithX(HardwoodVolumeEquation):
@@ -371,550 +550,442 @@ class HardwoodVolumeEquation_WithX(HardwoodVolumeEquation):
         return self.calc_tarif(dbh, ht)
 
 
-class Eq_1(SoftwoodVolumeEquation):
-    """Douglas-fir (WEYERHAUSER-DNR RPT #24, 1977)
-
-    Brackett, M. 1973. Notes on tarif tree volume computation. Res. Management
-    Report 24. WA Dept. of Nat. Resources. Olympia. 26p.
+class TarifVolumeEquation(SoftwoodVolumeEquation):
+    """Softwood volume equations that estimate CVTS directly and derive the
+    tarif number, CV4 and CVT from it.
 
-    Brackett, Michael. 1977. Notes on tarif tree-volume computation. DNR
-    report #24. State of Washington, Department of Natural Resources, Olympia,
-    WA. 132p.
+    Child classes implement `calc_cvts`.
     """
 
-    def calc_cvts(self, dbh, ht):
-        cvtsl = -3.21809 + 0.04948 * np.log10(ht) * np.log10(dbh) - 0.15664 * (
-            np.log10(dbh))**2 + 2.02132 * np.log10(dbh) + 1.63408 * np.log10(
-                ht) - 0.16185 * (np.log10(ht))**2
-
-        cvts = 10**cvtsl
-        cvts[np.logical_or(dbh < 1, ht <= 0)] = 0
-
-        return cvts
-
     def calc_tarif(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
+        ba = _BA_COEF * (dbh**2)
         cvts = self.calc_cvts(dbh, ht)
 
-        tarif = (cvts * 0.912733) / (
-            (1.033 * (1.0 + 1.382937 * np.exp(-4.105292 * (dbh / 10.0))))
-            * (ba + 0.087266) - 0.174533)
+        tarif = cvts * _TARIF_COEF
+        tarif /= _tarif_denominator(dbh, ba)
         tarif[np.logical_or(dbh <= 0, ht <= 0)] = 0
 
         return tarif
 
     def calc_cv4(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
+        ba = _BA_COEF * (dbh**2)
         tarif = self.calc_tarif(dbh, ht)
 
-        cv4 = tarif * (ba - 0.087266) / 0.912733
+        cv4 = tarif * (ba - _BA_4IN) * _INV_TARIF_COEF
         cv4[np.logical_or(dbh < 5, ht <= 0)] = 0
 
         return cv4
 
     def calc_cvt(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
+        ba = _BA_COEF * (dbh**2)
         tarif = self.calc_tarif(dbh, ht)
 
-        cvt = tarif * (0.9679 - 0.1051 * 0.5523**(dbh - 1.5)) * (
-            (1.033 * (1.0 + 1.382937 * np.exp(-4.015292 * (dbh / 10.0))))
-            * (ba + 0.087266) - 0.174533) / 0.912733
+        cvt = tarif * _butt_shape(dbh)
+        cvt *= _brackett_term(dbh, ba)
+        cvt *= _INV_TARIF_COEF
         cvt[np.logical_or(dbh < 1, ht <= 0)] = 0
 
         return cvt
 
 
-class Eq_2(SoftwoodVolumeEquation):
-    """Douglas-fir (DNR MEMO--SUMMERFIELD, 11/7/80)
+class BrackettVolumeEquation(TarifVolumeEquation):
+    """Softwood volume equations following Brackett (1977), in which the
+    base-10 logarithm of CVTS is a linear function of log10(dbh), log10(ht)
+    and, for some species, dbh.
 
-    Summerfield, Edward. 1980. In-house memo describing equations for
-    Douglas-fir and ponderosa pine. State of Washington, Department of Natural
-    Resources. On file with the PNW Research Station.
+    Child classes set `cvts_coefs` to the coefficients (a, b, c, d) of:
+    log10(CVTS) = a + b*log10(dbh) + c*log10(ht) + d*dbh
     """
+    cvts_coefs = None
 
     def calc_cvts(self, dbh, ht):
-        cvtsl = -6.110493 + 1.81306 * np.log(dbh) + 1.083884 * np.log(ht)
-
-        cvts = np.exp(cvtsl)
+        a, b, c, d = self.cvts_coefs
+        # 10**(a + b*log10(dbh) + ...) is evaluated as
+        # exp(a*ln(10) + b*ln(dbh) + ...), which needs no base conversion
+        cvts_ln = _LN10 * a + b * np.log(dbh) + c * np.log(ht)
+        if d:
+            cvts_ln = cvts_ln + (_LN10 * d) * dbh
+
+        cvts = np.exp(cvts_ln)
         cvts[np.logical_or(dbh < 1, ht <= 0)] = 0
 
         return cvts
 
-    def calc_tarif(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        cvts = self.calc_cvts(dbh, ht)
-
-        tarif = (cvts * 0.912733) / (
-            (1.033 * (1.0 + 1.382937 * np.exp(-4.105292 * (dbh / 10.0))))
-            * (ba + 0.087266) - 0.174533)
-        tarif[np.logical_or(dbh <= 0, ht <= 0)] = 0
-
-        return tarif
-
-    def calc_cv4(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        tarif = self.calc_tarif(dbh, ht)
 
-        cv4 = tarif * (ba - 0.087266) / 0.912733
-        cv4[np.logical_or(dbh < 5, ht <= 0)] = 0
+class MacLeanVolumeEquation(SoftwoodVolumeEquation):
+    """Softwood volume equations following MacLean and Berger (1976), in
+    which CV4 is estimated from a cubic form factor (CF4). Tarif numbers for
+    trees smaller than 6 inches DBH are adjusted from those of a 6-inch tree
+    of the same height.
 
-        return cv4
+    Child classes implement `calc_cf4`.
+    """
 
-    def calc_cvt(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        tarif = self.calc_tarif(dbh, ht)
+    def calc_cf4(self, dbh, ht):
+        """Cubic form factor, bounded as the equation specifies (usually
+        between 0.3 and 0.4).
 
-        cvt = tarif * (0.9679 - 0.1051 * 0.5523**(dbh - 1.5)) * (
-            (1.033 * (1.0 + 1.382937 * np.exp(-4.015292 * (dbh / 10.0))))
-            * (ba + 0.087266) - 0.174533) / 0.912733
-        cvt[np.logical_or(dbh < 1, ht <= 0)] = 0
+        Parameters
+        ----------
+        dbh : numeric or array of numerics
+          diameter at breast height, in inches
+        ht : numeric or array of numerics
+          total tree height, in feet
+        """
+        raise NotImplementedError(
+            'This calculation is not implemented for this species.')
 
-        return cvt
+    def _tarif_from_cv4(self, dbh, ht, ba, cv4):
+        # both tarif numbers are calculated for all trees, and the one that
+        # applies is picked for each tree based on its diameter
+        tarif = (cv4 * _TARIF_COEF) / (ba - _BA_4IN)
 
+        ba_tmp = _BA_COEF * (_TMP_DBH**2)
+        cv4_tmp = self.calc_cf4(_TMP_DBH, ht) * ba_tmp * ht
+        tarif_tmp = np.clip((cv4_tmp * _TARIF_COEF) / (ba_tmp - _BA_4IN), 0.01,
+                            None)
+        dbh_diff_sq = (_TMP_DBH - dbh)**2
+        tarif_small = tarif_tmp * (0.5 * dbh_diff_sq +
+                                   (1.0 + 0.063 * dbh_diff_sq))
 
-class Eq_3(SoftwoodVolumeEquation):
-    """Douglas-fir (USDA-FS RES NOTE PNW-266)
+        tarif = np.clip(np.where(dbh < _TMP_DBH, tarif_small, tarif), 0.01,
+                        None)
+        tarif[np.logical_or(dbh <= 0, ht <= 0)] = 0
 
-    MacLean, Colin and John M. Berger. 1976. Softwood tree-volume equations
-    for major California species. PNW Research Note, PNW-266. Pacific Northwest
-    Forest and Range Experiment Station, Portland Oregon. 34p.
-    """
+        return tarif
 
     def calc_cvts(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        term = ((1.033 * (1.0 + 1.382937 * np.exp(-4.015292 * (dbh / 10.0))))
-                * (ba + 0.087266) - 0.174533)
-        tarif = self.calc_tarif(dbh, ht)
-        cv4 = self.calc_cv4(dbh, ht)
-
-        cvts = np.where(dbh < 6.0, tarif * term,
-                        (cv4 * term) / (ba - 0.087266))
+        # CF4 is evaluated once and shared by the CV4 and tarif branches
+        ba = _BA_COEF * (dbh**2)
+        term = _brackett_term(dbh, ba)
+        cv4 = self.calc_cf4(dbh, ht) * ba * ht
+        tarif = self._tarif_from_cv4(dbh, ht, ba, cv4)
+
+        cvts = np.where(dbh < _TMP_DBH, tarif * term,
+                        (cv4 * term) / (ba - _BA_4IN))
         cvts[np.logical_or(dbh < 1, ht <= 0)] = 0
 
         return cvts
 
     def calc_tarif(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        dbh_tmp = np.full(np.asanyarray(dbh).shape,
-                          fill_value=6.0,
-                          dtype=float)
-        ba_tmp = 0.005454154 * (dbh_tmp**2)
-
-        cf4 = 0.248569 + 0.0253524 * (ht / dbh) - 0.0000560175 * (ht**2 / dbh)
-        cf4 = np.clip(cf4, 0.3, 0.4)
-
-        cf4_tmp = 0.248569 + 0.0253524 * (ht / dbh_tmp) - 0.0000560175 * (
-            ht**2 / dbh_tmp)
-        cf4_tmp = np.clip(cf4_tmp, 0.3, 0.4)
-
-        cv4 = self.calc_cv4(dbh, ht)
-        cv4_tmp = self.calc_cv4(dbh_tmp, ht)
+        ba = _BA_COEF * (dbh**2)
+        cv4 = self.calc_cf4(dbh, ht) * ba * ht
 
-        tarif_tmp = np.clip((cv4_tmp * 0.912733) / (ba_tmp - 0.087266), 0.01,
-                            None)
-
-        tarif = np.where(
-            dbh < 6.0,
-            tarif_tmp * (0.5 * (dbh_tmp - dbh)**2 + (1.0 + 0.063
-                                                     * (dbh_tmp - dbh)**2)),
-            (cv4 * 0.912733) / (ba - 0.087266))
-        tarif = np.clip(tarif, 0.01, None)
-        tarif[np.logical_or(dbh <= 0, ht <= 0)] = 0
-
-        return tarif
+        return self._tarif_from_cv4(dbh, ht, ba, cv4)
 
     def calc_cv4(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-
-        cf4 = 0.248569 + 0.0253524 * (ht / dbh) - 0.0000560175 * (ht**2 / dbh)
-        cf4 = np.clip(cf4, 0.3, 0.4)
+        ba = _BA_COEF * (dbh**2)
 
-        cv4 = cf4 * ba * ht
-        cv4 = np.where(dbh < 5.0, 0, cv4)
+        cv4 = self.calc_cf4(dbh, ht) * ba * ht
         cv4[np.logical_or(dbh < 5, ht <= 0)] = 0
 
         return cv4
 
     def calc_cvt(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        term = ((1.033 * (1.0 + 1.382937 * np.exp(-4.015292 * (dbh / 10.0))))
-                * (ba + 0.087266) - 0.174533)
+        ba = _BA_COEF * (dbh**2)
         tarif = self.calc_tarif(dbh, ht)
 
-        cvt = tarif * (0.9679 - 0.1051 * 0.5523**(dbh - 1.5)) * term / 0.912733
+        cvt = tarif * _butt_shape(dbh)
+        cvt *= _brackett_term(dbh, ba)
+        cvt *= _INV_TARIF_COEF
         cvt[np.logical_or(dbh < 1, ht <= 0)] = 0
 
         return cvt
 
 
-class Eq_4(SoftwoodVolumeEquation):
-    """Ponderosa pine (DNR MEMO--SUMMERFIELD,11/7/80)
+class HardwoodTarifVolumeEquation(HardwoodVolumeEquation_NoX):
+    """Hardwood volume equations that estimate CVTS directly and derive the
+    tarif number, CV4, CVT and CV8 from it, in the same way as
+    `TarifVolumeEquation`.
 
-    Summerfield, Edward. 1980. In-house memo describing equations for
-    Douglas-fir and ponderosa pine. State of Washington, Department of Natural
-    Resources. On file with the PNW Research Station.
+    Child classes implement `calc_cvts`.
     """
+    calc_tarif = TarifVolumeEquation.calc_tarif
+    calc_cv4 = TarifVolumeEquation.calc_cv4
+    calc_cvt = TarifVolumeEquation.calc_cvt
 
-    def calc_cvts(self, dbh, ht):
-        # ba = 0.005454154 * (dbh**2)
-
-        cvtsl = -8.521558 + 1.977243 * np.log(dbh) - 0.105288 * (
-            np.log(ht))**2 + 136.0489 / ht**2 + 1.99546 * np.log(ht)
-        cvts = np.exp(cvtsl)
-        cvts[np.logical_or(dbh < 1, ht <= 0)] = 0
-
-        return cvts
-
-    def calc_tarif(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-
-        cvts = self.calc_cvts(dbh, ht)
-        tarif = (cvts * 0.912733) / (
-            (1.033 * (1.0 + 1.382937 * np.exp(-4.015292 * dbh)))
-            * (ba + 0.087266) - 0.174533)
-        tarif[np.logical_or(dbh <= 0, ht <= 0)] = 0
-
-        return tarif
-
-    def calc_cv4(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-
-        tarif = self.calc_tarif(dbh, ht)
-        cv4 = tarif * (ba - 0.087266) / 0.912733
-        cv4[np.logical_or(dbh < 5, ht <= 0)] = 0
-
-        return cv4
-
-    def calc_cvt(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
+    def calc_cv8(self, dbh, ht):
+        cv4 = self.calc_cv4(dbh, ht)
+        rc8 = _rc8(dbh)
 
-        tarif = self.calc_tarif(dbh, ht)
-        cvt = tarif * (0.9679 - 0.1051 * 0.5523**(dbh - 1.5)) * (
-            (1.033 * (1.0 + 1.382937 * np.exp(-4.015292 * (dbh / 10.0))))
-            * (ba + 0.087266) - 0.174533) / 0.912733
-        cvt[np.logical_or(dbh < 1, ht <= 0)] = 0
+        cv8 = rc8 * cv4
+        cv8[np.logical_or(dbh < 11, ht <= 0)] = 0
 
-        return cvt
+        return cv8
 
 
-class Eq_5(SoftwoodVolumeEquation):
-    """Ponderosa pine (USDA-FS RES NOTE PNW-266)
+class BrackettHardwoodVolumeEquation(HardwoodTarifVolumeEquation):
+    """Hardwood volume equations following Brackett (1977), with CVTS
+    calculated as in `BrackettVolumeEquation`.
 
-    MacLean, Colin and John M. Berger. 1976. Softwood tree-volume equations for
-    major California species. PNW Research Note, PNW-266. Pacific Northwest
-    Forest and Range Experiment Station, Portland Oregon. 34p.
+    Child classes set `cvts_coefs` to the coefficients (a, b, c, d) of:
+    log10(CVTS) = a + b*log10(dbh) + c*log10(ht) + d*dbh
     """
+    cvts_coefs = None
+    calc_cvts = BrackettVolumeEquation.calc_cvts
 
-    def calc_cvts(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        term = ((1.033 * (1.0 + 1.382937 * np.exp(-4.015292 * (dbh / 10.0))))
-                * (ba + 0.087266) - 0.174533)
-        cv4 = self.calc_cv4(dbh, ht)
-        tarif = self.calc_tarif(dbh, ht)
 
-        cvts = np.where(dbh >= 6.0, (cv4 * term) / (ba - 0.087266),
-                        tarif * term)
-        cvts[np.logical_or(dbh < 1, ht <= 0)] = 0
+class PillsburyVolumeEquation(HardwoodVolumeEquation_WithX):
+    """Hardwood volume equations following Pillsbury and Kirkley (1984),
+    which estimate CVTS, CV4 and CV8 directly. CVT is taken as the share of
+    CVTS above the stump, and the tarif number is derived from CV8.
 
-        return cvts
+    Child classes implement `calc_cvts`, `calc_cv4` and `calc_cv8`.
+    """
 
     def calc_cvt(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        term = ((1.033 * (1.0 + 1.382937 * np.exp(-4.015292 * (dbh / 10.0))))
-                * (ba + 0.087266) - 0.174533)
-        tarif = self.calc_tarif(dbh, ht)
-
-        cvt = tarif * (0.9679 - 0.1051 * 0.5523**(dbh - 1.5)) * term / 0.912733
+        cvt = self.calc_cvts(dbh, ht) * _butt_shape(dbh)
         cvt[np.logical_or(dbh < 1, ht <= 0)] = 0
 
         return cvt
 
     def calc_tarif(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        dbh_tmp = np.full(np.asanyarray(dbh).shape,
-                          fill_value=6.0,
-                          dtype=float)
-        ba_tmp = 0.005454154 * (dbh_tmp**2)
-
-        cf4 = np.clip(0.402060 - 0.899914 * (1 / dbh), 0.3, 0.4)
-        cv4 = cf4 * ba * ht
-        cf4_tmp = np.clip(0.402060 - 0.899914 * (1 / dbh_tmp), 0.3, 0.4)
-        cv4_tmp = cf4_tmp * ba_tmp * ht
-
-        tarif_tmp = np.clip((cv4_tmp * 0.912733) / (ba_tmp - 0.087266), 0.01,
-                            None)
-
-        tarif = np.where(
-            dbh < 6.0,
-            tarif_tmp * (0.5 * (dbh_tmp - dbh)**2 + (1.0 + 0.063
-                                                     * (dbh_tmp - dbh)**2)),
-            (cv4 * 0.912733) / (ba - 0.087266))
-        tarif = np.clip(tarif, 0.01, None)
+        tarif = _tarif_from_cv8(self.calc_cv8(dbh, ht), dbh)
         tarif[np.logical_or(dbh <= 0, ht <= 0)] = 0
-
         return tarif
 
-    def calc_cv4(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        cf4 = np.clip(0.402060 - 0.899914 * (1 / dbh), 0.3, 0.4)
-
-        cv4 = np.where(dbh >= 5.0, cf4 * ba * ht, 0)
-        cv4[np.logical_or(dbh < 5, ht <= 0)] = 0
-
-        return cv4
 
+class Eq_1(SoftwoodVolumeEquation):
+    """Douglas-fir (WEYERHAUSER-DNR RPT #24, 1977)
 
-class Eq_6(SoftwoodVolumeEquation):
-    """Western hemlock (DNR NOTE 27,4/79)
+    Brackett, M. 1973. Notes on tarif tree volume computation. Res. Management
+    Report 24. WA Dept. of Nat. Resources. Olympia. 26p.
 
-    Chambers, C.J. and Foltz, B. 1979. The tarif system -- revisions and
-    additions., Resource Management Report #27. WA Dept. of Nat. Resources.
-    Olympia.
+    Brackett, Michael. 1977. Notes on tarif tree-volume computation. DNR
+    report #24. State of Washington, Department of Natural Resources, Olympia,
+    WA. 132p.
     """
 
     def calc_cvts(self, dbh, ht):
-        cvtsl = -2.72170 + 2.00857 * np.log10(dbh) + 1.08620 * np.log10(
-            ht) - 0.00568 * dbh
+        log_dbh = np.log10(dbh)
+        log_ht = np.log10(ht)
+        cvtsl = (-3.21809 + 0.04948 * log_ht * log_dbh - 0.15664 * log_dbh**2
+                 + 2.02132 * log_dbh + 1.63408 * log_ht - 0.16185 * log_ht**2)
 
-        cvts = 10**cvtsl
+        cvts = np.exp(_LN10 * cvtsl)
         cvts[np.logical_or(dbh < 1, ht <= 0)] = 0
 
         return cvts
 
     def calc_tarif(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
+        ba = _BA_COEF * (dbh**2)
         cvts = self.calc_cvts(dbh, ht)
 
-        tarif = (cvts * 0.912733) / (
-            (1.033 * (1.0 + 1.382937 * np.exp(-4.015292 * dbh)))
-            * (ba + 0.087266) - 0.174533)
-
+        tarif = (cvts * _TARIF_COEF) / (
+            (1.033 * (1.0 + _BRACKETT_A * np.exp(-4.105292 * (dbh / 10.0))))
+            * (ba + _BA_4IN) - _BA_4IN_X2)
         tarif[np.logical_or(dbh <= 0, ht <= 0)] = 0
 
         return tarif
 
     def calc_cv4(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
+        ba = _BA_COEF * (dbh**2)
         tarif = self.calc_tarif(dbh, ht)
 
-        cv4 = tarif * (ba - 0.087266) / 0.912733
+        cv4 = tarif * (ba - _BA_4IN) * _INV_TARIF_COEF
         cv4[np.logical_or(dbh < 5, ht <= 0)] = 0
 
         return cv4
 
     def calc_cvt(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
+        ba = _BA_COEF * (dbh**2)
         tarif = self.calc_tarif(dbh, ht)
 
-        cvt = tarif * (0.9679 - 0.1051 * 0.5523**(dbh - 1.5)) * (
-            (1.033 * (1.0 + 1.382937 * np.exp(-4.015292 * (dbh / 10.0))))
-            * (ba + 0.087266) - 0.174533) / 0.912733
+        cvt = tarif * _butt_shape(dbh)
+        cvt *= _brackett_term(dbh, ba)
+        cvt *= _INV_TARIF_COEF
         cvt[np.logical_or(dbh < 1, ht <= 0)] = 0
 
         return cvt
 
 
-class Eq_7(SoftwoodVolumeEquation):
-    """Western hemlock (BROWN (1962) BC FOREST SERV,P33)
+class Eq_2(SoftwoodVolumeEquation):
+    """Douglas-fir (DNR MEMO--SUMMERFIELD, 11/7/80)
 
-    Browne, J.E. 1962. Standard cubic-foot volume tables for the commercial
-    tree species of British Columbia. B.C. Forest Service, Victoria. 107 p.
+    Summerfield, Edward. 1980. In-house memo describing equations for
+    Douglas-fir and ponderosa pine. State of Washington, Department of Natural
+    Resources. On file with the PNW Research Station.
     """
 
     def calc_cvts(self, dbh, ht):
-        cvtsl = -2.663834 + 1.79023 * np.log10(dbh) + 1.124873 * np.log10(ht)
+        cvtsl = -6.110493 + 1.81306 * np.log(dbh) + 1.083884 * np.log(ht)
 
-        cvts = 10**cvtsl
+        cvts = np.exp(cvtsl)
         cvts[np.logical_or(dbh < 1, ht <= 0)] = 0
 
         return cvts
 
     def calc_tarif(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
+        ba = _BA_COEF * (dbh**2)
         cvts = self.calc_cvts(dbh, ht)
 
-        tarif = (cvts * 0.912733) / (
-            (1.033 * (1.0 + 1.382937 * np.exp(-4.015292 * dbh)))
-            * (ba + 0.087266) - 0.174533)
+        tarif = (cvts * _TARIF_COEF) / (
+            (1.033 * (1.0 + _BRACKETT_A * np.exp(-4.105292 * (dbh / 10.0))))
+            * (ba + _BA_4IN) - _BA_4IN_X2)
         tarif[np.logical_or(dbh <= 0, ht <= 0)] = 0
 
         return tarif
 
     def calc_cv4(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
+        ba = _BA_COEF * (dbh**2)
         tarif = self.calc_tarif(dbh, ht)
 
-        cv4 = tarif * (ba - 0.087266) / 0.912733
+        cv4 = tarif * (ba - _BA_4IN) * _INV_TARIF_COEF
         cv4[np.logical_or(dbh < 5, ht <= 0)] = 0
 
         return cv4
 
     def calc_cvt(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
+        ba = _BA_COEF * (dbh**2)
         tarif = self.calc_tarif(dbh, ht)
 
-        cvt = tarif * (0.9679 - 0.1051 * 0.5523**(dbh - 1.5)) * (
-            (1.033 * (1.0 + 1.382937 * np.exp(-4.015292 * (dbh / 10.0))))
-            * (ba + 0.087266) - 0.174533) / 0.912733
+        cvt = tarif * _butt_shape(dbh)
+        cvt *= _brackett_term(dbh, ba)
+        cvt *= _INV_TARIF_COEF
         cvt[np.logical_or(dbh < 1, ht <= 0)] = 0
 
         return cvt
 
 
-class Eq_8(SoftwoodVolumeEquation):
-    """Western redcedar (REDCEDAR INTERIOR--DNR RPT#24,1977)
+class Eq_3(MacLeanVolumeEquation):
+    """Douglas-fir (USDA-FS RES NOTE PNW-266)
 
-    Brackett, M. 1973. Notes on tarif tree volume computation. Res. Management
-    Report 24. WA Dept. of Nat. Resources. Olympia. 26p.
+    MacLean, Colin and John M. Berger. 1976. Softwood tree-volume equations
+    for major California species. PNW Research Note, PNW-266. Pacific Northwest
+    Forest and Range Experiment Station, Portland Oregon. 34p.
+    """
 
-    Brackett, Michael.  1977. Notes on tarif tree-volume computation.  DNR
-    report #24. State of Washington, Department of Natural Resources, Olympia,
-    WA. 132p.
+    def calc_cf4(self, dbh, ht):
+        cf4 = 0.248569 + 0.0253524 * (ht / dbh) - 0.0000560175 * (ht**2 / dbh)
+        return np.clip(cf4, 0.3, 0.4)
+
+
+class Eq_4(SoftwoodVolumeEquation):
+    """Ponderosa pine (DNR MEMO--SUMMERFIELD,11/7/80)
+
+    Summerfield, Edward. 1980. In-house memo describing equations for
+    Douglas-fir and ponderosa pine. State of Washington, Department of Natural
+    Resources. On file with the PNW Research Station.
     """
 
     def calc_cvts(self, dbh, ht):
-        cvtsl = -2.464614 + 1.701993 * np.log10(dbh) + 1.067038 * np.log10(ht)
+        # ba = 0.005454154 * (dbh**2)
 
-        cvts = 10**cvtsl
+        log_ht = np.log(ht)
+        cvtsl = (-8.521558 + 1.977243 * np.log(dbh) - 0.105288 * log_ht**2
+                 + 136.0489 / ht**2 + 1.99546 * log_ht)
+        cvts = np.exp(cvtsl)
         cvts[np.logical_or(dbh < 1, ht <= 0)] = 0
 
         return cvts
 
     def calc_tarif(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        cvts = self.calc_cvts(dbh, ht)
+        ba = _BA_COEF * (dbh**2)
 
-        tarif = (cvts * 0.912733) / (
-            (1.033 * (1.0 + 1.382937 * np.exp(-4.015292 * dbh)))
-            * (ba + 0.087266) - 0.174533)
+        cvts = self.calc_cvts(dbh, ht)
+        tarif = cvts * _TARIF_COEF
+        tarif /= _tarif_denominator(dbh, ba)
         tarif[np.logical_or(dbh <= 0, ht <= 0)] = 0
 
         return tarif
 
     def calc_cv4(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        tarif = self.calc_tarif(dbh, ht)
+        ba = _BA_COEF * (dbh**2)
 
-        cv4 = tarif * (ba - 0.087266) / 0.912733
+        tarif = self.calc_tarif(dbh, ht)
+        cv4 = tarif * (ba - _BA_4IN) * _INV_TARIF_COEF
         cv4[np.logical_or(dbh < 5, ht <= 0)] = 0
 
         return cv4
 
     def calc_cvt(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        tarif = self.calc_tarif(dbh, ht)
+        ba = _BA_COEF * (dbh**2)
 
-        cvt = tarif * (0.9679 - 0.1051 * 0.5523**(dbh - 1.5)) * (
-            (1.033 * (1.0 + 1.382937 * np.exp(-4.015292 * (dbh / 10.0))))
-            * (ba + 0.087266) - 0.174533) / 0.912733
+        tarif = self.calc_tarif(dbh, ht)
+        cvt = tarif * _butt_shape(dbh)
+        cvt *= _brackett_term(dbh, ba)
+        cvt *= _INV_TARIF_COEF
         cvt[np.logical_or(dbh < 1, ht <= 0)] = 0
 
         return cvt
 
 
-class Eq_9(SoftwoodVolumeEquation):
-    """Western redcedar (REDCEDAR COAST--DNR RPT#24,1977)
-
-    Brackett, M. 1973. Notes on tarif tree volume computation. Res. Management
-    Report 24. WA Dept. of Nat. Resources. Olympia. 26p.
+class Eq_5(MacLeanVolumeEquation):
+    """Ponderosa pine (USDA-FS RES NOTE PNW-266)
 
-    Brackett, Michael. 1977. Notes on tarif tree-volume computation. DNR
-    report #24. State of Washington, Department of Natural Resources, Olympia,
-    WA. 132p.
+    MacLean, Colin and John M. Berger. 1976. Softwood tree-volume equations for
+    major California species. PNW Research Note, PNW-266. Pacific Northwest
+    Forest and Range Experiment Station, Portland Oregon. 34p.
     """
 
-    def calc_cvts(self, dbh, ht):
-        cvtsl = -2.379642 + 1.682300 * np.log10(dbh) + 1.039712 * np.log10(ht)
-
-        cvts = 10**cvtsl
-        cvts[np.logical_or(dbh < 1, ht <= 0)] = 0
+    def calc_cf4(self, dbh, ht):
+        return np.clip(0.402060 - 0.899914 * (1 / dbh), 0.3, 0.4)
 
-        return cvts
 
-    def calc_tarif(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        cvts = self.calc_cvts(dbh, ht)
+class Eq_6(BrackettVolumeEquation):
+    """Western hemlock (DNR NOTE 27,4/79)
 
-        tarif = (cvts * 0.912733) / (
-            (1.033 * (1.0 + 1.382937 * np.exp(-4.015292 * dbh)))
-            * (ba + 0.087266) - 0.174533)
-        tarif[np.logical_or(dbh <= 0, ht <= 0)] = 0
+    Chambers, C.J. and Foltz, B. 1979. The tarif system -- revisions and
+    additions., Resource Management Report #27. WA Dept. of Nat. Resources.
+    Olympia.
+    """
 
-        return tarif
+    cvts_coefs = (-2.72170, 2.00857, 1.08620, -0.00568)
 
-    def calc_cv4(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        tarif = self.calc_tarif(dbh, ht)
 
-        cv4 = tarif * (ba - 0.087266) / 0.912733
-        cv4[np.logical_or(dbh < 5, ht <= 0)] = 0
+class Eq_7(BrackettVolumeEquation):
+    """Western hemlock (BROWN (1962) BC FOREST SERV,P33)
 
-        return cv4
+    Browne, J.E. 1962. Standard cubic-foot volume tables for the commercial
+    tree species of British Columbia. B.C. Forest Service, Victoria. 107 p.
+    """
 
-    def calc_cvt(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        tarif = self.calc_tarif(dbh, ht)
+    cvts_coefs = (-2.663834, 1.79023, 1.124873, 0)
 
-        cvt = tarif * (0.9679 - 0.1051 * 0.5523**(dbh - 1.5)) * (
-            (1.033 * (1.0 + 1.382937 * np.exp(-4.015292 * (dbh / 10.0))))
-            * (ba + 0.087266) - 0.174533) / 0.912733
-        cvt[np.logical_or(dbh < 1, ht <= 0)] = 0
 
-        return cvt
+class Eq_8(BrackettVolumeEquation):
+    """Western redcedar (REDCEDAR INTERIOR--DNR RPT#24,1977)
 
+    Brackett, M. 1973. Notes on tarif tree volume computation. Res. Management
+    Report 24. WA Dept. of Nat. Resources. Olympia. 26p.
 
-class Eq_10(SoftwoodVolumeEquation):
-    """True firs (INTERIOR baLSAM--DNR RPT#24,1977)
-
-    Brackett, M. 1973. Notes on tarif tree volume computation. Res. Management
-    Report 24. WA Dept. of Nat. Resources. Olympia. 26p.
-
-    Brackett, Michael.  1977. Notes on tarif tree-volume computation. DNR
+    Brackett, Michael.  1977. Notes on tarif tree-volume computation.  DNR
     report #24. State of Washington, Department of Natural Resources, Olympia,
     WA. 132p.
     """
 
-    def calc_cvts(self, dbh, ht):
-        cvtsl = -2.502332 + 1.864963 * np.log10(dbh) + 1.004903 * np.log10(ht)
-
-        cvts = 10**cvtsl
-        cvts[np.logical_or(dbh < 1, ht <= 0)] = 0
+    cvts_coefs = (-2.464614, 1.701993, 1.067038, 0)
 
-        return cvts
 
-    def calc_tarif(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        cvts = self.calc_cvts(dbh, ht)
+class Eq_9(BrackettVolumeEquation):
+    """Western redcedar (REDCEDAR COAST--DNR RPT#24,1977)
 
-        tarif = (cvts * 0.912733) / (
-            (1.033 * (1.0 + 1.382937 * np.exp(-4.015292 * dbh)))
-            * (ba + 0.087266) - 0.174533)
-        tarif[np.logical_or(dbh <= 0, ht <= 0)] = 0
+    Brackett, M. 1973. Notes on tarif tree volume computation. Res. Management
+    Report 24. WA Dept. of Nat. Resources. Olympia. 26p.
 
-        return tarif
+    Brackett, Michael. 1977. Notes on tarif tree-volume computation. DNR
+    report #24. State of Washington, Department of Natural Resources, Olympia,
+    WA. 132p.
+    """
 
-    def calc_cv4(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        tarif = self.calc_tarif(dbh, ht)
+    cvts_coefs = (-2.379642, 1.682300, 1.039712, 0)
 
-        cv4 = tarif * (ba - 0.087266) / 0.912733
-        cv4[np.logical_or(dbh < 5, ht <= 0)] = 0
 
-        return cv4
+class Eq_10(BrackettVolumeEquation):
+    """True firs (INTERIOR baLSAM--DNR RPT#24,1977)
 
-    def calc_cvt(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        tarif = self.calc_tarif(dbh, ht)
+    Brackett, M. 1973. Notes on tarif tree volume computation. Res. Management
+    Report 24. WA Dept. of Nat. Resources. Olympia. 26p.
 
-        cvt = tarif * (0.9679 - 0.1051 * 0.5523**(dbh - 1.5)) * (
-            (1.033 * (1.0 + 1.382937 * np.exp(-4.015292 * (dbh / 10.0))))
-            * (ba + 0.087266) - 0.174533) / 0.912733
-        cvt[np.logical_or(dbh < 1, ht <= 0)] = 0
+    Brackett, Michael.  1977. Notes on tarif tree-volume computation. DNR
+    report #24. State of Washington, Department of Natural Resources, Olympia,
+    WA. 132p.
+    """
 
-        return cvt
+    cvts_coefs = (-2.502332, 1.864963, 1.004903, 0)
 
 
-class Eq_11(SoftwoodVolumeEquation):
+class Eq_11(BrackettVolumeEquation):
     """True firs (COAST baLSAM--DNR RPT#24,1977)
 
     Brackett, M. 1973. Notes on tarif tree volume computation. Res. Management
@@ -925,47 +996,10 @@ class Eq_11(SoftwoodVolumeEquation):
     WA. 132p.
     """
 
-    def calc_cvts(self, dbh, ht):
-        cvtsl = -2.575642 + 1.806775 * np.log10(dbh) + 1.094665 * np.log10(ht)
-
-        cvts = 10**cvtsl
-        cvts[np.logical_or(dbh < 1, ht <= 0)] = 0
-
-        return cvts
-
-    def calc_tarif(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        cvts = self.calc_cvts(dbh, ht)
-
-        tarif = (cvts * 0.912733) / (
-            (1.033 * (1.0 + 1.382937 * np.exp(-4.015292 * dbh)))
-            * (ba + 0.087266) - 0.174533)
-        tarif[np.logical_or(dbh <= 0, ht <= 0)] = 0
-
-        return tarif
-
-    def calc_cv4(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        tarif = self.calc_tarif(dbh, ht)
-
-        cv4 = tarif * (ba - 0.087266) / 0.912733
-        cv4[np.logical_or(dbh < 5, ht <= 0)] = 0
-
-        return cv4
+    cvts_coefs = (-2.575642, 1.806775, 1.094665, 0)
 
-    def calc_cvt(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        tarif = self.calc_tarif(dbh, ht)
-
-        cvt = tarif * (0.9679 - 0.1051 * 0.5523**(dbh - 1.5)) * (
-            (1.033 * (1.0 + 1.382937 * np.exp(-4.015292 * (dbh / 10.0))))
-            * (ba + 0.087266) - 0.174533) / 0.912733
-        cvt[np.logical_or(dbh < 1, ht <= 0)] = 0
 
-        return cvt
-
-
-class Eq_12(SoftwoodVolumeEquation):
+class Eq_12(BrackettVolumeEquation):
     """Sitka spruce (SITKA SPRUCE INTERIOR--DNR RPT#24,1977)
 
     Brackett, M. 1973. Notes on tarif tree volume computation. Res. Management
@@ -976,47 +1010,10 @@ class Eq_12(SoftwoodVolumeEquation):
     WA. 132p.
     """
 
-    def calc_cvts(self, dbh, ht):
-        cvtsl = -2.539944 + 1.841226 * np.log10(dbh) + 1.034051 * np.log10(ht)
-
-        cvts = 10**cvtsl
-        cvts[np.logical_or(dbh < 1, ht <= 0)] = 0
-
-        return cvts
-
-    def calc_tarif(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        cvts = self.calc_cvts(dbh, ht)
-
-        tarif = (cvts * 0.912733) / (
-            (1.033 * (1.0 + 1.382937 * np.exp(-4.015292 * dbh)))
-            * (ba + 0.087266) - 0.174533)
-        tarif[np.logical_or(dbh <= 0, ht <= 0)] = 0
-
-        return tarif
-
-    def calc_cv4(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        tarif = self.calc_tarif(dbh, ht)
-
-        cv4 = tarif * (ba - 0.087266) / 0.912733
-        cv4[np.logical_or(dbh < 5, ht <= 0)] = 0
-
-        return cv4
-
-    def calc_cvt(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        tarif = self.calc_tarif(dbh, ht)
-
-        cvt = tarif * (0.9679 - 0.1051 * 0.5523**(dbh - 1.5)) * (
-            (1.033 * (1.0 + 1.382937 * np.exp(-4.015292 * (dbh / 10.0))))
-            * (ba + 0.087266) - 0.174533) / 0.912733
-        cvt[np.logical_or(dbh < 1, ht <= 0)] = 0
-
-        return cvt
+    cvts_coefs = (-2.539944, 1.841226, 1.034051, 0)
 
 
-class Eq_13(SoftwoodVolumeEquation):
+class Eq_13(BrackettVolumeEquation):
     """ Sitka spruce (SITKA SPRUCE MATURE--DNR RPT#24,1977)
 
     Brackett, M. 1973. Notes on tarif tree volume computation. Res. Management
@@ -1027,44 +1024,7 @@ class Eq_13(SoftwoodVolumeEquation):
     WA. 132p.
     """
 
-    def calc_cvts(self, dbh, ht):
-        cvtsl = -2.700574 + 1.754171 * np.log10(dbh) + 1.164531 * np.log10(ht)
-
-        cvts = 10**cvtsl
-        cvts[np.logical_or(dbh < 1, ht <= 0)] = 0
-
-        return cvts
-
-    def calc_tarif(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        cvts = self.calc_cvts(dbh, ht)
-
-        tarif = (cvts * 0.912733) / (
-            (1.033 * (1.0 + 1.382937 * np.exp(-4.015292 * dbh)))
-            * (ba + 0.087266) - 0.174533)
-        tarif[np.logical_or(dbh <= 0, ht <= 0)] = 0
-
-        return tarif
-
-    def calc_cv4(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        tarif = self.calc_tarif(dbh, ht)
-
-        cv4 = tarif * (ba - 0.087266) / 0.912733
-        cv4[np.logical_or(dbh < 5, ht <= 0)] = 0
-
-        return cv4
-
-    def calc_cvt(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        tarif = self.calc_tarif(dbh, ht)
-
-        cvt = tarif * (0.9679 - 0.1051 * 0.5523**(dbh - 1.5)) * (
-            (1.033 * (1.0 + 1.382937 * np.exp(-4.015292 * (dbh / 10.0))))
-            * (ba + 0.087266) - 0.174533) / 0.912733
-        cvt[np.logical_or(dbh < 1, ht <= 0)] = 0
-
-        return cvt
+    cvts_coefs = (-2.700574, 1.754171, 1.164531, 0)
 
 
 class Eq_14(SoftwoodVolumeEquation):
@@ -1125,7 +1085,7 @@ class Eq_14_2(SoftwoodVolumeEquation):
         return cvts
 
 
-class Eq_15(SoftwoodVolumeEquation):
+class Eq_15(BrackettVolumeEquation):
     """Lodgepole pine (LODGEPOLE PINE--DNR RPT#24,1977)
 
     Brackett, M. 1973. Notes on tarif tree volume computation. Res. Management
@@ -1136,47 +1096,10 @@ class Eq_15(SoftwoodVolumeEquation):
     132p.
     """
 
-    def calc_cvts(self, dbh, ht):
-        cvtsl = -2.615591 + 1.847504 * np.log10(dbh) + 1.085772 * np.log10(ht)
-
-        cvts = 10**cvtsl
-        cvts[np.logical_or(dbh < 1, ht <= 0)] = 0
-
-        return cvts
-
-    def calc_tarif(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        cvts = self.calc_cvts(dbh, ht)
-
-        tarif = (cvts * 0.912733) / (
-            (1.033 * (1.0 + 1.382937 * np.exp(-4.015292 * dbh)))
-            * (ba + 0.087266) - 0.174533)
-        tarif[np.logical_or(dbh <= 0, ht <= 0)] = 0
-
-        return tarif
-
-    def calc_cv4(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        tarif = self.calc_tarif(dbh, ht)
-
-        cv4 = tarif * (ba - 0.087266) / 0.912733
-        cv4[np.logical_or(dbh < 5, ht <= 0)] = 0
-
-        return cv4
-
-    def calc_cvt(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        tarif = self.calc_tarif(dbh, ht)
-
-        cvt = tarif * (0.9679 - 0.1051 * 0.5523**(dbh - 1.5)) * (
-            (1.033 * (1.0 + 1.382937 * np.exp(-4.015292 * (dbh / 10.0))))
-            * (ba + 0.087266) - 0.174533) / 0.912733
-        cvt[np.logical_or(dbh < 1, ht <= 0)] = 0
-
-        return cvt
+    cvts_coefs = (-2.615591, 1.847504, 1.085772, 0)
 
 
-class Eq_16(SoftwoodVolumeEquation):
+class Eq_16(MacLeanVolumeEquation):
     """Lodgepole pine (USDA-FS RES NOTE PNW-266)
 
     MacLean, Colin and John M. Berger. 1976. Softwood tree-volume equations
@@ -1184,74 +1107,12 @@ class Eq_16(SoftwoodVolumeEquation):
     Forest and Range Experiment Station, Portland Oregon. 34p.
     """
 
-    def calc_cvts(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        term = ((1.033 * (1.0 + 1.382937 * np.exp(-4.015292 * (dbh / 10.0))))
-                * (ba + 0.087266) - 0.174533)
-        tarif = self.calc_tarif(dbh, ht)
-        cv4 = self.calc_cv4(dbh, ht)
-
-        cvts = np.where(dbh < 6.0, tarif * term,
-                        (cv4 * term) / (ba - 0.087266))
-        cvts[np.logical_or(dbh < 1, ht <= 0)] = 0
-
-        return cvts
-
-    def calc_tarif(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-
-        dbh_tmp = np.full(np.asanyarray(dbh).shape,
-                          fill_value=6.0,
-                          dtype=float)
-        ba_tmp = 0.005454154 * (dbh_tmp**2)
-
-        cf4 = 0.422709 - 0.0000612236 * (ht**2 / dbh)
-        cf4 = np.clip(cf4, 0.3, 0.4)
-
-        cf4_tmp = 0.422709 - 0.0000612236 * (ht**2 / dbh_tmp)
-        cf4_tmp = np.clip(cf4_tmp, 0.3, 0.4)
-
-        cv4 = self.calc_cv4(dbh, ht)
-        cv4_tmp = self.calc_cv4(dbh_tmp, ht)
-
-        tarif_tmp = np.clip((cv4_tmp * 0.912733) / (ba_tmp - 0.087266), 0.01,
-                            None)
-
-        tarif = np.where(
-            dbh < 6.0,
-            tarif_tmp * (0.5 * (dbh_tmp - dbh)**2 + (1.0 + 0.063
-                                                     * (dbh_tmp - dbh)**2)),
-            (cv4 * 0.912733) / (ba - 0.087266))
-        tarif = np.clip(tarif, 0.01, None)
-        tarif[np.logical_or(dbh <= 0, ht <= 0)] = 0
-
-        return tarif
-
-    def calc_cv4(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-
+    def calc_cf4(self, dbh, ht):
         cf4 = 0.422709 - 0.0000612236 * (ht**2 / dbh)
-        cf4 = np.clip(cf4, 0.3, 0.4)
-
-        cv4 = cf4 * ba * ht
-        #cv4 = np.where(dbh < 5.0, 0, cv4)
-        cv4[np.logical_or(dbh < 5, ht <= 0)] = 0
-
-        return cv4
-
-    def calc_cvt(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        term = ((1.033 * (1.0 + 1.382937 * np.exp(-4.015292 * (dbh / 10.0))))
-                * (ba + 0.087266) - 0.174533)
-        tarif = self.calc_tarif(dbh, ht)
-
-        cvt = tarif * (0.9679 - 0.1051 * 0.5523**(dbh - 1.5)) * term / 0.912733
-        cvt[np.logical_or(dbh < 1, ht <= 0)] = 0
-
-        return cvt
+        return np.clip(cf4, 0.3, 0.4)
 
 
-class Eq_17(SoftwoodVolumeEquation):
+class Eq_17(TarifVolumeEquation):
     """Mountain hemlock (BELL, OSU RES.BULL 35)
 
     Bell, J.F., Marshall, D.D. and Johnson G.P. 1981. Tarif tables for mountain
@@ -1261,467 +1122,116 @@ class Eq_17(SoftwoodVolumeEquation):
     """
 
     def calc_cvts(self, dbh, ht):
-        cvts = 0.001106485 * dbh**1.8140497 * ht**1.2744923
+        cvts = _power_volume((0.001106485, 1.8140497, 1.2744923), dbh, ht)
         cvts[np.logical_or(dbh < 1, ht <= 0)] = 0
 
         return cvts
 
-    def calc_tarif(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        cvts = self.calc_cvts(dbh, ht)
-
-        tarif = (cvts * 0.912733) / (
-            (1.033 * (1.0 + 1.382937 * np.exp(-4.015292 * dbh)))
-            * (ba + 0.087266) - 0.174533)
-        tarif[np.logical_or(dbh <= 0, ht <= 0)] = 0
 
-        return tarif
+class Eq_18(MacLeanVolumeEquation):
+    """Shasta red fir (USDA-FS RES NOTE PNW-266)
 
-    def calc_cv4(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        tarif = self.calc_tarif(dbh, ht)
+    MacLean, Colin and John M. Berger. 1976. Softwood tree-volume equations
+    for major California species. PNW Research Note, PNW-266. Pacific Northwest
+    Forest and Range Experiment Station, Portland Oregon. 34p.
+    """
 
-        cv4 = tarif * (ba - 0.087266) / 0.912733
-        cv4[np.logical_or(dbh < 5, ht <= 0)] = 0
+    def calc_cf4(self, dbh, ht):
+        return np.clip(0.231237 + 0.028176 * (ht / dbh), 0.3, 0.4)
 
-        return cv4
 
-    def calc_cvt(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        tarif = self.calc_tarif(dbh, ht)
+class Eq_19(MacLeanVolumeEquation):
+    """Incense cedar (USDA-FS RES NOTE PNW-266)
 
-        cvt = tarif * (0.9679 - 0.1051 * 0.5523**(dbh - 1.5)) * (
-            (1.033 * (1.0 + 1.382937 * np.exp(-4.015292 * (dbh / 10.0))))
-            * (ba + 0.087266) - 0.174533) / 0.912733
-        cvt[np.logical_or(dbh < 1, ht <= 0)] = 0
+    MacLean, Colin and John M. Berger. 1976. Softwood tree-volume equations
+    for major California species. PNW Research Note, PNW-266. Pacific Northwest
+    Forest and Range Experiment Station, Portland Oregon. 34p.
+    """
 
-        return cvt
+    def calc_cf4(self, dbh, ht):
+        return np.clip(0.225786 + 4.44236 * (1 / ht), 0.27, None)
 
 
-class Eq_18(SoftwoodVolumeEquation):
-    """Shasta red fir (USDA-FS RES NOTE PNW-266)
+class Eq_20(MacLeanVolumeEquation):
+    """Sugar pine (USDA-FS RES NOTE PNW-266)
 
     MacLean, Colin and John M. Berger. 1976. Softwood tree-volume equations
     for major California species. PNW Research Note, PNW-266. Pacific Northwest
     Forest and Range Experiment Station, Portland Oregon. 34p.
     """
 
-    def calc_cvts(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        term = ((1.033 * (1.0 + 1.382937 * np.exp(-4.015292 * (dbh / 10.0))))
-                * (ba + 0.087266) - 0.174533)
-        tarif = self.calc_tarif(dbh, ht)
-        cv4 = self.calc_cv4(dbh, ht)
-
-        cvts = np.where(dbh < 6.0, tarif * term,
-                        (cv4 * term) / (ba - 0.087266))
-        cvts[np.logical_or(dbh < 1, ht <= 0)] = 0
+    def calc_cf4(self, dbh, ht):
+        return np.clip(0.358550 - 0.488134 * (1 / dbh), 0.3, 0.4)
 
-        return cvts
 
-    def calc_tarif(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-
-        dbh_tmp = np.full(np.asanyarray(dbh).shape,
-                          fill_value=6.0,
-                          dtype=float)
-        ba_tmp = 0.005454154 * (dbh_tmp**2)
-        # cf4 = np.clip(0.231237 + 0.028176 * (ht / dbh), 0.3, 0.4)
-        # cf4_tmp = np.clip(0.231237 + 0.028176 * (ht / dbh_tmp), 0.3, 0.4)
-        cv4 = self.calc_cv4(dbh, ht)
-        cv4_tmp = self.calc_cv4(dbh_tmp, ht)
+class Eq_21(TarifVolumeEquation):
+    """Western juniper (CHITTESTER,1984)
 
-        tarif_tmp = np.clip((cv4_tmp * 0.912733) / (ba_tmp - 0.087266), 0.01,
-                            None)
+    Chittester, Judith and Colin MacLean. 1984. Cubic-foot tree-volume
+    equations and tables for western juniper. Research Note, PNW-420. Pacific
+    Northwest Forest and Range Experiment Station. Portland, Oregon. 8p.
+    """
 
-        tarif = np.where(
-            dbh < 6.0,
-            tarif_tmp * (0.5 * (dbh_tmp - dbh)**2 + (1.0 + 0.063
-                                                     * (dbh_tmp - dbh)**2)),
-            (cv4 * 0.912733) / (ba - 0.087266))
-        tarif = np.clip(tarif, 0.01, None)
-        tarif[np.logical_or(dbh <= 0, ht <= 0)] = 0
+    def calc_cvts(self, dbh, ht):
+        cvts = (_BA_COEF * (0.30708901 + 0.00086157622 * ht
+                - 0.0037255243 * dbh * ht
+                / (ht - 4.5)) * dbh**2 * ht * (ht / (ht - 4.5))**2).clip(0,)
+        cvts[np.logical_or(dbh < 1, ht <= 0)] = 0
 
-        return tarif
+        return cvts
 
     def calc_cv4(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
+        cvts = self.calc_cvts(dbh, ht)
 
-        cf4 = np.clip(0.231237 + 0.028176 * (ht / dbh), 0.3, 0.4)
-        cv4 = cf4 * ba * ht
-        #cv4 = np.where(dbh < 5.0, 0, cv4)
+        cv4 = (cvts + 3.48) / (1.18052 + 0.32736 * np.exp(-0.1 * dbh)) - 2.948
         cv4[np.logical_or(dbh < 5, ht <= 0)] = 0
 
         return cv4
 
-    def calc_cvt(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        term = ((1.033 * (1.0 + 1.382937 * np.exp(-4.015292 * (dbh / 10.0))))
-                * (ba + 0.087266) - 0.174533)
-        tarif = self.calc_tarif(dbh, ht)
 
-        cvt = tarif * (0.9679 - 0.1051 * 0.5523**(dbh - 1.5)) * term / 0.912733
-        cvt[np.logical_or(dbh < 1, ht <= 0)] = 0
+class Eq_22(BrackettVolumeEquation):
+    """Western larch (LARCH--DNR RPT#24,1977)
 
-        return cvt
+    Brackett, M. 1973. Notes on tarif tree volume computation. Res. Management
+    Report 24. WA Dept. of Nat. Resources. Olympia. 26p.
+
+    Brackett, Michael. 1977. Notes on tarif tree-volume computation. DNR
+    report #24. State of Washington, Department of Natural Resources, Olympia,
+    WA. 132p.
+    """
 
+    cvts_coefs = (-2.624325, 1.847123, 1.044007, 0)
 
-class Eq_19(SoftwoodVolumeEquation):
-    """Incense cedar (USDA-FS RES NOTE PNW-266)
+
+class Eq_23(MacLeanVolumeEquation):
+    """White fir (USDA-FS RES NOTE PNW-266)
 
     MacLean, Colin and John M. Berger. 1976. Softwood tree-volume equations
     for major California species. PNW Research Note, PNW-266. Pacific Northwest
     Forest and Range Experiment Station, Portland Oregon. 34p.
     """
 
-    def calc_cvts(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        term = ((1.033 * (1.0 + 1.382937 * np.exp(-4.015292 * (dbh / 10.0))))
-                * (ba + 0.087266) - 0.174533)
-        tarif = self.calc_tarif(dbh, ht)
-        cv4 = self.calc_cv4(dbh, ht)
+    def calc_cf4(self, dbh, ht):
+        cf4 = 0.299039 + 1.91272 * (1 / ht) + 0.0000367217 * (ht**2 / dbh)
+        return np.clip(cf4, 0.3, 0.4)
+
+
+class Eq_24(TarifVolumeEquation):
+    """Redwood (Krumland, B.E. and L.E. Wensel. 1975. And DNR RPT#24, 1977)
+
+    Krumland, B.E. and L.E. Wensel. 1975. Preliminary young growth volume
+    tables for coastal California conifers. Research Note #1. In-house memo.
+    Co-op Redwood Yield Research Project. Department of Forestry and
+    Conservation, College of Natural Resources, U of Cal, Berkeley. On file
+    with the PNW Research Station.
+    """
 
-        cvts = np.where(dbh < 6.0, tarif * term,
-                        (cv4 * term) / (ba - 0.087266))
+    def calc_cvts(self, dbh, ht):
+        cvts = np.exp(-6.2597 + 1.9967 * np.log(dbh) + 0.9642 * np.log(ht))
         cvts[np.logical_or(dbh < 1, ht <= 0)] = 0
 
         return cvts
 
-    def calc_tarif(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-
-        dbh_tmp = np.full(np.asanyarray(dbh).shape,
-                          fill_value=6.0,
-                          dtype=float)
-        ba_tmp = 0.005454154 * (dbh_tmp**2)
-        # cf4 = np.clip(0.225786 + 4.44236 * (1 / ht), 0.27, None)
-        # cf4_tmp = np.clip(0.225786 + 4.44236 * (1 / ht), 0.27, None)
-        cv4 = self.calc_cv4(dbh, ht)
-        cv4_tmp = self.calc_cv4(dbh_tmp, ht)
-
-        tarif_tmp = np.clip((cv4_tmp * 0.912733) / (ba_tmp - 0.087266), 0.01,
-                            None)
-
-        tarif = np.where(
-            dbh < 6.0,
-            tarif_tmp * (0.5 * (dbh_tmp - dbh)**2 + (1.0 + 0.063
-                                                     * (dbh_tmp - dbh)**2)),
-            (cv4 * 0.912733) / (ba - 0.087266))
-        tarif = np.clip(tarif, 0.01, None)
-        tarif[np.logical_or(dbh <= 0, ht <= 0)] = 0
-
-        return tarif
-
-    def calc_cv4(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-
-        cf4 = np.clip(0.225786 + 4.44236 * (1 / ht), 0.27, None)
-        cv4 = cf4 * ba * ht
-        #cv4 = np.where(dbh < 5.0, 0, cv4)
-        cv4[np.logical_or(dbh < 5, ht <= 0)] = 0
-
-        return cv4
-
-    def calc_cvt(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        term = ((1.033 * (1.0 + 1.382937 * np.exp(-4.015292 * (dbh / 10.0))))
-                * (ba + 0.087266) - 0.174533)
-        tarif = self.calc_tarif(dbh, ht)
-
-        cvt = tarif * (0.9679 - 0.1051 * 0.5523**(dbh - 1.5)) * term / 0.912733
-        cvt[np.logical_or(dbh < 1, ht <= 0)] = 0
-
-        return cvt
-
-
-class Eq_20(SoftwoodVolumeEquation):
-    """Sugar pine (USDA-FS RES NOTE PNW-266)
-
-    MacLean, Colin and John M. Berger. 1976. Softwood tree-volume equations
-    for major California species. PNW Research Note, PNW-266. Pacific Northwest
-    Forest and Range Experiment Station, Portland Oregon. 34p.
-    """
-
-    def calc_cvts(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        term = ((1.033 * (1.0 + 1.382937 * np.exp(-4.015292 * (dbh / 10.0))))
-                * (ba + 0.087266) - 0.174533)
-        tarif = self.calc_tarif(dbh, ht)
-        cv4 = self.calc_cv4(dbh, ht)
-
-        cvts = np.where(dbh < 6.0, tarif * term,
-                        (cv4 * term) / (ba - 0.087266))
-        cvts[np.logical_or(dbh < 1, ht <= 0)] = 0
-
-        return cvts
-
-    def calc_tarif(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-
-        dbh_tmp = np.full(np.asanyarray(dbh).shape,
-                          fill_value=6.0,
-                          dtype=float)
-        ba_tmp = 0.005454154 * (dbh_tmp**2)
-        # cf4 = np.clip(0.358550 - 0.488134 * (1 / dbh), 0.3, 0.4)
-        # cf4_tmp = np.clip(0.358550 - 0.488134 * (1 / dbh_tmp), 0.3, 0.4)
-        cv4 = self.calc_cv4(dbh, ht)
-        cv4_tmp = self.calc_cv4(dbh_tmp, ht)
-
-        tarif_tmp = np.clip((cv4_tmp * 0.912733) / (ba_tmp - 0.087266), 0.01,
-                            None)
-
-        tarif = np.where(
-            dbh < 6.0,
-            tarif_tmp * (0.5 * (dbh_tmp - dbh)**2 + (1.0 + 0.063
-                                                     * (dbh_tmp - dbh)**2)),
-            (cv4 * 0.912733) / (ba - 0.087266))
-        tarif = np.clip(tarif, 0.01, None)
-        tarif[np.logical_or(dbh <= 0, ht <= 0)] = 0
-
-        return tarif
-
-    def calc_cv4(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        cf4 = np.clip(0.358550 - 0.488134 * (1 / dbh), 0.3, 0.4)
-
-        cv4 = cf4 * ba * ht
-        #cv4 = np.where(dbh < 5.0, 0, cv4)
-        cv4[np.logical_or(dbh < 5, ht <= 0)] = 0
-
-        return cv4
-
-    def calc_cvt(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        term = ((1.033 * (1.0 + 1.382937 * np.exp(-4.015292 * (dbh / 10.0))))
-                * (ba + 0.087266) - 0.174533)
-        tarif = self.calc_tarif(dbh, ht)
-
-        cvt = tarif * (0.9679 - 0.1051 * 0.5523**(dbh - 1.5)) * term / 0.912733
-        cvt[np.logical_or(dbh < 1, ht <= 0)] = 0
-
-        return cvt
-
-
-class Eq_21(SoftwoodVolumeEquation):
-    """Western juniper (CHITTESTER,1984)
-
-    Chittester, Judith and Colin MacLean. 1984. Cubic-foot tree-volume
-    equations and tables for western juniper. Research Note, PNW-420. Pacific
-    Northwest Forest and Range Experiment Station. Portland, Oregon. 8p.
-    """
-
-    def calc_cvts(self, dbh, ht):
-        cvts = (0.005454154 * (0.30708901 + 0.00086157622 * ht
-                - 0.0037255243 * dbh * ht
-                / (ht - 4.5)) * dbh**2 * ht * (ht / (ht - 4.5))**2).clip(0,)
-        cvts[np.logical_or(dbh < 1, ht <= 0)] = 0
-
-        return cvts
-
-    def calc_tarif(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        cvts = self.calc_cvts(dbh, ht)
-
-        tarif = (cvts * 0.912733) / (
-            (1.033 * (1.0 + 1.382937 * np.exp(-4.015292 * dbh)))
-            * (ba + 0.087266) - 0.174533)
-        tarif[np.logical_or(dbh <= 0, ht <= 0)] = 0
-
-        return tarif
-
-    def calc_cv4(self, dbh, ht):
-        cvts = self.calc_cvts(dbh, ht)
-
-        cv4 = (cvts + 3.48) / (1.18052 + 0.32736 * np.exp(-0.1 * dbh)) - 2.948
-        cv4[np.logical_or(dbh < 5, ht <= 0)] = 0
-
-        return cv4
-
-    def calc_cvt(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        tarif = self.calc_tarif(dbh, ht)
-
-        cvt = tarif * (0.9679 - 0.1051 * 0.5523**(dbh - 1.5)) * (
-            (1.033 * (1.0 + 1.382937 * np.exp(-4.015292 * (dbh / 10.0))))
-            * (ba + 0.087266) - 0.174533) / 0.912733
-        cvt[np.logical_or(dbh < 1, ht <= 0)] = 0
-
-        return cvt
-
-
-class Eq_22(SoftwoodVolumeEquation):
-    """Western larch (LARCH--DNR RPT#24,1977)
-
-    Brackett, M. 1973. Notes on tarif tree volume computation. Res. Management
-    Report 24. WA Dept. of Nat. Resources. Olympia. 26p.
-
-    Brackett, Michael. 1977. Notes on tarif tree-volume computation. DNR
-    report #24. State of Washington, Department of Natural Resources, Olympia,
-    WA. 132p.
-    """
-
-    def calc_cvts(self, dbh, ht):
-        cvtsl = -2.624325 + 1.847123 * np.log10(dbh) + 1.044007 * np.log10(ht)
-
-        cvts = 10**cvtsl
-        cvts[np.logical_or(dbh < 1, ht <= 0)] = 0
-
-        return cvts
-
-    def calc_tarif(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        cvts = self.calc_cvts(dbh, ht)
-
-        tarif = (cvts * 0.912733) / (
-            (1.033 * (1.0 + 1.382937 * np.exp(-4.015292 * dbh)))
-            * (ba + 0.087266) - 0.174533)
-        tarif[np.logical_or(dbh <= 0, ht <= 0)] = 0
-
-        return tarif
-
-    def calc_cv4(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        tarif = self.calc_tarif(dbh, ht)
-
-        cv4 = tarif * (ba - 0.087266) / 0.912733
-        cv4[np.logical_or(dbh < 5, ht <= 0)] = 0
-
-        return cv4
-
-    def calc_cvt(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        tarif = self.calc_tarif(dbh, ht)
-
-        cvt = tarif * (0.9679 - 0.1051 * 0.5523**(dbh - 1.5)) * (
-            (1.033 * (1.0 + 1.382937 * np.exp(-4.015292 * (dbh / 10.0))))
-            * (ba + 0.087266) - 0.174533) / 0.912733
-        cvt[np.logical_or(dbh < 1, ht <= 0)] = 0
-
-        return cvt
-
-
-class Eq_23(SoftwoodVolumeEquation):
-    """White fir (USDA-FS RES NOTE PNW-266)
-
-    MacLean, Colin and John M. Berger. 1976. Softwood tree-volume equations
-    for major California species. PNW Research Note, PNW-266. Pacific Northwest
-    Forest and Range Experiment Station, Portland Oregon. 34p.
-    """
-
-    def calc_cvts(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        term = ((1.033 * (1.0 + 1.382937 * np.exp(-4.015292 * (dbh / 10.0))))
-                * (ba + 0.087266) - 0.174533)
-        tarif = self.calc_tarif(dbh, ht)
-        cv4 = self.calc_cv4(dbh, ht)
-
-        cvts = np.where(dbh < 6.0, tarif * term,
-                        (cv4 * term) / (ba - 0.087266))
-        cvts[np.logical_or(dbh < 1, ht <= 0)] = 0
-
-        return cvts
-
-    def calc_tarif(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        dbh_tmp = np.full(np.asanyarray(dbh).shape,
-                          fill_value=6.0,
-                          dtype=float)
-        ba_tmp = 0.005454154 * (dbh_tmp**2)
-
-        cf4 = 0.299039 + 1.91272 * (1 / ht) + 0.0000367217 * (ht**2 / dbh)
-        cf4 = np.clip(cf4, 0.3, 0.4)
-
-        cf4_tmp = 0.299039 + 1.91272 * (1 / ht) + 0.0000367217 * (ht**2
-                                                                  / dbh_tmp)
-        cf4_tmp = np.clip(cf4_tmp, 0.3, 0.4)
-
-        cv4 = self.calc_cv4(dbh, ht)
-        cv4_tmp = self.calc_cv4(dbh_tmp, ht)
-
-        tarif_tmp = np.clip((cv4_tmp * 0.912733) / (ba_tmp - 0.087266), 0.01,
-                            None)
-
-        tarif = np.where(
-            dbh < 6.0,
-            tarif_tmp * (0.5 * (dbh_tmp - dbh)**2 + (1.0 + 0.063
-                                                     * (dbh_tmp - dbh)**2)),
-            (cv4 * 0.912733) / (ba - 0.087266))
-        tarif = np.clip(tarif, 0.01, None)
-        tarif[np.logical_or(dbh <= 0, ht <= 0)] = 0
-
-        return tarif
-
-    def calc_cv4(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-
-        cf4 = 0.299039 + 1.91272 * (1 / ht) + 0.0000367217 * (ht**2 / dbh)
-        cf4 = np.clip(cf4, 0.3, 0.4)
-
-        cv4 = cf4 * ba * ht
-        #cv4 = np.where(dbh < 5.0, 0, cv4)
-        cv4[np.logical_or(dbh < 5, ht <= 0)] = 0
-
-        return cv4
-
-    def calc_cvt(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        tarif = self.calc_tarif(dbh, ht)
-        term = ((1.033 * (1.0 + 1.382937 * np.exp(-4.015292 * (dbh / 10.0))))
-                * (ba + 0.087266) - 0.174533)
-
-        cvt = tarif * (0.9679 - 0.1051 * 0.5523**(dbh - 1.5)) * term / 0.912733
-        cvt[np.logical_or(dbh < 1, ht <= 0)] = 0
-
-        return cvt
-
-
-class Eq_24(SoftwoodVolumeEquation):
-    """Redwood (Krumland, B.E. and L.E. Wensel. 1975. And DNR RPT#24, 1977)
-
-    Krumland, B.E. and L.E. Wensel. 1975. Preliminary young growth volume
-    tables for coastal California conifers. Research Note #1. In-house memo.
-    Co-op Redwood Yield Research Project. Department of Forestry and
-    Conservation, College of Natural Resources, U of Cal, Berkeley. On file
-    with the PNW Research Station.
-    """
-
-    def calc_cvts(self, dbh, ht):
-        cvts = np.exp(-6.2597 + 1.9967 * np.log(dbh) + 0.9642 * np.log(ht))
-        cvts[np.logical_or(dbh < 1, ht <= 0)] = 0
-
-        return cvts
-
-    def calc_tarif(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        cvts = self.calc_cvts(dbh, ht)
-
-        tarif = (cvts * 0.912733) / (
-            (1.033 * (1.0 + 1.382937 * np.exp(-4.015292 * dbh)))
-            * (ba + 0.087266) - 0.174533)
-        tarif[np.logical_or(dbh <= 0, ht <= 0)] = 0
-
-        return tarif
-
-    def calc_cv4(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        tarif = self.calc_tarif(dbh, ht)
-
-        cv4 = tarif * (ba - 0.087266) / 0.912733
-        cv4[np.logical_or(dbh < 5, ht <= 0)] = 0
-
-        return cv4
-
-    def calc_cvt(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        tarif = self.calc_tarif(dbh, ht)
-
-        cvt = tarif * (0.9679 - 0.1051 * 0.5523**(dbh - 1.5)) * (
-            (1.033 * (1.0 + 1.382937 * np.exp(-4.015292 * (dbh / 10.0))))
-            * (ba + 0.087266) - 0.174533) / 0.912733
-        cvt[np.logical_or(dbh < 1, ht <= 0)] = 0
-
-        return cvt
-
 
 class Eq_25(HardwoodVolumeEquation_NoX):
     """Red alder (CURTIS/BRUCE, PNW-56)
@@ -1732,295 +1242,67 @@ class Eq_25(HardwoodVolumeEquation_NoX):
     """
 
     def calc_cvt(self, dbh, ht):
-        ht = np.clip(ht, 18, None)
-        # ba = 0.005454154 * (dbh**2)
-        z = (ht - 0.5 - dbh / 24.0) / (ht - 4.5)
-
-        f = (0.3651 * z**2.5 - 7.9032 * (z**2.5) * dbh / 1000.0 + 3.295 * (
-            z**2.5
-        ) * ht / 1000.0 - 1.9856 * (z**2.5) * ht * dbh / 100000.0 + -2.9668 * (
-            z**2.5) * (ht**2) / 1000000.0 + 1.5092 * (z**2.5) * (
-                ht ** 0.5) / 1000.0 + 4.9395 * (z**4.0) * dbh
-                / 1000.0 + -2.05937 * (
-                        z**4.0) * ht / 1000.0 + 1.5042 * (
-                            z**33.0) * ht * dbh / 1000000.0 - 1.1433 * (
-                                z**33.0) * (ht**0.5) / 10000.0 + 1.809 * (
-                                    z**41.0) * (ht**2) / 10000000.0)
-
-        cvt = 0.00545415 * dbh**2 * (ht - 4.5) * f
-        cvt[np.logical_or(dbh < 1, ht <= 0)] = 0
-
-        return cvt
-
-    def calc_tarif(self, dbh, ht):
-        ht = np.clip(ht, 18, None)
-        ba = 0.005454154 * (dbh**2)
-        cvt = self.calc_cvt(dbh, ht)
-
-        tarif = (cvt * 0.912733) / ((0.9679 - 0.1051 * 0.5523**(dbh - 1.5)) * (
-            (1.033 * (1.0 + 1.382937 * np.exp(-4.015292 * (dbh / 10.0))))
-            * (ba + 0.087266) - 0.174533))
-        tarif[np.logical_or(dbh <= 0, ht <= 0)] = 0
-
-        return tarif
-
-    def calc_cvts(self, dbh, ht):
-        ht = np.clip(ht, 18, None)
-        ba = 0.005454154 * (dbh**2)
-        tarif = self.calc_tarif(dbh, ht)
-        cvts = (tarif
-                * ((1.0330 * (1.0 + 1.382937
-                    * np.exp(-4.015292 * (dbh / 10.0))))
-                    * (ba + 0.087266) - 0.174533) / 0.912733)
-
-        cvts = np.clip(cvts, 0, None)
-        cvts[np.logical_or(dbh < 1, ht <= 0)] = 0
-
-        return cvts
-
-    def calc_cv4(self, dbh, ht):
-        ht = np.clip(ht, 18, None)
-        ba = 0.005454154 * (dbh**2)
-        tarif = self.calc_tarif(dbh, ht)
-
-        cv4 = tarif * (ba - 0.087266) / 0.912733
-        cv4[np.logical_or(dbh < 5, ht <= 0)] = 0
-
-        return cv4
-
-    def calc_cv8(self, dbh, ht):
-        ht = np.clip(ht, 18, None)
-        rc8 = 0.983 - (0.983 * 0.65**(dbh - 8.6))
-        cv4 = self.calc_cv4(dbh, ht)
-
-        cv8 = rc8 * cv4
-        cv8[np.logical_or(dbh < 11, ht <= 0)] = 0
-
-        return cv8
-
-
-class Eq_26(HardwoodVolumeEquation_NoX):
-    """Red alder (BC-ALDER--DNR RPT#24,1977)
-
-    Brackett, Michael. 1977. Notes on tarif tree-volume computation. DNR
-    report #24. State of Washington, Department of Natural Resources, Olympia,
-    WA. 132p.
-    """
-
-    def calc_cvts(self, dbh, ht):
-        cvtsl = -2.672775 + 1.920617 * np.log10(dbh) + 1.074024 * np.log10(ht)
-
-        cvts = 10**cvtsl
-        cvts[np.logical_or(dbh < 1, ht <= 0)] = 0
-
-        return cvts
-
-    def calc_tarif(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        cvts = self.calc_cvts(dbh, ht)
-
-        tarif = (cvts * 0.912733) / (
-            (1.033 * (1.0 + 1.382937 * np.exp(-4.015292 * dbh)))
-            * (ba + 0.087266) - 0.174533)
-        tarif[np.logical_or(dbh <= 0, ht <= 0)] = 0
-
-        return tarif
-
-    def calc_cvt(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        tarif = self.calc_tarif(dbh, ht)
-
-        cvt = tarif * (0.9679 - 0.1051 * 0.5523**(dbh - 1.5)) * (
-            (1.033 * (1.0 + 1.382937 * np.exp(-4.015292 * (dbh / 10.0))))
-            * (ba + 0.087266) - 0.174533) / 0.912733
-        cvt[np.logical_or(dbh < 1, ht <= 0)] = 0
-
-        return cvt
-
-    def calc_cv4(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        tarif = self.calc_tarif(dbh, ht)
-
-        cv4 = tarif * (ba - 0.087266) / 0.912733
-        cv4[np.logical_or(dbh < 5, ht <= 0)] = 0
-
-        return cv4
-
-    def calc_cv8(self, dbh, ht):
-        cv4 = self.calc_cv4(dbh, ht)
-
-        rc8 = 0.983 - (0.983 * 0.65**(dbh - 8.6))
-        cv8 = rc8 * cv4
-
-        cv8[np.logical_or(dbh < 11, ht <= 0)] = 0
-
-        return cv8
-
-
-class Eq_27(HardwoodVolumeEquation_NoX):
-    """Black cottonwood (BC-COTTONWOOD--DNR RPT#24, 1977)
-
-    Brackett, Michael. 1977. Notes on tarif tree-volume computation. DNR
-    report #24. State of Washington, Department of Natural Resources, Olympia,
-    WA. 132p.
-    """
-
-    def calc_cvts(self, dbh, ht):
-        cvtsl = -2.945047 + 1.803973 * np.log10(dbh) + 1.238853 * np.log10(ht)
-
-        cvts = 10**cvtsl
-        cvts[np.logical_or(dbh < 1, ht <= 0)] = 0
-
-        return cvts
-
-    def calc_tarif(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        cvts = self.calc_cvts(dbh, ht)
-
-        tarif = (cvts * 0.912733) / (
-            (1.033 * (1.0 + 1.382937 * np.exp(-4.015292 * dbh)))
-            * (ba + 0.087266) - 0.174533)
-        tarif[np.logical_or(dbh <= 0, ht <= 0)] = 0
-
-        return tarif
-
-    def calc_cvt(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        tarif = self.calc_tarif(dbh, ht)
-
-        cvt = tarif * (0.9679 - 0.1051 * 0.5523**(dbh - 1.5)) * (
-            (1.033 * (1.0 + 1.382937 * np.exp(-4.015292 * (dbh / 10.0))))
-            * (ba + 0.087266) - 0.174533) / 0.912733
-        cvt[np.logical_or(dbh < 1, ht <= 0)] = 0
-
-        return cvt
-
-    def calc_cv4(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        tarif = self.calc_tarif(dbh, ht)
-
-        cv4 = tarif * (ba - 0.087266) / 0.912733
-        cv4[np.logical_or(dbh < 5, ht <= 0)] = 0
-
-        return cv4
-
-    def calc_cv8(self, dbh, ht):
-        cv4 = self.calc_cv4(dbh, ht)
-        rc8 = 0.983 - (0.983 * 0.65**(dbh - 8.6))
-
-        cv8 = rc8 * cv4
-        cv8[np.logical_or(dbh < 11, ht <= 0)] = 0
-
-        return cv8
-
-
-class Eq_28(HardwoodVolumeEquation_NoX):
-    """Aspen (BC-ASPEN--DNR RPT#24,1977)
-
-    Brackett, Michael. 1977. Notes on tarif tree-volume computation. DNR
-    report #24. State of Washington, Department of Natural Resources, Olympia,
-    WA. 132p.
-    """
-
-    def calc_cvts(self, dbh, ht):
-        cvtsl = -2.635360 + 1.946034 * np.log10(dbh) + 1.024793 * np.log10(ht)
-
-        cvts = 10**cvtsl
-        cvts[np.logical_or(dbh < 1, ht <= 0)] = 0
-
-        return cvts
-
-    def calc_tarif(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        cvts = self.calc_cvts(dbh, ht)
-
-        tarif = (cvts * 0.912733) / (
-            (1.033 * (1.0 + 1.382937 * np.exp(-4.015292 * dbh)))
-            * (ba + 0.087266) - 0.174533)
-        tarif[np.logical_or(dbh <= 0, ht <= 0)] = 0
-
-        return tarif
-
-    def calc_cvt(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        tarif = self.calc_tarif(dbh, ht)
-
-        cvt = tarif * (0.9679 - 0.1051 * 0.5523**(dbh - 1.5)) * (
-            (1.033 * (1.0 + 1.382937 * np.exp(-4.015292 * (dbh / 10.0))))
-            * (ba + 0.087266) - 0.174533) / 0.912733
-        cvt[np.logical_or(dbh < 1, ht <= 0)] = 0
-
-        return cvt
-
-    def calc_cv4(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        tarif = self.calc_tarif(dbh, ht)
-
-        cv4 = tarif * (ba - 0.087266) / 0.912733
-        cv4[np.logical_or(dbh < 5, ht <= 0)] = 0
-
-        return cv4
-
-    def calc_cv8(self, dbh, ht):
-        cv4 = self.calc_cv4(dbh, ht)
-        rc8 = 0.983 - (0.983 * 0.65**(dbh - 8.6))
-
-        cv8 = rc8 * cv4
-        cv8[np.logical_or(dbh < 11, ht <= 0)] = 0
-
-        return cv8
-
-
-class Eq_29(HardwoodVolumeEquation_NoX):
-    """Birch (BC-BIRCH--DNR RPT#24, 1977)
-
-    Brackett, Michael. 1977. Notes on tarif tree-volume computation. DNR
-    report #24. State of Washington, Department of Natural Resources, Olympia,
-    WA. 132p.
-    """
+        ht = np.clip(ht, 18, None)
+        # ba = 0.005454154 * (dbh**2)
+        z = (ht - 0.5 - dbh / 24.0) / (ht - 4.5)
 
-    def calc_cvts(self, dbh, ht):
-        cvtsl = -2.757813 + 1.911681 * np.log10(dbh) + 1.105403 * np.log10(ht)
+        # powers of z that are used several times
+        z25 = z**2.5
+        z2 = z * z
+        z4 = z2 * z2
+        z33 = z**33.0
+        sqrt_ht = np.sqrt(ht)
+
+        f = (0.3651 * z25 - 7.9032 * z25 * dbh / 1000.0
+             + 3.295 * z25 * ht / 1000.0 - 1.9856 * z25 * ht * dbh / 100000.0
+             - 2.9668 * z25 * (ht**2) / 1000000.0
+             + 1.5092 * z25 * sqrt_ht / 1000.0 + 4.9395 * z4 * dbh / 1000.0
+             - 2.05937 * z4 * ht / 1000.0
+             + 1.5042 * z33 * ht * dbh / 1000000.0
+             - 1.1433 * z33 * sqrt_ht / 10000.0
+             + 1.809 * z**41.0 * (ht**2) / 10000000.0)
 
-        cvts = 10**cvtsl
-        cvts[np.logical_or(dbh < 1, ht <= 0)] = 0
+        cvt = 0.00545415 * dbh**2 * (ht - 4.5) * f
+        cvt[np.logical_or(dbh < 1, ht <= 0)] = 0
 
-        return cvts
+        return cvt
 
     def calc_tarif(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        cvts = self.calc_cvts(dbh, ht)
+        ht = np.clip(ht, 18, None)
+        ba = _BA_COEF * (dbh**2)
+        cvt = self.calc_cvt(dbh, ht)
 
-        tarif = (cvts * 0.912733) / (
-            (1.033 * (1.0 + 1.382937 * np.exp(-4.015292 * dbh)))
-            * (ba + 0.087266) - 0.174533)
+        tarif = (cvt * _TARIF_COEF) / (_butt_shape(dbh)
+                                       * _brackett_term(dbh, ba))
         tarif[np.logical_or(dbh <= 0, ht <= 0)] = 0
 
         return tarif
 
-    def calc_cvt(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
+    def calc_cvts(self, dbh, ht):
+        ht = np.clip(ht, 18, None)
+        ba = _BA_COEF * (dbh**2)
         tarif = self.calc_tarif(dbh, ht)
+        cvts = tarif * _brackett_term(dbh, ba) * _INV_TARIF_COEF
 
-        cvt = tarif * (0.9679 - 0.1051 * 0.5523**(dbh - 1.5)) * (
-            (1.033 * (1.0 + 1.382937 * np.exp(-4.015292 * (dbh / 10.0))))
-            * (ba + 0.087266) - 0.174533) / 0.912733
-        cvt[np.logical_or(dbh < 1, ht <= 0)] = 0
+        cvts = np.clip(cvts, 0, None)
+        cvts[np.logical_or(dbh < 1, ht <= 0)] = 0
 
-        return cvt
+        return cvts
 
     def calc_cv4(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
+        ht = np.clip(ht, 18, None)
+        ba = _BA_COEF * (dbh**2)
         tarif = self.calc_tarif(dbh, ht)
 
-        cv4 = tarif * (ba - 0.087266) / 0.912733
+        cv4 = tarif * (ba - _BA_4IN) * _INV_TARIF_COEF
         cv4[np.logical_or(dbh < 5, ht <= 0)] = 0
 
         return cv4
 
     def calc_cv8(self, dbh, ht):
+        ht = np.clip(ht, 18, None)
+        rc8 = _rc8(dbh)
         cv4 = self.calc_cv4(dbh, ht)
-        rc8 = 0.983 - (0.983 * 0.65**(dbh - 8.6))
 
         cv8 = rc8 * cv4
         cv8[np.logical_or(dbh < 11, ht <= 0)] = 0
@@ -2028,64 +1310,62 @@ class Eq_29(HardwoodVolumeEquation_NoX):
         return cv8
 
 
-class Eq_30(HardwoodVolumeEquation_NoX):
-    """Bigleaf maple (BC-BIRCH--DNR RPT#24, 1977)
+class Eq_26(BrackettHardwoodVolumeEquation):
+    """Red alder (BC-ALDER--DNR RPT#24,1977)
 
     Brackett, Michael. 1977. Notes on tarif tree-volume computation. DNR
     report #24. State of Washington, Department of Natural Resources, Olympia,
     WA. 132p.
     """
 
-    def calc_cvts(self, dbh, ht):
-        cvtsl = -2.770324 + 1.885813 * np.log10(dbh) + 1.119043 * np.log10(ht)
+    cvts_coefs = (-2.672775, 1.920617, 1.074024, 0)
 
-        cvts = 10**cvtsl
-        cvts[np.logical_or(dbh < 1, ht <= 0)] = 0
 
-        return cvts
+class Eq_27(BrackettHardwoodVolumeEquation):
+    """Black cottonwood (BC-COTTONWOOD--DNR RPT#24, 1977)
 
-    def calc_tarif(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        cvts = self.calc_cvts(dbh, ht)
+    Brackett, Michael. 1977. Notes on tarif tree-volume computation. DNR
+    report #24. State of Washington, Department of Natural Resources, Olympia,
+    WA. 132p.
+    """
 
-        tarif = (cvts * 0.912733) / (
-            (1.033 * (1.0 + 1.382937 * np.exp(-4.015292 * dbh)))
-            * (ba + 0.087266) - 0.174533)
-        tarif[np.logical_or(dbh <= 0, ht <= 0)] = 0
+    cvts_coefs = (-2.945047, 1.803973, 1.238853, 0)
 
-        return tarif
 
-    def calc_cvt(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        tarif = self.calc_tarif(dbh, ht)
+class Eq_28(BrackettHardwoodVolumeEquation):
+    """Aspen (BC-ASPEN--DNR RPT#24,1977)
 
-        cvt = tarif * (0.9679 - 0.1051 * 0.5523**(dbh - 1.5)) * (
-            (1.033 * (1.0 + 1.382937 * np.exp(-4.015292 * (dbh / 10.0))))
-            * (ba + 0.087266) - 0.174533) / 0.912733
-        cvt[np.logical_or(dbh < 1, ht <= 0)] = 0
+    Brackett, Michael. 1977. Notes on tarif tree-volume computation. DNR
+    report #24. State of Washington, Department of Natural Resources, Olympia,
+    WA. 132p.
+    """
 
-        return cvt
+    cvts_coefs = (-2.635360, 1.946034, 1.024793, 0)
 
-    def calc_cv4(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        tarif = self.calc_tarif(dbh, ht)
 
-        cv4 = tarif * (ba - 0.087266) / 0.912733
-        cv4[np.logical_or(dbh < 5, ht <= 0)] = 0
+class Eq_29(BrackettHardwoodVolumeEquation):
+    """Birch (BC-BIRCH--DNR RPT#24, 1977)
 
-        return cv4
+    Brackett, Michael. 1977. Notes on tarif tree-volume computation. DNR
+    report #24. State of Washington, Department of Natural Resources, Olympia,
+    WA. 132p.
+    """
 
-    def calc_cv8(self, dbh, ht):
-        cv4 = self.calc_cv4(dbh, ht)
-        rc8 = 0.983 - (0.983 * 0.65**(dbh - 8.6))
+    cvts_coefs = (-2.757813, 1.911681, 1.105403, 0)
 
-        cv8 = rc8 * cv4
-        cv8[np.logical_or(dbh < 11, ht <= 0)] = 0
 
-        return cv8
+class Eq_30(BrackettHardwoodVolumeEquation):
+    """Bigleaf maple (BC-BIRCH--DNR RPT#24, 1977)
+
+    Brackett, Michael. 1977. Notes on tarif tree-volume computation. DNR
+    report #24. State of Washington, Department of Natural Resources, Olympia,
+    WA. 132p.
+    """
+
+    cvts_coefs = (-2.770324, 1.885813, 1.119043, 0)
 
 
-class Eq_31(HardwoodVolumeEquation_NoX):
+class Eq_31(HardwoodTarifVolumeEquation):
     """Eucalyptus (MEMO, COLIN D. MacLEAN 1/27/83, (REVISED 2/7/83))
 
     Colin MacLean and Tom Farrenkopf. 1983. Eucalyptus volume equation.
@@ -2100,48 +1380,8 @@ class Eq_31(HardwoodVolumeEquation_NoX):
 
         return cvts
 
-    def calc_tarif(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        cvts = self.calc_cvts(dbh, ht)
-
-        tarif = (cvts * 0.912733) / (
-            (1.033 * (1.0 + 1.382937 * np.exp(-4.015292 * dbh)))
-            * (ba + 0.087266) - 0.174533)
-        tarif[np.logical_or(dbh <= 0, ht <= 0)] = 0
-
-        return tarif
-
-    def calc_cvt(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        tarif = self.calc_tarif(dbh, ht)
-
-        cvt = tarif * (0.9679 - 0.1051 * 0.5523**(dbh - 1.5)) * (
-            (1.033 * (1.0 + 1.382937 * np.exp(-4.015292 * (dbh / 10.0))))
-            * (ba + 0.087266) - 0.174533) / 0.912733
-        cvt[np.logical_or(dbh < 1, ht <= 0)] = 0
-
-        return cvt
-
-    def calc_cv4(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        tarif = self.calc_tarif(dbh, ht)
-
-        cv4 = tarif * (ba - 0.087266) / 0.912733
-        cv4[np.logical_or(dbh < 5, ht <= 0)] = 0
-
-        return cv4
-
-    def calc_cv8(self, dbh, ht):
-        cv4 = self.calc_cv4(dbh, ht)
-        rc8 = 0.983 - (0.983 * 0.65**(dbh - 8.6))
-
-        cv8 = rc8 * cv4
-        cv8[np.logical_or(dbh < 11, ht <= 0)] = 0
 
-        return cv8
-
-
-class Eq_32(HardwoodVolumeEquation_WithX):
+class Eq_32(PillsburyVolumeEquation):
     """Giant chinquapin (PILLSBURY (H,D), CHARLES BOLSINGER 1/3/83)
 
     Pillsbury, Norman H. and Michael L. Kirkley. 1984. Equations for Total,
@@ -2150,43 +1390,25 @@ class Eq_32(HardwoodVolumeEquation_WithX):
     """
 
     def calc_cvts(self, dbh, ht):
-        cvts = 0.0120372263 * dbh**2.02232 * ht**0.68638
+        cvts = _power_volume((0.0120372263, 2.02232, 0.68638), dbh, ht)
         cvts[np.logical_or(dbh < 1, ht <= 0)] = 0
 
         return cvts
 
     def calc_cv4(self, dbh, ht):
-        cv4 = 0.0055212937 * dbh**2.07202 * ht**0.77467
+        cv4 = _power_volume((0.0055212937, 2.07202, 0.77467), dbh, ht)
         cv4[np.logical_or(dbh < 5, ht <= 0)] = 0
 
         return cv4
 
     def calc_cv8(self, dbh, ht):
-        cv8 = 0.0018985111 * dbh**2.38285 * ht**0.77105
+        cv8 = _power_volume((0.0018985111, 2.38285, 0.77105), dbh, ht)
         cv8[np.logical_or(dbh < 11, ht <= 0)] = 0
 
         return cv8
 
-    def calc_cvt(self, dbh, ht):
-        cvts = self.calc_cvts(dbh, ht)
-        rts = 0.9679 - 0.1051 * 0.5523**(dbh - 1.5)
-
-        cvt = cvts * rts
-        cvt[np.logical_or(dbh < 1, ht <= 0)] = 0
-
-        return cvt
-
-    def calc_tarif(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        cv8 = self.calc_cv8(dbh, ht)
-
-        tarif = (cv8 * 0.912733) / ((0.983 - 0.983 * 0.65**(dbh - 8.6))
-                                    * (ba - 0.087266))
-        tarif[np.logical_or(dbh <= 0, ht <= 0)] = 0
-        return tarif
 
-
-class Eq_33(HardwoodVolumeEquation_WithX):
+class Eq_33(PillsburyVolumeEquation):
     """California laurel (PILLSBURY (H,D), CHARLES BOLSINGER 1/3/83)
 
     Pillsbury, Norman H. and Michael L. Kirkley. 1984. Equations for Total,
@@ -2195,88 +1417,53 @@ class Eq_33(HardwoodVolumeEquation_WithX):
     """
 
     def calc_cvts(self, dbh, ht):
-        cvts = 0.0057821322 * dbh**1.94553 * ht**0.88389
+        cvts = _power_volume((0.0057821322, 1.94553, 0.88389), dbh, ht)
         cvts[np.logical_or(dbh < 1, ht <= 0)] = 0
 
         return cvts
 
     def calc_cv4(self, dbh, ht):
-        cv4 = 0.0016380753 * dbh**2.05910 * ht**1.05293
+        cv4 = _power_volume((0.0016380753, 2.05910, 1.05293), dbh, ht)
         cv4[np.logical_or(dbh < 5, ht <= 0)] = 0
 
         return cv4
 
     def calc_cv8(self, dbh, ht):
-        cv8 = 0.0018985111 * dbh**2.38285 * ht**0.77105
+        cv8 = _power_volume((0.0018985111, 2.38285, 0.77105), dbh, ht)
         cv8[np.logical_or(dbh < 11, ht <= 0)] = 0
 
         return cv8
 
-    def calc_cvt(self, dbh, ht):
-        cvts = self.calc_cvts(dbh, ht)
-        rts = 0.9679 - 0.1051 * 0.5523**(dbh - 1.5)
-
-        cvt = cvts * rts
-        cvt[np.logical_or(dbh < 1, ht <= 0)] = 0
-
-        return cvt
-
-    def calc_tarif(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        cv8 = self.calc_cv8(dbh, ht)
-
-        tarif = (cv8 * 0.912733) / ((0.983 - 0.983 * 0.65**(dbh - 8.6))
-                                    * (ba - 0.087266))
-        tarif[np.logical_or(dbh <= 0, ht <= 0)] = 0
-        return tarif
 
-
-class Eq_34(HardwoodVolumeEquation_WithX):
+class Eq_34(PillsburyVolumeEquation):
     """Tanoak (PILLSBURY (H,D), CHARLES BOLSINGER 1/3/83)
 
     Pillsbury, Norman H. and Michael L. Kirkley. 1984. Equations for Total,
     Wood, and Saw-log Volume for Thirteen California Hardwoods. PNW Research
     Note, PNW-414. Pacific Northwest Research Station, Portland Oregon. 52p.
     """
+    max_ht = 120
 
     def calc_cvts(self, dbh, ht):
-        cvts = 0.0058870024 * dbh**1.94165 * ht**0.86562
+        cvts = _power_volume((0.0058870024, 1.94165, 0.86562), dbh, ht)
         cvts[np.logical_or(dbh < 1, ht <= 0)] = 0
 
         return cvts
 
     def calc_cv4(self, dbh, ht):
-        cv4 = 0.0005774970 * dbh**2.19576 * ht**1.14078
+        cv4 = _power_volume((0.0005774970, 2.19576, 1.14078), dbh, ht)
         cv4[np.logical_or(dbh < 5, ht <= 0)] = 0
 
         return cv4
 
     def calc_cv8(self, dbh, ht):
-        cv8 = 0.0002526443 * dbh**2.30949 * ht**1.21069
+        cv8 = _power_volume((0.0002526443, 2.30949, 1.21069), dbh, ht)
         cv8[np.logical_or(dbh < 11, ht <= 0)] = 0
 
         return cv8
 
-    def calc_cvt(self, dbh, ht):
-        cvts = self.calc_cvts(dbh, ht)
-        rts = 0.9679 - 0.1051 * 0.5523**(dbh - 1.5)
-
-        cvt = cvts * rts
-        cvt[np.logical_or(dbh < 1, ht <= 0)] = 0
-
-        return cvt
-
-    def calc_tarif(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        cv8 = self.calc_cv8(dbh, ht)
-
-        tarif = (cv8 * 0.912733) / ((0.983 - 0.983 * 0.65**(dbh - 8.6))
-                                    * (ba - 0.087266))
-        tarif[np.logical_or(dbh <= 0, ht <= 0)] = 0
-        return tarif
 
-
-class Eq_35(HardwoodVolumeEquation_WithX):
+class Eq_35(PillsburyVolumeEquation):
     """California white oak (PILLSBURY (H,D), CHARLES BOLSINGER 1/3/83)
 
     Pillsbury, Norman H. and Michael L. Kirkley. 1984. Equations for Total,
@@ -2285,43 +1472,25 @@ class Eq_35(HardwoodVolumeEquation_WithX):
     """
 
     def calc_cvts(self, dbh, ht):
-        cvts = 0.0042870077 * dbh**2.33631 * ht**0.74872
+        cvts = _power_volume((0.0042870077, 2.33631, 0.74872), dbh, ht)
         cvts[np.logical_or(dbh < 1, ht <= 0)] = 0
 
         return cvts
 
     def calc_cv4(self, dbh, ht):
-        cv4 = 0.0009684363 * dbh**2.39565 * ht**0.98878
+        cv4 = _power_volume((0.0009684363, 2.39565, 0.98878), dbh, ht)
         cv4[np.logical_or(dbh < 5, ht <= 0)] = 0
 
         return cv4
 
     def calc_cv8(self, dbh, ht):
-        cv8 = 0.0001880044 * dbh**1.87346 * ht**1.62443
+        cv8 = _power_volume((0.0001880044, 1.87346, 1.62443), dbh, ht)
         cv8[np.logical_or(dbh < 11, ht <= 0)] = 0
 
         return cv8
 
-    def calc_cvt(self, dbh, ht):
-        cvts = self.calc_cvts(dbh, ht)
-        rts = 0.9679 - 0.1051 * 0.5523**(dbh - 1.5)
-
-        cvt = cvts * rts
-        cvt[np.logical_or(dbh < 1, ht <= 0)] = 0
-
-        return cvt
-
-    def calc_tarif(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        cv8 = self.calc_cv8(dbh, ht)
-
-        tarif = (cv8 * 0.912733) / ((0.983 - 0.983 * 0.65**(dbh - 8.6))
-                                    * (ba - 0.087266))
-        tarif[np.logical_or(dbh <= 0, ht <= 0)] = 0
-        return tarif
 
-
-class Eq_36(HardwoodVolumeEquation_WithX):
+class Eq_36(PillsburyVolumeEquation):
     """Engelmann oak (PILLSBURY (H,D), CHARLES BOLSINGER 1/3/83)
 
     Pillsbury, Norman H. and Michael L. Kirkley. 1984. Equations for Total,
@@ -2330,13 +1499,13 @@ class Eq_36(HardwoodVolumeEquation_WithX):
     """
 
     def calc_cvts(self, dbh, ht):
-        cvts = 0.0191453191 * dbh**2.40248 * ht**0.28060
+        cvts = _power_volume((0.0191453191, 2.40248, 0.28060), dbh, ht)
         cvts[np.logical_or(dbh < 1, ht <= 0)] = 0
 
         return cvts
 
     def calc_cv4(self, dbh, ht):
-        cv4 = 0.0053866353 * dbh**2.61268 * ht**0.31103
+        cv4 = _power_volume((0.0053866353, 2.61268, 0.31103), dbh, ht)
         cv4[np.logical_or(dbh < 5, ht <= 0)] = 0
 
         return cv4
@@ -2347,472 +1516,247 @@ class Eq_36(HardwoodVolumeEquation_WithX):
 
         return cv8
 
-    def calc_cvt(self, dbh, ht):
-        cvts = self.calc_cvts(dbh, ht)
-        rts = 0.9679 - 0.1051 * 0.5523**(dbh - 1.5)
-
-        cvt = cvts * rts
-        cvt[np.logical_or(dbh < 1, ht <= 0)] = 0
-
-        return cvt
-
-    def calc_tarif(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        cv8 = self.calc_cv8(dbh, ht)
-
-        tarif = (cv8 * 0.912733) / ((0.983 - 0.983 * 0.65**(dbh - 8.6))
-                                    * (ba - 0.087266))
-        tarif[np.logical_or(dbh <= 0, ht <= 0)] = 0
-        return tarif
 
-
-class Eq_37(HardwoodVolumeEquation_WithX):
+class Eq_37(PillsburyVolumeEquation):
     """Bigleaf maple (PILLSBURY (H,D,FC), CHARLES BOLSINGER 1/3/83)
 
     Pillsbury, Norman H. and Michael L. Kirkley. 1984. Equations for Total,
     Wood, and Saw-log Volume for Thirteen California Hardwoods. PNW Research
     Note, PNW-414. Pacific Northwest Research Station, Portland Oregon. 52p.
     """
+    fc_factor = 10**0.40017
 
     def calc_cvts(self, dbh, ht):
-        cvts = 0.0101786350 * dbh**2.22462 * ht**0.57561
+        cvts = _power_volume((0.0101786350, 2.22462, 0.57561), dbh, ht)
         cvts[np.logical_or(dbh < 1, ht <= 0)] = 0
 
         return cvts
 
     def calc_cv4(self, dbh, ht):
-        cv4 = 0.0034214162 * dbh**2.35347 * ht**0.69586
+        cv4 = _power_volume((0.0034214162, 2.35347, 0.69586), dbh, ht)
         cv4[np.logical_or(dbh < 5, ht <= 0)] = 0
 
         return cv4
 
     def calc_cv8(self, dbh, ht):
-        ff = np.piecewise(dbh,
-                          condlist=[
-                              dbh < 11, (dbh >= 11) & (dbh < 21),
-                              (dbh >= 21) & (dbh < 31),
-                              (dbh >= 31) & (dbh < 41), dbh >= 41
-                          ],
-                          funclist=[84, 84, 82, 81, 80])
-        ff9ft = 100 + (ff - 100) * (9 - 4.5) / (16 - 4.5)
-        diam_9ft = ff9ft / 100.0 * dbh
-        fc = np.where((diam_9ft >= 9) & (ht >= 9), 10, 1)
-
-        cv8 = 0.0004236332 * dbh**2.10316 * ht**1.08584 * fc**0.40017
+        fc_k = _form_class_factor(dbh, ht, (84, 84, 82, 81, 80),
+                                  self.fc_factor)
+        cv8 = _power_volume((0.0004236332, 2.10316, 1.08584), dbh, ht) * fc_k
         cv8[np.logical_or(dbh < 11, ht <= 0)] = 0
 
         return cv8
 
-    def calc_cvt(self, dbh, ht):
-        cvts = self.calc_cvts(dbh, ht)
-        rts = 0.9679 - 0.1051 * 0.5523**(dbh - 1.5)
-
-        cvt = cvts * rts
-        cvt[np.logical_or(dbh < 1, ht <= 0)] = 0
-
-        return cvt
-
-    def calc_tarif(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        cv8 = self.calc_cv8(dbh, ht)
-
-        tarif = (cv8 * 0.912733) / ((0.983 - 0.983 * 0.65**(dbh - 8.6))
-                                    * (ba - 0.087266))
-        tarif[np.logical_or(dbh <= 0, ht <= 0)] = 0
-        return tarif
 
-
-class Eq_38(HardwoodVolumeEquation_WithX):
+class Eq_38(PillsburyVolumeEquation):
     """California black oak (PILLSBURY (H,D,FC), CHARLES BOLSINGER 1/3/83)
 
     Pillsbury, Norman H. and Michael L. Kirkley. 1984. Equations for Total,
     Wood, and Saw-log Volume for Thirteen California Hardwoods. PNW Research
     Note, PNW-414. Pacific Northwest Research Station, Portland Oregon. 52p.
     """
+    fc_factor = 10**0.28385
 
     def calc_cvts(self, dbh, ht):
-        cvts = 0.0070538108 * dbh**1.97437 * ht**0.85034
+        cvts = _power_volume((0.0070538108, 1.97437, 0.85034), dbh, ht)
         cvts[np.logical_or(dbh < 1, ht <= 0)] = 0
 
         return cvts
 
     def calc_cv4(self, dbh, ht):
-        cv4 = 0.0036795695 * dbh**2.12635 * ht**0.83339
+        cv4 = _power_volume((0.0036795695, 2.12635, 0.83339), dbh, ht)
         cv4[np.logical_or(dbh < 5, ht <= 0)] = 0
 
         return cv4
 
     def calc_cv8(self, dbh, ht):
-        ff = np.piecewise(dbh,
-                          condlist=[
-                              dbh < 11, (dbh >= 11) & (dbh < 21),
-                              (dbh >= 21) & (dbh < 31),
-                              (dbh >= 31) & (dbh < 41), dbh >= 41
-                          ],
-                          funclist=[95, 95, 84, 82, 82])
-        ff9ft = 100 + (ff - 100) * (9 - 4.5) / (16 - 4.5)
-        diam_9ft = ff9ft / 100.0 * dbh
-        fc = np.where((diam_9ft >= 9) & (ht >= 9), 10, 1)
-
-        cv8 = 0.0012478663 * dbh**2.68099 * ht**0.42441 * fc**0.28385
+        fc_k = _form_class_factor(dbh, ht, (95, 95, 84, 82, 82),
+                                  self.fc_factor)
+        cv8 = _power_volume((0.0012478663, 2.68099, 0.42441), dbh, ht) * fc_k
         cv8[np.logical_or(dbh < 11, ht <= 0)] = 0
 
         return cv8
 
-    def calc_cvt(self, dbh, ht):
-        cvts = self.calc_cvts(dbh, ht)
-        rts = 0.9679 - 0.1051 * 0.5523**(dbh - 1.5)
-
-        cvt = cvts * rts
-        cvt[np.logical_or(dbh < 1, ht <= 0)] = 0
-
-        return cvt
-
-    def calc_tarif(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        cv8 = self.calc_cv8(dbh, ht)
-
-        tarif = (cv8 * 0.912733) / ((0.983 - 0.983 * 0.65**(dbh - 8.6))
-                                    * (ba - 0.087266))
-        tarif[np.logical_or(dbh <= 0, ht <= 0)] = 0
-        return tarif
 
-
-class Eq_39(HardwoodVolumeEquation_WithX):
+class Eq_39(PillsburyVolumeEquation):
     """Blue oak (PILLSBURY (H,D,FC), CHARLES BOLSINGER 1/3/83)
 
     Pillsbury, Norman H. and Michael L. Kirkley. 1984. Equations for Total,
     Wood, and Saw-log Volume for Thirteen California Hardwoods. PNW Research
     Note, PNW-414. Pacific Northwest Research Station, Portland Oregon. 52p.
     """
+    fc_factor = 10**0.15958
 
     def calc_cvts(self, dbh, ht):
-        cvts = 0.0125103008 * dbh**2.33089 * ht**0.46100
+        cvts = _power_volume((0.0125103008, 2.33089, 0.46100), dbh, ht)
         cvts[np.logical_or(dbh < 1, ht <= 0)] = 0
 
         return cvts
 
     def calc_cv4(self, dbh, ht):
-        cv4 = 0.0042324071 * dbh**2.53987 * ht**0.50591
+        cv4 = _power_volume((0.0042324071, 2.53987, 0.50591), dbh, ht)
         cv4[np.logical_or(dbh < 5, ht <= 0)] = 0
 
         return cv4
 
     def calc_cv8(self, dbh, ht):
-        ff = np.piecewise(dbh,
-                          condlist=[
-                              dbh < 11, (dbh >= 11) & (dbh < 21),
-                              (dbh >= 21) & (dbh < 31),
-                              (dbh >= 31) & (dbh < 41), dbh >= 41
-                          ],
-                          funclist=[95, 95, 86, 82, 82])
-        ff9ft = 100 + (ff - 100) * (9 - 4.5) / (16 - 4.5)
-        diam_9ft = ff9ft / 100.0 * dbh
-        fc = np.where((diam_9ft >= 9) & (ht >= 9), 10, 1)
-
-        cv8 = 0.0036912408 * dbh**1.79732 * ht**0.83884 * fc**0.15958
+        fc_k = _form_class_factor(dbh, ht, (95, 95, 86, 82, 82),
+                                  self.fc_factor)
+        cv8 = _power_volume((0.0036912408, 1.79732, 0.83884), dbh, ht) * fc_k
         cv8[np.logical_or(dbh < 11, ht <= 0)] = 0
 
         return cv8
 
-    def calc_cvt(self, dbh, ht):
-        cvts = self.calc_cvts(dbh, ht)
-        rts = 0.9679 - 0.1051 * 0.5523**(dbh - 1.5)
-
-        cvt = cvts * rts
-        cvt[np.logical_or(dbh < 1, ht <= 0)] = 0
-
-        return cvt
-
-    def calc_tarif(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        cv8 = self.calc_cv8(dbh, ht)
-
-        tarif = (cv8 * 0.912733) / ((0.983 - 0.983 * 0.65**(dbh - 8.6))
-                                    * (ba - 0.087266))
-        tarif[np.logical_or(dbh <= 0, ht <= 0)] = 0
-        return tarif
 
-
-class Eq_40(HardwoodVolumeEquation_WithX):
+class Eq_40(PillsburyVolumeEquation):
     """Pacific madrone (PILLSBURY (H,D,FC), CHARLES BOLSINGER 1/3/83)
 
     Pillsbury, Norman H. and Michael L. Kirkley. 1984. Equations for Total,
     Wood, and Saw-log Volume for Thirteen California Hardwoods. PNW Research
     Note, PNW-414. Pacific Northwest Research Station, Portland Oregon. 52p.
     """
+    fc_factor = 10**0.37868
+    max_ht = 120
 
     def calc_cvts(self, dbh, ht):
-        cvts = 0.0067322665 * dbh**1.96628 * ht**0.83458
+        cvts = _power_volume((0.0067322665, 1.96628, 0.83458), dbh, ht)
         cvts[np.logical_or(dbh < 1, ht <= 0)] = 0
 
         return cvts
 
     def calc_cv4(self, dbh, ht):
-        cv4 = 0.0025616425 * dbh**1.99295 * ht**1.01532
+        cv4 = _power_volume((0.0025616425, 1.99295, 1.01532), dbh, ht)
         cv4[np.logical_or(dbh < 5, ht <= 0)] = 0
 
         return cv4
 
     def calc_cv8(self, dbh, ht):
-        ff = np.piecewise(dbh,
-                          condlist=[
-                              dbh < 11, (dbh >= 11) & (dbh < 21),
-                              (dbh >= 21) & (dbh < 31),
-                              (dbh >= 31) & (dbh < 41), dbh >= 41
-                          ],
-                          funclist=[95, 86, 82, 79, 79])
-        ff9ft = 100 + (ff - 100) * (9 - 4.5) / (16 - 4.5)
-        diam_9ft = ff9ft / 100.0 * dbh
-        fc = np.where((diam_9ft >= 9) & (ht >= 9), 10, 1)
-
-        cv8 = 0.0006181530 * dbh**1.72635 * ht**1.26462 * fc**0.37868
+        fc_k = _form_class_factor(dbh, ht, (95, 86, 82, 79, 79),
+                                  self.fc_factor)
+        cv8 = _power_volume((0.0006181530, 1.72635, 1.26462), dbh, ht) * fc_k
         cv8[np.logical_or(dbh < 11, ht <= 0)] = 0
 
         return cv8
 
-    def calc_cvt(self, dbh, ht):
-        cvts = self.calc_cvts(dbh, ht)
-        rts = 0.9679 - 0.1051 * 0.5523**(dbh - 1.5)
-
-        cvt = cvts * rts
-        cvt[np.logical_or(dbh < 1, ht <= 0)] = 0
-
-        return cvt
-
-    def calc_tarif(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        cv8 = self.calc_cv8(dbh, ht)
-
-        tarif = (cv8 * 0.912733) / ((0.983 - 0.983 * 0.65**(dbh - 8.6))
-                                    * (ba - 0.087266))
-        tarif[np.logical_or(dbh <= 0, ht <= 0)] = 0
-        return tarif
 
-
-class Eq_41(HardwoodVolumeEquation_WithX):
+class Eq_41(PillsburyVolumeEquation):
     """Oregon white oak (PILLSBURY (H,D,FC), CHARLES BOLSINGER 1/3/83)
 
     Pillsbury, Norman H. and Michael L. Kirkley. 1984. Equations for Total,
     Wood, and Saw-log Volume for Thirteen California Hardwoods. PNW Research
     Note, PNW-414. Pacific Northwest Research Station, Portland Oregon. 52p.
     """
+    fc_factor = 10**0.32652
 
     def calc_cvts(self, dbh, ht):
-        cvts = 0.0072695058 * dbh**2.14321 * ht**0.74220
+        cvts = _power_volume((0.0072695058, 2.14321, 0.74220), dbh, ht)
         cvts[np.logical_or(dbh < 1, ht <= 0)] = 0
 
         return cvts
 
     def calc_cv4(self, dbh, ht):
-        cv4 = 0.0024277027 * dbh**2.25575 * ht**0.87108
+        cv4 = _power_volume((0.0024277027, 2.25575, 0.87108), dbh, ht)
         cv4[np.logical_or(dbh < 5, ht <= 0)] = 0
 
         return cv4
 
     def calc_cv8(self, dbh, ht):
-        ff = np.piecewise(dbh,
-                          condlist=[
-                              dbh < 11, (dbh >= 11) & (dbh < 21),
-                              (dbh >= 21) & (dbh < 31),
-                              (dbh >= 31) & (dbh < 41), dbh >= 41
-                          ],
-                          funclist=[95, 95, 89, 89, 89])
-        ff9ft = 100 + (ff - 100) * (9 - 4.5) / (16 - 4.5)
-        diam_9ft = ff9ft / 100.0 * dbh
-        fc = np.where((diam_9ft >= 9) & (ht >= 9), 10, 1)
-
-        cv8 = 0.0008281647 * dbh**2.10651 * ht**0.91215 * fc**0.32652
+        fc_k = _form_class_factor(dbh, ht, (95, 95, 89, 89, 89),
+                                  self.fc_factor)
+        cv8 = _power_volume((0.0008281647, 2.10651, 0.91215), dbh, ht) * fc_k
         cv8[np.logical_or(dbh < 11, ht <= 0)] = 0
 
         return cv8
 
-    def calc_cvt(self, dbh, ht):
-        cvts = self.calc_cvts(dbh, ht)
-        rts = 0.9679 - 0.1051 * 0.5523**(dbh - 1.5)
-
-        cvt = cvts * rts
-        cvt[np.logical_or(dbh < 1, ht <= 0)] = 0
-
-        return cvt
-
-    def calc_tarif(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        cv8 = self.calc_cv8(dbh, ht)
-
-        tarif = (cv8 * 0.912733) / ((0.983 - 0.983 * 0.65**(dbh - 8.6))
-                                    * (ba - 0.087266))
-        tarif[np.logical_or(dbh <= 0, ht <= 0)] = 0
-        return tarif
 
-
-class Eq_42(HardwoodVolumeEquation_WithX):
+class Eq_42(PillsburyVolumeEquation):
     """Canyon live oak (PILLSBURY (H,D,FC), CHARLES BOLSINGER 1/3/83)
 
     Pillsbury, Norman H. and Michael L. Kirkley. 1984. Equations for Total,
     Wood, and Saw-log Volume for Thirteen California Hardwoods. PNW Research
     Note, PNW-414. Pacific Northwest Research Station, Portland Oregon. 52p.
     """
+    fc_factor = 10**0.43381
 
     def calc_cvts(self, dbh, ht):
-        cvts = 0.0097438611 * dbh**2.20527 * ht**0.61190
+        cvts = _power_volume((0.0097438611, 2.20527, 0.61190), dbh, ht)
         cvts[np.logical_or(dbh < 1, ht <= 0)] = 0
 
         return cvts
 
     def calc_cv4(self, dbh, ht):
-        cv4 = 0.0031670596 * dbh**2.32519 * ht**0.74348
+        cv4 = _power_volume((0.0031670596, 2.32519, 0.74348), dbh, ht)
         cv4[np.logical_or(dbh < 5, ht <= 0)] = 0
 
         return cv4
 
     def calc_cv8(self, dbh, ht):
-        ff = np.piecewise(dbh,
-                          condlist=[
-                              dbh < 11, (dbh >= 11) & (dbh < 21),
-                              (dbh >= 21) & (dbh < 31),
-                              (dbh >= 31) & (dbh < 41), dbh >= 41
-                          ],
-                          funclist=[94, 94, 85, 80, 80])
-        ff9ft = 100 + (ff - 100) * (9 - 4.5) / (16 - 4.5)
-        diam_9ft = ff9ft / 100.0 * dbh
-        fc = np.where((diam_9ft >= 9) & (ht >= 9), 10, 1)
-
-        cv8 = 0.0006540144 * dbh**2.24437 * ht**0.81358 * fc**0.43381
+        fc_k = _form_class_factor(dbh, ht, (94, 94, 85, 80, 80),
+                                  self.fc_factor)
+        cv8 = _power_volume((0.0006540144, 2.24437, 0.81358), dbh, ht) * fc_k
         cv8[np.logical_or(dbh < 11, ht <= 0)] = 0
 
         return cv8
 
-    def calc_cvt(self, dbh, ht):
-        cvts = self.calc_cvts(dbh, ht)
-        rts = 0.9679 - 0.1051 * 0.5523**(dbh - 1.5)
-
-        cvt = cvts * rts
-        cvt[np.logical_or(dbh < 1, ht <= 0)] = 0
-
-        return cvt
-
-    def calc_tarif(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        cv8 = self.calc_cv8(dbh, ht)
-
-        tarif = (cv8 * 0.912733) / ((0.983 - 0.983 * 0.65**(dbh - 8.6))
-                                    * (ba - 0.087266))
-        tarif[np.logical_or(dbh <= 0, ht <= 0)] = 0
-        return tarif
 
-
-class Eq_43(HardwoodVolumeEquation_WithX):
+class Eq_43(PillsburyVolumeEquation):
     """Coast live oak (PILLSBURY (H,D,FC), CHARLES BOLSINGER 1/3/83)
 
     Pillsbury, Norman H. and Michael L. Kirkley. 1984. Equations for Total,
     Wood, and Saw-log Volume for Thirteen California Hardwoods. PNW Research
     Note, PNW-414. Pacific Northwest Research Station, Portland Oregon. 52p.
     """
+    fc_factor = 10**0.43381
 
     def calc_cvts(self, dbh, ht):
-        cvts = 0.0065261029 * dbh**2.31958 * ht**0.62528
+        cvts = _power_volume((0.0065261029, 2.31958, 0.62528), dbh, ht)
         cvts[np.logical_or(dbh < 1, ht <= 0)] = 0
 
         return cvts
 
     def calc_cv4(self, dbh, ht):
-        cv4 = 0.0024574847 * dbh**2.53284 * ht**0.60764
+        cv4 = _power_volume((0.0024574847, 2.53284, 0.60764), dbh, ht)
         cv4[np.logical_or(dbh < 5, ht <= 0)] = 0
 
         return cv4
 
     def calc_cv8(self, dbh, ht):
-        ff = np.piecewise(dbh,
-                          condlist=[
-                              dbh < 11, (dbh >= 11) & (dbh < 21),
-                              (dbh >= 21) & (dbh < 31),
-                              (dbh >= 31) & (dbh < 41), dbh >= 41
-                          ],
-                          funclist=[95, 95, 86, 82, 82])
-        ff9ft = 100 + (ff - 100) * (9 - 4.5) / (16 - 4.5)
-        diam_9ft = ff9ft / 100.0 * dbh
-        fc = np.where((diam_9ft >= 9) & (ht >= 9), 10, 1)
-
-        cv8 = 0.0006540144 * dbh**2.24437 * ht**0.81358 * fc**0.43381
+        fc_k = _form_class_factor(dbh, ht, (95, 95, 86, 82, 82),
+                                  self.fc_factor)
+        cv8 = _power_volume((0.0006540144, 2.24437, 0.81358), dbh, ht) * fc_k
         cv8[np.logical_or(dbh < 11, ht <= 0)] = 0
 
         return cv8
 
-    def calc_cvt(self, dbh, ht):
-        cvts = self.calc_cvts(dbh, ht)
-        rts = 0.9679 - 0.1051 * 0.5523**(dbh - 1.5)
-
-        cvt = cvts * rts
-        cvt[np.logical_or(dbh < 1, ht <= 0)] = 0
-
-        return cvt
-
-    def calc_tarif(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        cv8 = self.calc_cv8(dbh, ht)
-
-        tarif = (cv8 * 0.912733) / ((0.983 - 0.983 * 0.65**(dbh - 8.6))
-                                    * (ba - 0.087266))
-        tarif[np.logical_or(dbh <= 0, ht <= 0)] = 0
-        return tarif
 
-
-class Eq_44(HardwoodVolumeEquation_WithX):
+class Eq_44(PillsburyVolumeEquation):
     """Interior live oak (PILLSBURY (H,D,FC), CHARLES BOLSINGER 1/3/83)
 
     Pillsbury, Norman H. and Michael L. Kirkley. 1984. Equations for Total,
     Wood, and Saw-log Volume for Thirteen California Hardwoods. PNW Research
     Note, PNW-414. Pacific Northwest Research Station, Portland Oregon. 52p.
     """
+    fc_factor = 10**0.43381
 
     def calc_cvts(self, dbh, ht):
-        cvts = 0.0136818837 * dbh**2.02989 * ht**0.63257
+        cvts = _power_volume((0.0136818837, 2.02989, 0.63257), dbh, ht)
         cvts[np.logical_or(dbh < 1, ht <= 0)] = 0
 
         return cvts
 
     def calc_cv4(self, dbh, ht):
-        cv4 = 0.0041192264 * dbh**2.14915 * ht**0.77843
+        cv4 = _power_volume((0.0041192264, 2.14915, 0.77843), dbh, ht)
         cv4[np.logical_or(dbh < 5, ht <= 0)] = 0
 
         return cv4
 
     def calc_cv8(self, dbh, ht):
-        ff = np.piecewise(dbh,
-                          condlist=[
-                              dbh < 11, (dbh >= 11) & (dbh < 21),
-                              (dbh >= 21) & (dbh < 31),
-                              (dbh >= 31) & (dbh < 41), dbh >= 41
-                          ],
-                          funclist=[95, 95, 95, 95, 95])
-        ff9ft = 100 + (ff - 100) * (9 - 4.5) / (16 - 4.5)
-        diam_9ft = ff9ft / 100.0 * dbh
-        fc = np.where((diam_9ft >= 9) & (ht >= 9), 10, 1)
-
-        cv8 = 0.0006540144 * dbh**2.24437 * ht**0.81358 * fc**0.43381
+        fc_k = _form_class_factor(dbh, ht, (95, 95, 95, 95, 95),
+                                  self.fc_factor)
+        cv8 = _power_volume((0.0006540144, 2.24437, 0.81358), dbh, ht) * fc_k
         cv8[np.logical_or(dbh < 11, ht <= 0)] = 0
 
         return cv8
 
-    def calc_cvt(self, dbh, ht):
-        cvts = self.calc_cvts(dbh, ht)
-        rts = 0.9679 - 0.1051 * 0.5523**(dbh - 1.5)
-
-        cvt = cvts * rts
-        cvt[np.logical_or(dbh < 1, ht <= 0)] = 0
-
-        return cvt
-
-    def calc_tarif(self, dbh, ht):
-        ba = 0.005454154 * (dbh**2)
-        cv8 = self.calc_cv8(dbh, ht)
-
-        tarif = (cv8 * 0.912733) / ((0.983 - 0.983 * 0.65**(dbh - 8.6))
-                                    * (ba - 0.087266))
-        tarif[np.logical_or(dbh <= 0, ht <= 0)] = 0
-        return tarif
-
 
 class Eq_45(HardwoodVolumeEquation_WithX):
     """Mountain mahogany (CHOJNACKY, 1985)
@@ -2826,9 +1770,8 @@ class Eq_45(HardwoodVolumeEquation_WithX):
         if stems is None:
             stems = np.ones_like(drc)
         factor = np.where((drc >= 3) & (ht > 0), drc * drc * ht, 1)
-        cvts = np.where(
-            stems > 1, (-0.13363 + (0.128222 * (factor**(1. / 3.))))**3,
-            (-0.13363 + (0.128222 * (factor**(1. / 3.))) + 0.080208)**3)
+        base = -0.13363 + (0.128222 * (factor**(1. / 3.)))
+        cvts = np.where(stems > 1, base**3, (base + 0.080208)**3)
 
         cvts = np.clip(cvts, 0.1, None)
         cvts[np.logical_or(drc < 1, ht <= 0)] = 0
@@ -2847,20 +1790,14 @@ class Eq_46(HardwoodVolumeEquation_WithX):
     def calc_cvts(self, drc, ht, stems=None):
         if stems is None:
             stems = np.ones_like(drc)
+        x = drc * drc * ht / 1000
+        multi = stems > 1
         cvts = np.where(
-            drc**2 * ht / 1000 <= 2,
-            (-0.043 + 2.3378 * drc**2 * ht / 1000 + 0.8024
-             * (drc**2 * ht / 1000)**2),
-            9.586 + 2.3378 * drc**2 * ht / 1000 - 12.839 / (drc**2 * ht / 1000)
-            )
-
-        mask = np.logical_and(stems > 1, (drc**2 * ht / 1000) <= 2)
-        cvts[mask] = (0.020 + 1.8972 * drc[mask]**2 * ht[mask] / 1000 + 0.5756
-                      * (drc[mask]**2 * ht[mask] / 1000)**2)
-
-        mask = np.logical_and(stems > 1, (drc**2 * ht / 1000) > 2)
-        cvts[mask] = (9.586 + 2.3378 * drc[mask]**2 * ht[mask] / 1000 - 12.839
-                      / (drc[mask]**2 * ht[mask] / 1000))
+            x <= 2,
+            np.where(multi, 0.020 + 1.8972 * x + 0.5756 * x * x,
+                     -0.043 + 2.3378 * x + 0.8024 * x * x),
+            np.where(multi, 6.927 + 1.8972 * x - 9.210 / x,
+                     9.586 + 2.3378 * x - 12.839 / x))
 
         cvts = np.clip(cvts, 0.1, None)
         cvts[np.logical_or(drc < 1, ht <= 0)] = 0
@@ -2876,3 +1813,77 @@ ALL_EQNS = [
     Eq_36, Eq_37, Eq_38, Eq_39, Eq_40, Eq_41, Eq_42, Eq_43, Eq_44,
     Eq_45, Eq_46
 ]
+
+# volume equations keyed on the equation number used in the ARB tables
+VOLUME_EQUATIONS = {
+    1: Eq_1, 2: Eq_2, 3: Eq_3, 4: Eq_4, 5: Eq_5, 6: Eq_6, 7: Eq_7, 8: Eq_8,
+    9: Eq_9, 10: Eq_10, 11: Eq_11, 12: Eq_12, 13: Eq_13, 14: Eq_14,
+    14.1: Eq_14_1, 14.2: Eq_14_2, 15: Eq_15, 16: Eq_16, 17: Eq_17,
+    18: Eq_18, 19: Eq_19, 20: Eq_20, 21: Eq_21, 22: Eq_22, 23: Eq_23,
+    24: Eq_24, 25: Eq_25, 26: Eq_26, 27: Eq_27, 28: Eq_28, 29: Eq_29,
+    30: Eq_30, 31: Eq_31, 32: Eq_32, 33: Eq_33, 34: Eq_34, 35: Eq_35,
+    36: Eq_36, 37: Eq_37, 38: Eq_38, 39: Eq_39, 40: Eq_40, 41: Eq_41,
+    42: Eq_42, 43: Eq_43, 44: Eq_44, 45: Eq_45, 46: Eq_46
+}
+
+
+def batch_volume(dbh, ht, eq_num, metric='CVTS', max_workers=None):
+    """Calculates volume for a set of trees that use different volume
+    equations.
+
+    Trees are grouped by equation number so that each volume equation is
+    evaluated once, over all the trees assigned to it. The groups are
+    independent, so they can optionally be evaluated in parallel threads;
+    NumPy releases the GIL inside its array operations, which lets large
+    groups run concurrently.
+
+    Parameters
+    ----------
+    dbh : array of numerics
+      diameter at breast height, in inches
+    ht : array of numerics
+      total tree height, in feet
+    eq_num : array of numerics
+      ARB volume equation number for each tree, e.g., 3 or 14.1
+    metric : str
+      volume metric to calculate, see `VolumeEquation.calc_vol` for options
+    max_workers : int, optional
+      number of threads used to evaluate the equations; by default (or if 1)
+      the equations are evaluated one after another in the calling thread
+
+    Returns
+    -------
+    vol : array of numerics
+      the requested volume metric for each tree
+    """
+    dbh = _as_float_array(dbh)
+    shape = dbh.shape
+    dbh = dbh.ravel()
+    ht = _as_float_array(ht).ravel()
+    eq_num = np.asarray(eq_num).ravel()
+
+    # sort trees once so that each equation works on a contiguous slice
+    order = np.argsort(eq_num, kind='stable')
+    nums, starts = np.unique(eq_num[order], return_index=True)
+    ends = np.append(starts[1:], order.size)
+    dbh_sorted = dbh[order]
+    ht_sorted = ht[order]
+
+    def calc_group(group):
+        num, start, end = group
+        return VOLUME_EQUATIONS[num]().calc_vol(dbh_sorted[start:end],
+                                                ht_sorted[start:end],
+                                                metric=metric)
+
+    groups = list(zip(nums, starts, ends))
+    if max_workers is not None and max_workers > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            group_vols = list(executor.map(calc_group, groups))
+    else:
+        group_vols = [calc_group(group) for group in groups]
+
+    vol = np.zeros(dbh.shape, dtype=dbh.dtype)
+    for (num, start, end), group_vol in zip(groups, group_vols):
+        vol[order[start:end]] = group_vol
+
+    return vol.reshape(shape)
@@ -0,0 +1,160 @@
+"""
+Tests for scripts/FPS2ARB.py, run on a small DBHCLS and ADMIN export
+"""
+import glob
+import math
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+SCRIPTS_DIR = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), '..', '..', 'scripts'))
+sys.path.insert(0, SCRIPTS_DIR)
+
+import ARB_Equation_Assignments as assignments  # noqa: E402
+
+DBHCLS = """STD_ID,RPT_YR,PlotTree,GRP,SPECIES,TREES,DBH,HEIGHT,CROWN
+1,2016,101,..,DF,12.5,14.2,96,40
+1,2016,102,..,WH,8.0,9.1,70,35
+1,2016,103,.R,RA,4.0,11.3,62,30
+1,2016,104,.D,DF,2.0,10.0,50,0
+2,2016,201,..,BM,3.0,18.0,75,45
+2,2016,202,..,ZZ,1.0,6.0,30,20
+2,2017,201,..,DF,3.0,4.0,25,45
+3,2016,301,..,DF,5.0,20.0,110,50
+"""
+
+ADMIN = """STD_ID,RPT_YR,MSMT_YR,Property,AREA_GIS,AREA_RPT,OWNER
+1,2016,2015,Alpha,10.5,10.0,x
+2,2016,2015,Alpha,4.2,4.0,x
+3,2016,2014,Beta,7.0,7.1,y
+"""
+
+
+class TestFPS2ARB(unittest.TestCase):
+    """Tests that run FPS2ARB from the command line."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.workdir = tempfile.TemporaryDirectory()
+        cwd = cls.workdir.name
+        for xlsx in ['ARB_Volume_and_Biomass_Tables.xlsx',
+                     'Your_species_codes.xlsx']:
+            shutil.copy(os.path.join(SCRIPTS_DIR, xlsx), cwd)
+        with open(os.path.join(cwd, 'DBHCLS.csv'), 'w') as f:
+            f.write(DBHCLS)
+        with open(os.path.join(cwd, 'ADMIN.csv'), 'w') as f:
+            f.write(ADMIN)
+
+        # keep cached tables out of the user's folders
+        env = dict(os.environ, ARB_CACHE_DIR=cwd)
+        cls.default_cache_dir = assignments.CACHE_DIR
+        assignments.CACHE_DIR = cwd
+        cls.fps2arb = subprocess.run(
+            [sys.executable, os.path.join(SCRIPTS_DIR, 'FPS2ARB.py'),
+             '--property', 'Alpha', '--year', '2016', '--region', 'WOR'],
+            cwd=cwd, env=env, capture_output=True, text=True)
+        outputs = glob.glob(os.path.join(cwd, 'FPS2ARB_Outputs', '*.csv'))
+        eq_cols = {'Vol_Eq': str, 'BarkBio_Eq': str, 'BranchBio_Eq': str}
+        # some species have no equation assigned, written as 'None'
+        cls.trees = (pd.read_csv(outputs[0], dtype=eq_cols,
+                                 keep_default_na=False, na_values=[''])
+                     if len(outputs) == 1 else None)
+
+    @classmethod
+    def tearDownClass(cls):
+        assignments.CACHE_DIR = cls.default_cache_dir
+        cls.workdir.cleanup()
+
+    def test_writes_property(self):
+        '''
+        Tests whether FPS2ARB runs and writes one CSV holding every tree of
+        the requested property and year.
+        '''
+        self.assertEqual(self.fps2arb.returncode, 0, self.fps2arb.stderr)
+        self.assertIsNotNone(self.trees)
+        self.assertEqual(sorted(self.trees['PlotTree']),
+                         [101, 102, 103, 104, 201, 202])
+
+    def test_reads_needed_columns(self):
+        '''
+        Tests whether FPS2ARB reads the DBHCLS and ADMIN columns it needs,
+        whatever their order in the exports, and leaves out the rest.
+        '''
+        self.assertNotIn('CROWN', self.trees.columns)
+        self.assertNotIn('OWNER', self.trees.columns)
+        self.assertNotIn('MSMT_YR', self.trees.columns)
+        tree = self.trees.loc[self.trees['PlotTree'] == 101].iloc[0]
+        self.assertEqual((tree.STD_ID, tree.RPT_YR, tree.Property),
+                         (1, 2016, 'Alpha'))
+        self.assertEqual((tree.AREA_GIS, tree.AREA_RPT), (10.5, 10.0))
+
+    def test_live_tree_values(self):
+        '''
+        Tests whether the volume and biomass of each live tree match the
+        equations assigned to its species, calculated one tree at a time.
+        '''
+        species_classes, _ = assignments.load_species(
+            os.path.join(self.workdir.name, 'Your_species_codes.xlsx'),
+            os.path.join(self.workdir.name,
+                         'ARB_Volume_and_Biomass_Tables.xlsx'))
+        live = self.trees.loc[self.trees['PlotTree'].isin([101, 102, 103,
+                                                           201])]
+        self.assertEqual(len(live), 4)
+
+        for tree in live.itertuples():
+            spp = species_classes[tree.SPECIES]
+            msg = f'{tree.SPECIES} tree {tree.PlotTree}'
+            DBH_cm, HT_m = tree.DBH * 2.54, tree.HEIGHT * 0.3048
+            CVTS = spp.WOR_VOL().calc(tree.DBH, tree.HEIGHT, 'CVTS')
+            self.assertAlmostEqual(tree.CVTS_ft3, CVTS, msg=msg)
+            BF_metric = 'SV816' if spp.wood_type == 'HW' else 'SV632'
+            BF = spp.WOR_VOL().calc(tree.DBH, tree.HEIGHT, BF_metric)
+            self.assertAlmostEqual(tree.Scrib_BF, BF, msg=msg)
+            self.assertEqual(tree.Vol_Eq, spp.WOR_VOL.__name__.split('_')[1])
+            self.assertEqual(tree.BarkBio_Eq,
+                             spp.WOR_BB.__name__.split('_')[1])
+            self.assertEqual(tree.BranchBio_Eq,
+                             spp.WOR_BLB.__name__.split('_')[1])
+            bark = assignments.check_BB(DBH_cm, HT_m, spp.wood_dens,
+                                        spp.WOR_BB)
+            self.assertAlmostEqual(tree.Bark_biomass_kg, bark, msg=msg)
+            branch = assignments.check_BLB(DBH_cm, HT_m, spp.WOR_BLB)
+            self.assertAlmostEqual(tree.Branch_biomass_kg, branch, msg=msg)
+            below = math.exp(-1.085 + 0.9256 *
+                             math.log(tree.Aboveground_biomass_kg))
+            self.assertAlmostEqual(tree.Belowground_biomass_kg, below,
+                                   msg=msg)
+
+    def test_dead_and_unknown_trees(self):
+        '''
+        Tests whether dead trees and trees of species missing from the
+        crosswalk are written without carbon.
+        '''
+        skipped = self.trees.loc[self.trees['PlotTree'].isin([104, 202])]
+        self.assertEqual(len(skipped), 2)
+        self.assertTrue(np.isnan(skipped['LiveTree_carbon_tCO2e']).all())
+        self.assertTrue(np.isnan(skipped['Scrib_BF']).all())
+
+    def test_cairns_array(self):
+        '''
+        Tests whether belowground biomass calculated for an array of trees,
+        as FPS2ARB does, matches the biomass calculated one tree at a time.
+        '''
+        agb = np.array([-5.0, 0.0, 0.001, 1.0, 12.7, 300.0, 5e4])
+        below = assignments.cairns(agb)
+        self.assertIsInstance(below, np.ndarray)
+        for i, tree_agb in enumerate(agb):
+            self.assertEqual(below[i], assignments.cairns(tree_agb))
+        self.assertEqual(assignments.cairns(0), 0)
+        self.assertIsInstance(assignments.cairns(12.7), float)
+
+
+if __name__ == '__main__':
+    unittest.main()
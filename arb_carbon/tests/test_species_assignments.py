@@ -0,0 +1,110 @@
+"""
+Tests for scripts/ARB_Equation_Assignments.py, run against the workbooks
+shipped in scripts/
+"""
+import os
+import sys
+import tempfile
+import unittest
+
+import pandas as pd
+
+SCRIPTS_DIR = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), '..', '..', 'scripts'))
+sys.path.insert(0, SCRIPTS_DIR)
+
+import ARB_Equation_Assignments as assignments  # noqa: E402
+
+ARB_XLSX = os.path.join(SCRIPTS_DIR, 'ARB_Volume_and_Biomass_Tables.xlsx')
+USER_XLSX = os.path.join(SCRIPTS_DIR, 'Your_species_codes.xlsx')
+
+
+class TestSpeciesAssignments(unittest.TestCase):
+    """Tests that load equation assignments from the shipped workbooks."""
+
+    def setUp(self):
+        # keep cached tables out of the user's folders
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.cache_dir.cleanup)
+        self.default_cache_dir = assignments.CACHE_DIR
+        assignments.CACHE_DIR = self.cache_dir.name
+        self.addCleanup(setattr, assignments, 'CACHE_DIR',
+                        self.default_cache_dir)
+
+    def test_load_shipped_workbook(self):
+        '''
+        Tests whether the ARB workbook loads with one row per FIA code, and
+        whether all species in the shipped crosswalk get a Species.
+        '''
+        attrs = assignments.load_arb_attributes(ARB_XLSX)
+        self.assertTrue(attrs.index.is_unique)
+
+        species_classes, _ = assignments.load_species(USER_XLSX, ARB_XLSX)
+        self.assertEqual(len(species_classes), 17)
+
+    def test_cache_version(self):
+        '''
+        Tests whether tables cached by an older version of the code are
+        rebuilt rather than reused.
+        '''
+        assignments.load_arb_attributes(ARB_XLSX)
+        assignments.load_arb_attributes(ARB_XLSX)
+        self.assertEqual(len(os.listdir(self.cache_dir.name)), 1)
+
+        default_version = assignments.CACHE_VERSION
+        self.addCleanup(setattr, assignments, 'CACHE_VERSION',
+                        default_version)
+        assignments.CACHE_VERSION = default_version + 1
+        attrs = assignments.load_arb_attributes(ARB_XLSX)
+        self.assertEqual(len(os.listdir(self.cache_dir.name)), 2)
+        self.assertTrue(attrs.index.is_unique)
+
+    def test_split_bark_equations(self):
+        '''
+        Tests whether Redwood and Giant Sequoia, which ARB lists twice in the
+        bark table, get a bark equation that switches at 39.37 inches DBH.
+        '''
+        attrs = assignments.load_arb_attributes(ARB_XLSX)
+        split = assignments.resolve_equations(attrs.loc[[211, 212]].copy())
+
+        for code in [211, 212]:
+            BB = split.loc[code, 'WOR_BB']
+            self.assertEqual(BB.__name__, 'BB_13|17')
+            self.assertEqual(BB(99.9, 30.0, 25.0),
+                             assignments.BB_13(99.9, 30.0, 25.0))
+            self.assertEqual(BB(100.1, 30.0, 25.0),
+                             assignments.BB_17(100.1, 30.0, 25.0))
+        # no bark equation is assigned to Giant Sequoia in western Washington
+        self.assertIs(split.loc[212, 'WWA_BB'], assignments.BB_None)
+
+    def test_species_match_ARB_tables(self):
+        '''
+        Tests whether each species in a crosswalk that includes Redwood and
+        Giant Sequoia gets the equations and wood specs listed for its FIA
+        code in the shipped ARB workbook.
+        '''
+        crosswalk = pd.read_excel(USER_XLSX, 'Crosswalk')
+        crosswalk = pd.concat([crosswalk, pd.DataFrame({
+            'Your_species_code': ['RW', 'GS'],
+            'FIA_code': [211, 212],
+            'Common_name': ['Redwood', 'Giant sequoia'],
+            'Wood_type': ['SW', 'SW']})], ignore_index=True)
+        user_xlsx = os.path.join(self.cache_dir.name, 'crosswalk.xlsx')
+        crosswalk.to_excel(user_xlsx, sheet_name='Crosswalk', index=False)
+
+        species_classes, attrs = assignments.load_species(user_xlsx,
+                                                          ARB_XLSX)
+        self.assertEqual(len(species_classes), 19)
+
+        for user_code, spp in species_classes.items():
+            expected = assignments.resolve_equations(
+                attrs.loc[[spp.code]].copy()).iloc[0]
+            self.assertEqual(spp.wood_dens, expected['Wood_density'])
+            for col in assignments.EQ_COLS:
+                msg = f'{user_code} has the wrong {col}'
+                self.assertEqual(getattr(spp, col).__name__,
+                                 expected[col].__name__, msg)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,7 +4,9 @@ Tests for arb_carbon/equations/volume.py
 import unittest
 import numpy as np
 
-from arb_carbon.equations.volume import ALL_EQNS
+from arb_carbon.equations.volume import (ALL_EQNS, VOLUME_EQUATIONS,
+                                         HardwoodVolumeEquation,
+                                         batch_volume)
 
 
 def graph_equations(metrics=['CVTS']):
@@ -67,6 +69,154 @@ class TestVolumeEqs(unittest.TestCase):
                     msg = f'{name} produced negative values for {metric}'
                     self.assertTrue((vols < 0).sum() == 0, msg)
 
+    def test_scalar_matches_array(self, metrics=['CVTS', 'CVT', 'CV4']):
+        '''
+        Tests whether volume equations return the same values for a tree
+        whether it is passed alone as a scalar or as part of an array.
+
+        Parameters
+        ----------
+        metrics : list-like
+          list with strings indicating the metric(s) should be tested.
+        '''
+        dbhs = np.array([1, 4.5, 5, 6, 12.3, 40])
+        hts = np.array([10, 25, 40, 35.5, 80, 210])
+
+        for metric in metrics:
+            for eqn in ALL_EQNS[:13]:
+                name = eqn.__name__
+                vols = eqn().calc_vol(dbhs, hts, metric=metric)
+                for i, (dbh, ht) in enumerate(zip(dbhs, hts)):
+                    vol = eqn().calc_vol(float(dbh), float(ht), metric=metric)
+                    msg = f'{name} scalar and array {metric} differ'
+                    self.assertAlmostEqual(vol[0], vols[i], msg=msg)
+
+    def test_batch_matches_single(self, metrics=['CVTS', 'CVT']):
+        '''
+        Tests whether calculating volume for a mix of equations in one batch
+        gives the same values as calling each equation on its own trees.
+
+        Parameters
+        ----------
+        metrics : list-like
+          list with strings indicating the metric(s) should be tested.
+        '''
+        rng = np.random.default_rng(42)
+        nums = [1, 3, 5, 6, 16, 25, 37]
+        eq_num = rng.choice(nums, size=500)
+        dbhs = rng.uniform(0, 60, size=500)
+        hts = rng.uniform(0, 200, size=500)
+
+        for metric in metrics:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                vols = batch_volume(dbhs, hts, eq_num, metric=metric)
+                for num in nums:
+                    mask = eq_num == num
+                    expected = VOLUME_EQUATIONS[num]().calc_vol(
+                        dbhs[mask], hts[mask], metric=metric)
+                    np.testing.assert_allclose(vols[mask], expected)
+
+    def test_batch_threads_match_serial(self, metrics=['CVTS', 'CVT']):
+        '''
+        Tests whether evaluating the equations of a batch in several threads
+        gives the same values as evaluating them one after another.
+
+        Parameters
+        ----------
+        metrics : list-like
+          list with strings indicating the metric(s) should be tested.
+        '''
+        rng = np.random.default_rng(7)
+        eq_num = rng.choice([1, 3, 5, 6, 16, 25, 32, 40], size=500)
+        dbhs = rng.uniform(1, 60, size=500)
+        hts = rng.uniform(5, 200, size=500)
+
+        for metric in metrics:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                serial = batch_volume(dbhs, hts, eq_num, metric=metric)
+                threaded = batch_volume(dbhs, hts, eq_num, metric=metric,
+                                        max_workers=4)
+            np.testing.assert_array_equal(threaded, serial)
+
+    def test_height_cap(self, metrics=['CVTS', 'CV8', 'TARIF']):
+        '''
+        Tests whether equations that cap tree height give trees taller than
+        the cap the same volume as trees at the cap.
+
+        Parameters
+        ----------
+        metrics : list-like
+          list with strings indicating the metric(s) should be tested.
+        '''
+        dbhs = np.array([6, 12.3, 40])
+
+        for metric in metrics:
+            for eqn in ALL_EQNS:
+                if eqn.max_ht is None:
+                    continue
+                name = eqn.__name__
+                at_cap = eqn().calc_vol(dbhs, np.full(3, eqn.max_ht), metric)
+                above = eqn().calc_vol(dbhs, np.full(3, eqn.max_ht + 50.0),
+                                       metric)
+                msg = f'{name} {metric} is not capped at {eqn.max_ht} ft'
+                np.testing.assert_allclose(above, at_cap, err_msg=msg)
+
+    def test_hardwood_boardfoot_increases(
+            self, metrics=['SV616', 'SV816', 'XINT6', 'XINT8']):
+        '''
+        Tests whether hardwood boardfoot volumes increase with diameter for
+        trees of the same height.
+
+        Parameters
+        ----------
+        metrics : list-like
+          list with strings indicating the metric(s) should be tested.
+        '''
+        dbhs = np.arange(12, 42, 2.0)
+        hts = np.full(dbhs.shape, 90.0)
+
+        for metric in metrics:
+            for eqn in ALL_EQNS:
+                if not issubclass(eqn, HardwoodVolumeEquation):
+                    continue
+                name = eqn.__name__
+                try:
+                    vols = eqn().calc_vol(dbhs, hts, metric=metric)
+                except NotImplementedError:
+                    continue
+                msg = f'{name} {metric} does not increase with dbh'
+                self.assertTrue((np.diff(vols) > 0).all(), msg)
+
+    def test_float32(self, metrics=['CVTS', 'CVT', 'CV4']):
+        '''
+        Tests whether cubic volumes calculated from float32 inputs stay within
+        0.1% of those calculated from float64 inputs, for every equation that
+        implements the metric.
+
+        Parameters
+        ----------
+        metrics : list-like
+          list with strings indicating the metric(s) should be tested.
+        '''
+        dbhs = np.arange(1, 100, 0.5)
+        hts = np.arange(5, 300, 2.5)
+        x, y = np.meshgrid(dbhs, hts)
+        x, y = x.ravel(), y.ravel()
+
+        for metric in metrics:
+            for eqn in ALL_EQNS:
+                name = eqn.__name__
+                try:
+                    vols = eqn().calc_vol(x, y, metric=metric)
+                except NotImplementedError:
+                    continue
+                vols32 = eqn().calc_vol(x.astype(np.float32),
+                                        y.astype(np.float32),
+                                        metric=metric)
+                msg = f'{name} float32 {metric} differs from float64'
+                np.testing.assert_allclose(vols32, vols, rtol=1e-3,
+                                           atol=1e-3, err_msg=msg)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -7,6 +7,7 @@
 # http://www.arb.ca.gov/cc/capandtrade/protocols/usforest/2015/biomass.equations.ca.or.wa.pdf
 
 import math
+import numpy as np
 
 # BARK EQUATIONS
 # All equations produce Biomass of Bark in Kilograms --- to convert to tons multiply by 0.0011023
@@ -203,6 +204,20 @@ def BB_39(DBH, HT, wood_density): # BIOPAK EQUATION 936
     return -1.2 + 24.0 * (DBH/100)**2 * HT
 
 
+def split_bark_eqn(small_BB, large_BB, max_small_DBH = 100.0):
+    '''
+    Combines two bark equations into one that uses small_BB for trees with DBH up to max_small_DBH (cm)
+    and large_BB for larger trees. ARB assigns Redwood and Giant Sequoia one bark equation up to
+    39.37 inches (100 cm) DBH and another above it.
+    '''
+    def BB_split(DBH, HT = None, wood_density = None):
+        if DBH > max_small_DBH:
+            return large_BB(DBH, HT, wood_density)
+        return small_BB(DBH, HT, wood_density)
+    BB_split.__name__ = small_BB.__name__ + '|' + large_BB.__name__.split('_', 1)[1] # e.g., BB_13|17
+    return BB_split
+
+
 # LIVE BRANCH BIOMASS EQUATIONS
 # All equations produce Biomass of Live Branches in Kilograms --- to convert to tons multiply by 0.0011023
 
@@ -360,8 +375,11 @@ def cairns(aboveground_biomass):
     Derived from "Equation 1" in Cairns, Brown, Helmer & Baumgardner (1997), available online at
     http://www.arb.ca.gov/cc/capandtrade/protocols/usforest/references/cairns1997.pdf
     Aboveground biomass expected in units of kg, and returns units of kg.
+    Accepts a single value or an array of values, and returns the same.
     '''
-    if aboveground_biomass <= 0:
-        return 0
-    else:
-        return math.exp(-1.085 +  0.9256 * math.log(aboveground_biomass)) # note that math.log is natural log
+    agb = np.asarray(aboveground_biomass, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'): # trees without biomass are set to 0 below
+        bgb = np.where(agb <= 0, 0.0, np.exp(-1.085 +  0.9256 * np.log(agb))) # note that np.log is natural log
+    if bgb.ndim == 0:
+        return float(bgb)
+    return bgb
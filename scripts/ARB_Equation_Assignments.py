@@ -1,7 +1,16 @@
 from ARB_Volume_Equations import *
 from ARB_Biomass_Equations import *
+import hashlib
+import os
+import openpyxl
 import pandas as pd
 
+# lookup tables of equations keyed on their number, e.g. EQ_TABLE['141'] is Eq_141
+EQ_TABLE = {k[3:]: v for k, v in globals().items() if k.startswith('Eq_')}
+BB_TABLE = {k[3:]: v for k, v in globals().items() if k.startswith('BB_')}
+BLB_TABLE = {k[4:]: v for k, v in globals().items() if k.startswith('BLB_')}
+TABLES = {'VOL': EQ_TABLE, 'BB': BB_TABLE, 'BLB': BLB_TABLE}
+
 
 # The volume equations were translated from the PDF availabe on the ARB website:
 # http://www.arb.ca.gov/cc/capandtrade/protocols/usforest/usforestprojects_2015.htm
@@ -9,162 +18,248 @@ import pandas as pd
 # http://www.arb.ca.gov/cc/capandtrade/protocols/usforest/2015/volume.equations.ca.or.wa.pdf
 
 
-def check_for_None(equation_number):
-    eqn = str(equation_number)
-    if eqn == '--':
-        return None
-    elif '.' in eqn:
-        return eqn.replace('.','')
-    else:
-        return eqn
+REGIONS = ('WOR', 'WWA', 'EOR', 'EWA', 'CA')
+
+# columns holding the equation assignments for each region
+EQ_COLS = tuple(region + suffix for suffix in ('_VOL', '_BB', '_BLB') for region in REGIONS)
+
+
+def normalize_equation_numbers(df, columns=EQ_COLS):
+    '''
+    Converts the equation numbers in the given columns into keys of the equation lookup tables,
+    e.g., 14.1 becomes '141' and '--' (no equation assigned by ARB) becomes 'None'.
+    The keys are stored as categoricals.
+    '''
+    columns = list(columns)
+    codes = df[columns].astype('string').apply(
+        lambda col: col.str.replace(r'\.0$', '', regex=True).str.replace('.', '', regex=False))
+    # only a few dozen equations exist, so store the keys as categoricals
+    df[columns] = codes.replace('--', 'None').astype('category')
+    return df
+
+
+def resolve_equations(df, columns=EQ_COLS):
+    '''
+    Replaces the equation keys in the given columns with the equations they refer to,
+    looked up in the table matching the column suffix (e.g., EQ_TABLE for WOR_VOL).
+    Keys without a matching equation become None.
+    Bark keys naming two equations, e.g., '13|17' (see combine_split_bark), become one equation choosing between them by DBH.
+    '''
+    for col in columns:
+        table = TABLES[col.rsplit('_', 1)[1]]
+        split_keys = [key for key in df[col].dropna().unique() if '|' in key]
+        if split_keys:
+            table = dict(table, **{key: split_bark_eqn(*(table[k] for k in key.split('|'))) for key in split_keys})
+        equations = df[col].map(table)
+        df[col] = equations.astype(object).where(equations.notna(), None)
+    return df
 
 
 # Create a class that holds the equations and related attributes to be used for each species.
 class Species:
-    def __init__(self, FIAcode, common_name, wood_type):
+    __slots__ = ('code', 'common_name', 'wood_type', 'spec_grav', 'wood_dens') + EQ_COLS
+
+    def __init__(self, FIAcode, common_name, wood_type, spec_grav, wood_dens, *equations):
         '''
         Instantiates the class to hold various attributes of a tree species.
+        The equations are given in EQ_COLS order, already resolved by resolve_equations.
         '''
         self.code = FIAcode # Numerical species code used by USFS FIA Program
         self.common_name = common_name # Common_name of the species
         self.wood_type = wood_type # Hardwood or Softwood (as "HW" or "SW")
-
-    def add_vols(self, WOR, WWA, EOR, EWA, CA):
-        '''
-        Adds cubic volume equation assignments for each region to the Species class
-        '''
-        self.WOR_VOL = eval("Eq_"+str(check_for_None(WOR)))
-        self.WWA_VOL = eval("Eq_"+str(check_for_None(WWA)))
-        self.EOR_VOL = eval("Eq_"+str(check_for_None(EOR)))
-        self.EWA_VOL = eval("Eq_"+str(check_for_None(EWA)))
-        self.CA_VOL = eval("Eq_"+str(check_for_None(CA)))
-
-    def add_wood_specs(self, spec_grav, wood_dens):
-        '''
-        Adds specific gravity and wood density to the Species class
-        '''
         self.spec_grav = spec_grav
         self.wood_dens = wood_dens
 
-    def add_bark(self, WOR, WWA, EOR, EWA, CA):
-        '''
-        Adds bark biomass equation assignments for each region to the Species class
-        '''
-        self.WOR_BB = eval("BB_"+str(check_for_None(WOR)))
-        self.WWA_BB = eval("BB_"+str(check_for_None(WWA)))
-        self.EOR_BB = eval("BB_"+str(check_for_None(EOR)))
-        self.EWA_BB = eval("BB_"+str(check_for_None(EWA)))
-        self.CA_BB = eval("BB_"+str(check_for_None(CA)))
+        # cubic volume, bark biomass, and live branch biomass equations for each region
+        for col, equation in zip(EQ_COLS, equations):
+            setattr(self, col, equation)
 
-    def add_branch(self, WOR, WWA, EOR, EWA, CA):
-        '''
-        Adds live branch biomass equation assignments for each region to the Species class
-        '''
-        self.WOR_BLB = eval("BLB_"+str(check_for_None(WOR)))
-        self.WWA_BLB = eval("BLB_"+str(check_for_None(WWA)))
-        self.EOR_BLB = eval("BLB_"+str(check_for_None(EOR)))
-        self.EWA_BLB = eval("BLB_"+str(check_for_None(EWA)))
-        self.CA_BLB = eval("BLB_"+str(check_for_None(CA)))
 
+# sheets of the ARB workbook that describe which equations and wood parameters are required by ARB
+ARB_SHEETS = ('SW_Volume_equations', 'HW_Volume_equations',
+              'SW_Wood_specs', 'HW_Wood_specs',
+              'SW_Bark_biomass', 'HW_Bark_biomass',
+              'SW_LiveBranch_biomass', 'HW_LiveBranch_biomass')
 
-# read in the species codes provided by the user
-# includes the user's code, the FIA code, and the common_name
-species_crosswalk = pd.read_excel("Your_species_codes.xlsx", "Crosswalk")
-species_used = species_crosswalk.dropna() # ignore species the user didn't provide in the crosswalk table
+
+def combine_split_bark(BB, columns=tuple(col for col in EQ_COLS if col.endswith('_BB'))):
+    '''
+    ARB lists Redwood (211) and Giant Sequoia (212) twice in the softwood bark table, once for trees up to
+    39.37 inches DBH and once for larger trees, telling the rows apart by Common_name, e.g.,
+    'Redwood (when DBH <= 39.37 inches)'. Collapses each such pair into a single row for the FIA_code.
+    Where the two rows assign different equations, the key names both, small trees first, e.g., '13|17'.
+    '''
+    paired = BB.index.duplicated(keep=False)
+    if not paired.any():
+        return BB
+
+    BB = normalize_equation_numbers(BB, columns)
+    is_small = BB['Common_name'].str.contains('<=', regex=False)
+    small, large = BB[paired & is_small], BB[paired & ~is_small]
+    if not (small.index.is_unique and large.index.is_unique and set(small.index) == set(large.index)):
+        raise ValueError('Expected one row up to and one row above 39.37 inches DBH for FIA codes {} in the bark tables'
+                         .format(sorted(set(BB.index[paired]))))
+
+    large = large.loc[small.index]
+    combined = small.copy()
+    for col in columns:
+        small_keys, large_keys = small[col].astype(str), large[col].astype(str)
+        combined[col] = small_keys.where(small_keys == large_keys, small_keys + '|' + large_keys)
+    return pd.concat([BB[~paired], combined])
+
+
+def load_sheets(path, sheets, index_col='FIA_code'):
+    '''
+    Reads several sheets from an Excel workbook, opening and streaming through the file only once.
+    Returns a dictionary of DataFrames keyed by sheet name.
+    '''
+    wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        tables = {}
+        for sheet in sheets:
+            rows = wb[sheet].iter_rows(values_only=True)
+            header = next(rows)
+            df = pd.DataFrame(rows, columns=header).dropna(how='all') # skip blank rows, like read_excel
+            tables[sheet] = df.set_index(index_col)
+    finally:
+        wb.close()
+    return tables
 
 
-# read in the tables that describe which equations and wood parameters are required by ARB
-with pd.ExcelFile('ARB_Volume_and_Biomass_Tables.xlsx') as xlsx:
-    SW_VOL = pd.read_excel(xlsx, 'SW_Volume_equations', index_col= 'FIA_code')
-    HW_VOL = pd.read_excel(xlsx, 'HW_Volume_equations', index_col= 'FIA_code')
-    VOL = pd.concat([SW_VOL, HW_VOL]) # concatenate all volume equation assignments
+# folder holding tables read from the workbooks by read_cached
+# set the ARB_CACHE_DIR environment variable to use another folder, or to an empty string to turn caching off
+CACHE_DIR = os.environ.get('ARB_CACHE_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), '.arbcache'))
 
-    SW_Wood = pd.read_excel(xlsx, 'SW_Wood_specs', index_col= 'FIA_code').drop('Common_name', axis=1)
-    HW_Wood = pd.read_excel(xlsx, 'HW_Wood_specs', index_col= 'FIA_code').drop('Common_name', axis=1)
-    Wood = pd.concat([SW_Wood, HW_Wood]) # concatenate all wood specifications
+# change whenever the tables built from the workbooks change (e.g., how equation numbers are normalized),
+# so copies cached by older code are not used
+CACHE_VERSION = 1
 
-    VOL_Wood = pd.merge(VOL, Wood, left_index = True, right_index = True) # merge (outer join) volume equation assignments and wood specs on FIA_code
 
-    SW_BB = pd.read_excel(xlsx, 'SW_Bark_biomass', index_col= 'FIA_code').drop('Common_name', axis=1)
-    HW_BB = pd.read_excel(xlsx, 'HW_Bark_biomass', index_col= 'FIA_code').drop('Common_name', axis=1)
-    BB = pd.concat([SW_BB, HW_BB]) # concatenate all bark biomass equation assigments
+def read_cached(build, path, *args):
+    '''
+    Returns build(path, *args), a table read from the workbook at path, pickled in CACHE_DIR so later runs skip
+    reading the workbook. The copy is keyed on the function, its arguments, the workbook's modification time,
+    CACHE_VERSION and the pandas version, so it is rebuilt whenever any of these change.
+    '''
+    if not CACHE_DIR:
+        return build(path, *args)
+
+    path = os.path.abspath(path)
+    key = repr((build.__module__, build.__name__, path, args, os.path.getmtime(path), CACHE_VERSION, pd.__version__))
+    cache = os.path.join(CACHE_DIR, hashlib.sha1(key.encode()).hexdigest() + '.pkl')
+    if os.path.exists(cache):
+        return pd.read_pickle(cache)
 
-    SW_BLB = pd.read_excel(xlsx, 'SW_LiveBranch_biomass', index_col= 'FIA_code').drop('Common_name', axis=1)
-    HW_BLB = pd.read_excel(xlsx, 'HW_LiveBranch_biomass', index_col= 'FIA_code').drop('Common_name', axis=1)
-    BLB = pd.concat([SW_BLB, HW_BLB]) # concatenate all live branch biomass equation assignments
+    table = build(path, *args)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        pd.to_pickle(table, cache)
+    except OSError: # e.g., the folder is read-only, so just skip caching
+        pass
+    return table
 
-    BB_BLB = pd.merge(BB, BLB, left_index = True, right_index = True) # merge (outer join) bark and branch equation assignments on FIA_code
 
-# merge all these into a single dataframe
-ARB_species_attributes = pd.merge(VOL_Wood, BB_BLB, left_index = True, right_index = True)
+def load_arb_tables(path='ARB_Volume_and_Biomass_Tables.xlsx'):
+    '''
+    Reads the ARB equation assignment and wood specification tables.
+    '''
+    return load_sheets(path, ARB_SHEETS)
 
 
-# create a dictionary that will hold all species provide by the user
-# the key to the dict is the species code provided by the user, the value is the Species class
-species_classes = {}
+def load_arb_attributes(arb_xlsx):
+    '''
+    Returns the DataFrame of ARB species attributes (equation keys and wood specs, indexed on FIA_code),
+    cached by read_cached.
+    '''
+    return read_cached(build_arb_attributes, arb_xlsx)
 
-# iterate through the rows in the user's crosswalk
-for index, row in species_used.iterrows():
 
-    # create a class for the species, stored in the dictionary
-    species_classes[row.Your_species_code] = Species(row.FIA_code, row.Common_name, row.Wood_type)
+def build_arb_attributes(arb_xlsx):
+    '''
+    Builds the DataFrame of ARB species attributes (equation keys and wood specs, indexed on FIA_code).
+    '''
+    # read in the tables that describe which equations and wood parameters are required by ARB
+    arb_tables = load_arb_tables(arb_xlsx)
+
+    # concatenate the softwood and hardwood tables of each kind, then join (outer) them all on FIA_code
+    # Common_name is only kept from the volume equation tables
+    VOL = pd.concat([arb_tables['SW_Volume_equations'], arb_tables['HW_Volume_equations']])
+    Wood = pd.concat([arb_tables['SW_Wood_specs'], arb_tables['HW_Wood_specs']]).drop('Common_name', axis=1)
+    BB = combine_split_bark(pd.concat([arb_tables['SW_Bark_biomass'], arb_tables['HW_Bark_biomass']])).drop('Common_name', axis=1)
+    BLB = pd.concat([arb_tables['SW_LiveBranch_biomass'], arb_tables['HW_LiveBranch_biomass']]).drop('Common_name', axis=1)
+
+    # validate that each FIA_code appears once per table, so duplicates raise an error instead of multiplying rows
+    # (merge is used rather than join, which only takes validate from pandas 1.5 on)
+    ARB_species_attributes = VOL
+    for table in (Wood, BB, BLB):
+        ARB_species_attributes = ARB_species_attributes.merge(table, how='outer', left_index=True, right_index=True,
+                                                              validate='one_to_one')
+    return normalize_equation_numbers(ARB_species_attributes)
+
+
+def load_species(user_xlsx='Your_species_codes.xlsx', arb_xlsx='ARB_Volume_and_Biomass_Tables.xlsx'):
+    '''
+    Reads the user's species crosswalk and the ARB tables, and assigns equations and wood specs to each species.
+    Returns a dictionary of Species keyed by the user's species code, and the DataFrame of ARB species attributes.
+    The tables read from both workbooks are cached by read_cached.
+    '''
+    # read in the species codes provided by the user
+    # includes the user's code, the FIA code, and the common_name
+    species_crosswalk = read_cached(pd.read_excel, user_xlsx, "Crosswalk")
+    species_used = species_crosswalk.dropna() # ignore species the user didn't provide in the crosswalk table
+    species_used = species_used.astype({'Wood_type': 'category'}) # only "HW" or "SW"
 
-    # add the attributes for those species by selecting the appropriate values from the species_attributes dataframe
+    # the tables that describe which equations and wood parameters are required by ARB
+    ARB_species_attributes = load_arb_attributes(arb_xlsx)
 
-    # gather the volume equation assignments
-    WOR_VOL = ARB_species_attributes.loc[row.FIA_code, 'WOR_VOL']
-    WWA_VOL = ARB_species_attributes.loc[row.FIA_code, 'WWA_VOL']
-    EOR_VOL = ARB_species_attributes.loc[row.FIA_code, 'EOR_VOL']
-    EWA_VOL = ARB_species_attributes.loc[row.FIA_code, 'EWA_VOL']
-    CA_VOL = ARB_species_attributes.loc[row.FIA_code, 'CA_VOL']
-    species_classes[row.Your_species_code].add_vols(WOR_VOL, WWA_VOL, EOR_VOL, EWA_VOL, CA_VOL) # add them to the class in the dictionary
+    # reindex needs one row per FIA_code, which load_arb_attributes ensures by combining split rows (see combine_split_bark)
+    if not ARB_species_attributes.index.is_unique:
+        raise ValueError('FIA codes listed more than once in the ARB tables: {}'
+                         .format(sorted(set(ARB_species_attributes.index[ARB_species_attributes.index.duplicated()]))))
 
-    # gather the wood_specs
-    spec_grav = ARB_species_attributes.loc[row.FIA_code, 'Specific_gravity']
-    wood_dens = ARB_species_attributes.loc[row.FIA_code, 'Wood_density']
-    species_classes[row.Your_species_code].add_wood_specs(spec_grav, wood_dens) # add them to the class in the dictionary
+    # pull the ARB attributes for every species in the user's crosswalk in a single pass
+    # columns shared by both tables (e.g., Common_name) keep the user's version
+    attrs = resolve_equations(ARB_species_attributes.reindex(species_used.FIA_code.values))
+    merged = species_used.reset_index(drop=True).join(attrs.reset_index(drop=True), rsuffix='_ARB')
 
-    # gather the bark equation assignments
-    WOR_BB = ARB_species_attributes.loc[row.FIA_code, 'WOR_BB']
-    WWA_BB = ARB_species_attributes.loc[row.FIA_code, 'WWA_BB']
-    EOR_BB = ARB_species_attributes.loc[row.FIA_code, 'EOR_BB']
-    EWA_BB = ARB_species_attributes.loc[row.FIA_code, 'EWA_BB']
-    CA_BB = ARB_species_attributes.loc[row.FIA_code, 'CA_BB']
-    species_classes[row.Your_species_code].add_bark(WOR_BB, WWA_BB, EOR_BB, EWA_BB, CA_BB) # add them to the class in the dictionary
+    # create a dictionary that will hold all species provide by the user
+    # the key to the dict is the species code provided by the user, the value is the Species class
+    # built by walking the needed columns as numpy arrays in lockstep, in the order Species expects
+    columns = ['FIA_code', 'Common_name', 'Wood_type', 'Specific_gravity', 'Wood_density'] + list(EQ_COLS)
+    species_classes = {user_code: Species(*args)
+                       for user_code, *args in zip(merged.Your_species_code.to_numpy(),
+                                                   *(merged[col].to_numpy() for col in columns))}
 
-    # gather the live branch equation assignments
-    WOR_BLB = ARB_species_attributes.loc[row.FIA_code, 'WOR_BLB']
-    WWA_BLB = ARB_species_attributes.loc[row.FIA_code, 'WWA_BLB']
-    EOR_BLB = ARB_species_attributes.loc[row.FIA_code, 'EOR_BLB']
-    EWA_BLB = ARB_species_attributes.loc[row.FIA_code, 'EWA_BLB']
-    CA_BLB = ARB_species_attributes.loc[row.FIA_code, 'CA_BLB']
-    species_classes[row.Your_species_code].add_branch(WOR_BLB, WWA_BLB, EOR_BLB, EWA_BLB, CA_BLB) # add them to the class in the dictionary
+    return species_classes, ARB_species_attributes
 
 
-def confirm_assignments():
+def confirm_assignments(species_classes):
     '''
     Prints all attributes (equations & wood specs) for all species provided by user.
     Reproduces tables like original original ARB versions.
     '''
     def replace_func_with_name(x):
         if callable(x):
-            try:
-                name = x.func_name.split('_')[1]
-            except AttributeError: # volume equations are classes, not functions, don't have func_name attribute
-                name = x.__name__.split('_')[1]
-            if name == 'None':
-                return '--'
-            else:
-                return name
-        else:
-            return x
-
-    confirm_eqs = pd.DataFrame(species_classes[spp].__dict__ for spp in pd.unique(species_used.Your_species_code)).applymap(replace_func_with_name)
-    print "Volume Equations"
-    print confirm_eqs[['code', 'common_name', 'WOR_VOL', 'WWA_VOL', 'EOR_VOL', 'EWA_VOL', 'CA_VOL']].to_string(index=False) + '\n'
-    print "Wood specifications"
-    print confirm_eqs[['code', 'common_name', 'spec_grav', 'wood_dens']].to_string(index=False) + '\n'
-    print "Bark Biomass Equations"
-    print confirm_eqs[['code', 'common_name', 'WOR_BB', 'WWA_BB', 'EOR_BB', 'EWA_BB', 'CA_BB']].to_string(index=False) + '\n'
-    print "Live Branch Biomass Equations"
-    print confirm_eqs[['code', 'common_name', 'WOR_BLB', 'WWA_BLB', 'EOR_BLB', 'EWA_BLB', 'CA_BLB']].to_string(index=False) + '\n'
+            name = x.__name__.split('_', 1)[1]
+            return '--' if name == 'None' else name
+        return x
+
+    rows = [[getattr(spp, name) for name in Species.__slots__] for spp in species_classes.values()]
+    confirm_eqs = pd.DataFrame(rows, columns=list(Species.__slots__))
+    eq_cols = list(EQ_COLS)
+    # only the equation columns hold functions; Series.map, unlike DataFrame.map, works on any pandas version
+    confirm_eqs[eq_cols] = confirm_eqs[eq_cols].apply(lambda col: col.map(replace_func_with_name))
+
+    print("Volume Equations")
+    print(confirm_eqs[['code', 'common_name', 'WOR_VOL', 'WWA_VOL', 'EOR_VOL', 'EWA_VOL', 'CA_VOL']].to_string(index=False) + '\n')
+    print("Wood specifications")
+    print(confirm_eqs[['code', 'common_name', 'spec_grav', 'wood_dens']].to_string(index=False) + '\n')
+    print("Bark Biomass Equations")
+    print(confirm_eqs[['code', 'common_name', 'WOR_BB', 'WWA_BB', 'EOR_BB', 'EWA_BB', 'CA_BB']].to_string(index=False) + '\n')
+    print("Live Branch Biomass Equations")
+    print(confirm_eqs[['code', 'common_name', 'WOR_BLB', 'WWA_BLB', 'EOR_BLB', 'EWA_BLB', 'CA_BLB']].to_string(index=False) + '\n')
+
+
+if __name__ == '__main__':
+    species_classes, ARB_species_attributes = load_species()
+    confirm_assignments(species_classes)
@@ -7,6 +7,15 @@
 # http://www.arb.ca.gov/cc/capandtrade/protocols/usforest/2015/volume.equations.ca.or.wa.pdf
 
 import math
+import threading
+from bisect import bisect_right
+
+# volume metrics that can be requested from an equation
+VOLUME_METRICS = frozenset(['CVT', 'CVTS', 'CV4', 'CV6', 'CV8', 'SV616', 'SV632', 'XINT6', 'SV816', 'XINT8', 'westSV',
+                            'eastSV'])
+
+# metrics that are calculated by converting cubic volume to boardfoot volume (see calcBF)
+BF_METRICS = frozenset(['CV6', 'SV616', 'SV632', 'XINT6', 'SV816', 'XINT8'])
 
 # ARB-APPROVED VOLUME EQUATIONS ARE REPRODUCED BELOW AS FUNCTIONS
 # Each volume equation is a class that can calculates a variety of variables.
@@ -39,25 +48,29 @@ class Equation(object):
         self.XINT8 = None # INTERNATIONAL ¼ INCH VOLUME--8-INCH TOP (IN 8-FT LOGS)
 
     def calcBF(self):
+        # equations that do not calculate the cubic volumes needed for conversion have no boardfoot volume
+        calculated = self.__dict__
         if self.wood_type == 'SW':
-            try:
-                self.CV6 = SW_BFConversion(self.DBH, self.CV4, self.TARIF, 'CV6')
-                self.SV632 = SW_BFConversion(self.DBH, self.CV4, self.TARIF, 'SV632')
-                self.SV616 = SW_BFConversion(self.DBH, self.CV4, self.TARIF, 'SV616')
-                self.XINT6 = SW_BFConversion(self.DBH, self.CV4, self.TARIF, 'XINT6')
-            except AttributeError:
+            if 'CV4' in calculated and 'TARIF' in calculated:
+                volumes = _SW_BF_volumes(self.DBH, self.CV4, self.TARIF)
+                self.CV6 = volumes['CV6']
+                self.SV632 = volumes['SV632']
+                self.SV616 = volumes['SV616']
+                self.XINT6 = volumes['XINT6']
+            else:
                 self.CV6 = None
                 self.SV632 = 0
                 self.SV616 = 0
                 self.XINT6 = 0
 
         elif self.wood_type == 'HW':
-            try:
-                self.CV6 = HW_BFConversion(self.CV4, self.CV8, self.DBH, self.eq_num, self.CVT, self.TARIF, self.HT, 'CV6')
-                self.SV816 = HW_BFConversion(self.CV4, self.CV8, self.DBH, self.eq_num, self.CVT, self.TARIF, self.HT, 'SV816')
-                self.XINT6 = HW_BFConversion(self.CV4, self.CV8, self.DBH, self.eq_num, self.CVT, self.TARIF, self.HT, 'XINT6')
-                self.XINT8 = HW_BFConversion(self.CV4, self.CV8, self.DBH, self.eq_num, self.CVT, self.TARIF, self.HT, 'XINT8')
-            except AttributeError:
+            if all(attr in calculated for attr in ('CV4', 'CV8', 'CVT', 'TARIF')):
+                volumes = _HW_BF_volumes(self.CV4, self.CV8, self.DBH, self.eq_num, self.CVT, self.TARIF, self.HT)
+                self.CV6 = volumes['CV6']
+                self.SV816 = volumes['SV816']
+                self.XINT6 = volumes['XINT6']
+                self.XINT8 = volumes['XINT8']
+            else:
                 self.CV6 = None
                 self.SV816 = 0
                 self.XINT6 = 0
@@ -67,8 +80,7 @@ class Equation(object):
         '''
         Sets class attributes by unpacking a dictionary of attributes to be set
         '''
-        for key in attributes:
-            setattr(self, key, attributes[key])
+        self.__dict__.update(attributes)
 
     def has_zero(self, DBH, HT):
         if DBH <=0 or HT <= 0:
@@ -83,7 +95,7 @@ class Equation(object):
         volume_metric = the cubic or boardfoot volume metric requested by the user
         volume_equation = the cubic volume equation (function) requested by the user
         '''
-        if metric not in ['CVT', 'CVTS', 'CV4', 'CV6', 'CV8', 'SV616', 'SV632', 'XINT6', 'SV816', 'XINT8', 'westSV', 'eastSV']:
+        if metric not in VOLUME_METRICS:
             raise ValueError(metric + " is not a recognized volume metric. metric must be one of 'CVT', 'CVTS', 'CV4', 'CV6', 'CV8', 'SV616', 'SV632', 'eastSV', 'westSV', 'XINT6', 'SV816', or 'XINT8'.")
 
         if self.HT == 0:
@@ -102,8 +114,225 @@ class Equation(object):
             return 0
         elif self.DBH < 1:
             return 0
+
+        # boardfoot volume metrics are only calculated when requested
+        if metric in BF_METRICS:
+            self.calcBF()
         return getattr(self, metric)
 
+# TERMS SHARED BY SEVERAL VOLUME EQUATIONS
+
+# 0.5523**x is computed as exp(log(0.5523) * x), which avoids a general pow() call
+_LOG_0_5523 = math.log(0.5523)
+
+# as is 0.65**x, used by the 8-inch top sawlog ratio (RC8) of the hardwood equations
+_LOG_0_65 = math.log(0.65)
+
+# and 0.62**x, 0.484**x and 0.485**x, used by the boardfoot conversion ratios (RC6, RS816 and RI8)
+_LOG_0_62 = math.log(0.62)
+_LOG_0_484 = math.log(0.484)
+_LOG_0_485 = math.log(0.485)
+
+# constants of the tarif volume system (Brackett 1977), shared by the equations below
+_BA_COEF = 0.005454154 # basal area, in square feet, per squared inch of DBH
+_TARIF_COEF = 0.912733 # scales CV4 per square foot of basal area to a tarif number
+_BA_4IN = 0.087266 # basal area of a 4-inch tree, in square feet
+_BA_4IN_X2 = 0.174533 # twice the basal area of a 4-inch tree
+_BRACKETT_A = 1.382937 # coefficients of the exponential term in the TARIF, CVTS, and CVT denominators
+_BRACKETT_B = 4.015292
+
+# dividing by _TARIF_COEF is done by multiplying by its reciprocal, which is cheaper
+_INV_TARIF_COEF = 1.0/_TARIF_COEF
+
+def _brackett_term(DBH, BA):
+    '''
+    Denominator shared by the Brackett (1977) TARIF, CVTS, and CVT equations.
+    WHERE:
+    DBH = tree diameter at breast height, in inches
+    BA = basal area of the tree, in square feet
+    '''
+    return (1.033 * (1.0 + _BRACKETT_A * math.exp(-_BRACKETT_B * (DBH/10.0)))) * (BA + _BA_4IN) - _BA_4IN_X2
+
+def _butt_shape(DBH):
+    '''
+    Ratio of cubic volume above stump to total cubic volume (RTS) for a tree of the given DBH, in inches.
+    '''
+    return 0.9679 - 0.1051 * math.exp(_LOG_0_5523 * (DBH-1.5))
+
+def _rc8(DBH):
+    '''
+    Ratio of 8-inch top sawlog volume to 4-inch top cubic volume (RC8) for a hardwood of the given DBH, in inches.
+    '''
+    return 0.983 - (0.983 * math.exp(_LOG_0_65 * (DBH-8.6)))
+
+# upper bounds of the DBH classes (inches) that FVS default form factors are assigned by:
+# 0<DBH<11, 11<=DBH<21, 21<=DBH<31, 31<=DBH<41, DBH>=41
+_FF_DBH_BREAKS = (11, 21, 31, 41)
+
+# the form factor at 9 ft above ground is found by linear interpolation between 100 at BH (4.5 ft) and the form
+# factor at 16 ft; this weight folds that interpolation and the conversion from percent into one constant
+_FF_9FT_WEIGHT = (9 - 4.5)/(16 - 4.5)/100.0
+
+def _form_class_factor(DBH, HT, form_factors, FC_FACTOR):
+    '''
+    FC**k term of the Pillsbury (1984) sawlog (CV8) equations. FC is 10 when the tree is at least 9 ft tall and its
+    diameter at 9 ft is at least 9 in., else 1, so FC**k is either 10**k (precomputed by each equation) or 1.
+    WHERE:
+    DBH = tree diameter at breast height, in inches
+    HT = tree height, in feet
+    form_factors = FVS default form factors for the DBH classes in _FF_DBH_BREAKS, smallest class first
+    FC_FACTOR = 10**k, the FC**k term of a merchantable first segment
+    '''
+    FF = form_factors[bisect_right(_FF_DBH_BREAKS, DBH)]
+    diam_9ft = DBH * (1.0 + (FF - 100) * _FF_9FT_WEIGHT) # diameter at 9 ft
+    return FC_FACTOR if diam_9ft >= 9 and HT >= 9 else 1.0
+
+def _tarif_cubic(CVTS, DBH, BA):
+    '''
+    TARIF, CVT, and CV4 derived from CVTS, as used by the Brackett (1977) tarif equations.
+    WHERE:
+    CVTS = cubic foot volume, including top and stump
+    DBH = tree diameter at breast height, in inches
+    BA = basal area of the tree, in square feet
+    '''
+    TARIF = (CVTS * _TARIF_COEF)/((1.033 * (1.0 + _BRACKETT_A * math.exp(-_BRACKETT_B * DBH))) * (BA + _BA_4IN) - _BA_4IN_X2)
+    TARIF_K = TARIF * _INV_TARIF_COEF
+    CV4 = TARIF_K * (BA - _BA_4IN)
+    CVT = TARIF_K * _butt_shape(DBH) * _brackett_term(DBH, BA)
+    return TARIF, CVT, CV4
+
+def _tarif_block(CVTS, DBH, BA):
+    '''
+    TARIF, CVT, CV4, and CV8 derived from CVTS, as used by the Brackett (1977) hardwood equations.
+    WHERE:
+    CVTS = cubic foot volume, including top and stump
+    DBH = tree diameter at breast height, in inches
+    BA = basal area of the tree, in square feet
+    '''
+    TARIF, CVT, CV4 = _tarif_cubic(CVTS, DBH, BA)
+    return TARIF, CVT, CV4, _rc8(DBH) * CV4
+
+def _pillsbury_block(CVTS, CV8, DBH, BA):
+    '''
+    CVT and TARIF derived from CVTS and CV8, as used by the Pillsbury and Kirkley (1984) hardwood equations.
+    WHERE:
+    CVTS = cubic foot volume, including top and stump
+    CV8 = cubic foot volume, sawlog (8-inch top)
+    DBH = tree diameter at breast height, in inches
+    BA = basal area of the tree, in square feet
+    '''
+    CVT = CVTS * _butt_shape(DBH) # RTS is not defined in the documentation, it appears to be proportion of cubic volume in tree above stump
+    return CVT, _tarif_from_CV8(CV8, DBH, BA)
+
+def _tarif_from_CV8(CV8, DBH, BA):
+    '''
+    Tarif number derived from CV8, as in the Pillsbury and Kirkley (1984) hardwood equations and the TARIFX of the
+    hardwood boardfoot conversions. Trees whose denominator is zero (e.g., DBH of 4 or 8.6 inches) get 0.01.
+    WHERE:
+    CV8 = cubic foot volume, sawlog (8-inch top)
+    DBH = tree diameter at breast height, in inches
+    BA = basal area of the tree, in square feet
+    '''
+    denom = _rc8(DBH) * (BA - _BA_4IN)
+    return 0.01 if denom == 0 else (CV8 * _TARIF_COEF)/denom
+
+
+def _log_linear_CVTS(a, b, c):
+    '''
+    Returns a calc_CVTS method for the log-linear CVTS equation log10(CVTS) = a + b*log10(DBH) + c*log10(HT).
+    The method is specialized on the coefficients, so 10**a is evaluated once rather than on every call.
+    '''
+    SCALE = 10**a
+
+    def calc_CVTS(self, DBH, HT):
+        return SCALE * DBH**b * HT**c
+
+    return calc_CVTS
+
+
+class BrackettHWEquation(Equation):
+    '''
+    Hardwood equations from Brackett (1977) that derive TARIF, CVT, CV4, and CV8 from CVTS (see _tarif_block).
+    Subclasses define calc_CVTS, usually with _log_linear_CVTS.
+    '''
+    def calc_CVTS(self, DBH, HT):
+        raise NotImplementedError
+
+    def calc(self, DBH, HT, metric):
+        """
+        WHERE:
+        DBH (inches) = DBH (CM) CONVERTED TO INCHES (DBH/2.54)
+        HT (feet) = HT (M) CONVERTED TO FEET (HT/0.3048)
+        BA = BASAL AREA (DBH IN INCHES) BA= .005454154 x DBH2
+        CVTS = CUBIC FOOT VOLUME, INCLUDING TOP AND STUMP
+        TARIF = TARIF NUMBER EQUATION (REF. DNR NOTE NO.27, P.2)
+        CVT = CUBIC FOOT VOLUME ABOVE STUMP
+        CV4 = CUBIC FOOT VOLUME ABOVE STUMP, 4-INCH TOP
+        """
+        if DBH <=0 or HT <=0: return 0
+
+        BA = _BA_COEF * DBH*DBH
+        CVTS = self.calc_CVTS(DBH, HT)
+        TARIF, CVT, CV4, CV8 = _tarif_block(CVTS, DBH, BA)
+        # CV4X = CV4 # this is not used in this set of equations, only in BF calculation and is calculated there
+
+        # set these attributes
+        self.DBH, self.HT, self.CVTS, self.TARIF, self.CV4, self.CVT, self.CV8 = DBH, HT, CVTS, TARIF, CV4, CVT, CV8
+
+        # return the requested metric
+        return self.get(metric)
+
+
+class PillsburyEquation(Equation):
+    '''
+    Hardwood equations from Pillsbury and Kirkley (1984) that estimate CVTS, CV4, and CV8 from DBH and HT alone.
+    Each volume is COEFS[0] * DBH**COEFS[1] * HT**COEFS[2], using CVTS_COEFS, CV4_COEFS, and CV8_COEFS.
+    '''
+    CVTS_COEFS = None
+    CV4_COEFS = None
+    CV8_COEFS = None
+
+    def calc(self, DBH, HT, metric):
+        """
+        WHERE
+        DBH = DBH(CM) CONVERTED TO INCHES (DBH/2.54)
+        HT = HT (M) CONVERTED TO FEET (HT/0.3048)
+        BA = BASAL AREA (DBH IN INCHES) BA= .005454154 x DBH2
+        CVTS = CUBIC FOOT VOLUME, TOTAL STEM, WITH TOP AND STUMP
+        TARIF = TARIF NUMBER EQUATION
+        CVT = CUBIC FOOT VOLUME ABOVE STUMP
+        CV4 = CUBIC FOOT VOLUME, 4-IN TOP
+        CV8 = CUBIC FOOT VOLUME, SAWLOG (8-IN TOP)
+        """
+        if DBH <=0 or HT <=0: return 0
+
+        BA = _BA_COEF * DBH*DBH
+        lnD, lnH = math.log(DBH), math.log(HT)
+        c, b, h = self.CVTS_COEFS
+        CVTS = c * math.exp(b*lnD + h*lnH)
+
+        # total stem volume needs none of the other volumes, so skip them when it is all that was requested
+        # and clear them, so that none are left over from a previous tree
+        if metric == 'CVTS':
+            self.DBH, self.HT, self.CVTS = DBH, HT, CVTS
+            self.TARIF = self.CV4 = self.CVT = self.CV8 = None
+            return self.get(metric)
+
+        c, b, h = self.CV4_COEFS
+        CV4 = c * math.exp(b*lnD + h*lnH)
+        c, b, h = self.CV8_COEFS
+        CV8 = c * math.exp(b*lnD + h*lnH)
+        # CV4X = CVT * (0.99875 - 43.336/DBH**3 - 124.717/DBH**4 + (0.193437*HT)/DBH**3 + 479.83/(DBH**3 * HT))
+            # this is not used in this set of equations, only in BF calculation and is calculated there
+        CVT, TARIF = _pillsbury_block(CVTS, CV8, DBH, BA)
+
+        # set these attributes
+        self.DBH, self.HT, self.CVTS, self.TARIF, self.CV4, self.CVT, self.CV8 = DBH, HT, CVTS, TARIF, CV4, CVT, CV8
+
+        # return the requested metric
+        return self.get(metric)
+
+
 # THE VOLUME EQUATIONS
 
 # For species where there is no identified volume equation by ARB/CAR
@@ -139,20 +368,17 @@ class Eq_1(Equation):
         """
         if DBH <=0 or HT <=0: return 0
 
-        BA = 0.005454154*(DBH**2)
+        BA = _BA_COEF*(DBH*DBH)
         # note that math.log() uses natural logarithm while math.log10() uses log base 10
-        CVTSL = -3.21809 + 0.04948 * math.log10(HT) * math.log10(DBH) - 0.15664 * (math.log10(DBH))**2 + 2.02132 * math.log10(DBH) + 1.63408 * math.log10(HT) - 0.16185 * (math.log10(HT))**2
-        CVTS = 10**CVTSL
-        TARIF = (CVTS * 0.912733)/((1.033*(1.0 + 1.382937 * math.exp(-4.105292 * (DBH/10.0))))*(BA+0.087266)-0.174533)
-        CV4 = TARIF * (BA - 0.087266)/0.912733
-        CVT = TARIF * (0.9679 - 0.1051 * 0.5523**(DBH-1.5))*((1.033*(1.0 + 1.382937 * math.exp(-4.015292*(DBH/10.0))))*(BA + 0.087266)-0.174533)/0.912733
+        LOG_DBH = math.log10(DBH)
+        LOG_HT = math.log10(HT)
+        CVTS = 10**(-3.21809 + 0.04948 * LOG_HT * LOG_DBH - 0.15664 * LOG_DBH*LOG_DBH + 2.02132 * LOG_DBH + 1.63408 * LOG_HT - 0.16185 * LOG_HT*LOG_HT)
+        TARIF = (CVTS * _TARIF_COEF)/((1.033*(1.0 + _BRACKETT_A * math.exp(-4.105292 * (DBH/10.0))))*(BA+_BA_4IN)-_BA_4IN_X2)
+        CV4 = TARIF * (BA - _BA_4IN) * _INV_TARIF_COEF
+        CVT = TARIF * _butt_shape(DBH) * _brackett_term(DBH, BA) * _INV_TARIF_COEF
 
         # set these attributes
-        attributes = {'DBH': DBH, 'HT': HT, 'CVTS': CVTS, 'TARIF': TARIF, 'CV4': CV4, 'CVT': CVT}
-        self.set_attributes(attributes)
-
-        # calculate and set the boardfoot volume metrics
-        self.calcBF()
+        self.DBH, self.HT, self.CVTS, self.TARIF, self.CV4, self.CVT = DBH, HT, CVTS, TARIF, CV4, CVT
 
         # return the requested metric
         return self.get(metric)
@@ -181,20 +407,14 @@ class Eq_2(Equation):
         """
         if DBH <=0 or HT <=0: return 0
 
-        BA = 0.005454154*(DBH**2)
-        # note that math.log() uses natural logarithm while math.log10() uses log base 10
-        CVTSL = -6.110493 + 1.81306 * math.log(DBH) + 1.083884 * math.log(HT)
-        CVTS = math.exp(CVTSL)
-        TARIF = (CVTS * 0.912733)/((1.033*(1.0 + 1.382937 * math.exp(-4.105292 * (DBH/10.0))))*(BA+0.087266)-0.174533)
-        CV4 = TARIF * (BA - 0.087266)/0.912733
-        CVT = TARIF * (0.9679 - 0.1051 * 0.5523**(DBH-1.5))*((1.033*(1.0 + 1.382937 * math.exp(-4.015292*(DBH/10.0))))*(BA + 0.087266)-0.174533)/0.912733
+        BA = _BA_COEF*(DBH*DBH)
+        CVTS = math.exp(-6.110493) * DBH**1.81306 * HT**1.083884
+        TARIF = (CVTS * _TARIF_COEF)/((1.033*(1.0 + _BRACKETT_A * math.exp(-4.105292 * (DBH/10.0))))*(BA+_BA_4IN)-_BA_4IN_X2)
+        CV4 = TARIF * (BA - _BA_4IN) * _INV_TARIF_COEF
+        CVT = TARIF * _butt_shape(DBH) * _brackett_term(DBH, BA) * _INV_TARIF_COEF
 
         # set these attributes
-        attributes = {'DBH': DBH, 'HT': HT, 'CVTS': CVTS, 'TARIF': TARIF, 'CV4': CV4, 'CVT': CVT}
-        self.set_attributes(attributes)
-
-        # calculate and set the boardfoot volume metrics
-        self.calcBF()
+        self.DBH, self.HT, self.CVTS, self.TARIF, self.CV4, self.CVT = DBH, HT, CVTS, TARIF, CV4, CVT
 
         # return the requested metric
         return self.get(metric)
@@ -227,22 +447,16 @@ class Eq_3(Equation):
         TMP_DBH = 6.0      # are only called in equations below if DBH <6. Assign TMP_DBH regardless.
 
         # CALCULATE BASAL AREA PER TREE USING DBH AND DBH_TEMP
-        BA = DBH**2 * 0.005454154
-        BA_TMP = TMP_DBH **2 * 0.005454154
+        BA = DBH*DBH * _BA_COEF
+        BA_TMP = TMP_DBH*TMP_DBH * _BA_COEF
 
         # CALCULATE A CUBIC FORM FACTOR (CF4) USING TMP_DBH and DBH
         # CF4 EQUATIONS VARY BY VOLUME EQUATION
-        CF4 = 0.248569 + 0.0253524*(HT/DBH) - 0.0000560175*(HT**2/ DBH)
-        if(CF4 < 0.3):
-            CF4=0.3
-        if(CF4 > 0.4):
-            CF4=0.4
-
-        CF4_TMP = 0.248569 + 0.0253524*(HT/TMP_DBH) - 0.0000560175*(HT**2/ TMP_DBH)
-        if(CF4_TMP < 0.3):
-            CF4_TMP=0.3
-        if(CF4_TMP > 0.4):
-            CF4_TMP=0.4
+        CF4 = 0.248569 + 0.0253524*(HT/DBH) - 0.0000560175*(HT*HT/ DBH)
+        CF4 = 0.4 if CF4 > 0.4 else (0.3 if CF4 < 0.3 else CF4)
+
+        CF4_TMP = 0.248569 + 0.0253524*(HT/TMP_DBH) - 0.0000560175*(HT*HT/ TMP_DBH)
+        CF4_TMP = 0.4 if CF4_TMP > 0.4 else (0.3 if CF4_TMP < 0.3 else CF4_TMP)
 
         # ----------------
         # For ease of use and to improve readability of equations,
@@ -250,28 +464,30 @@ class Eq_3(Equation):
         # Note that actual DBH and BA are used for all trees.
         # Do not use TMP_DBH or BA_TMP here.
 
-        TERM = ((1.033 * (1.0 + 1.382937 * math.exp(-4.015292 * (DBH/10.0)))) * (BA + 0.087266) - 0.174533 )
+        TERM = _brackett_term(DBH, BA)
         # ----------------
 
         if DBH >= 6.0:
             CV4 = CF4 * BA * HT
-            TARIF = (CV4 * 0.912733) / (BA - 0.087266)
+            BA_4 = BA - _BA_4IN
+            TARIF = (CV4 * _TARIF_COEF) / BA_4
             if (TARIF <= 0.0):
                 TARIF=0.01
-            CVTS = (CV4 * TERM )/ (BA - 0.087266)
+            CVTS = (CV4 * TERM )/ BA_4
 
     #         # set floor of CVTS to zero (in case equation generates negative values)
     #         CVTS = max(0,CVTS)
 
-            CVT = TARIF * (0.9679 - 0.1051 * 0.5523**(DBH-1.5) ) * TERM / 0.912733
+            CVT = TARIF * _butt_shape(DBH) * TERM * _INV_TARIF_COEF
 
         elif DBH < 6.0:
             CV4_TMP = CF4_TMP * BA_TMP * HT
-            TARIF_TMP = (CV4_TMP * 0.912733) / (BA_TMP - 0.087266)
+            TARIF_TMP = (CV4_TMP * _TARIF_COEF) / (BA_TMP - _BA_4IN)
             if(TARIF_TMP <= 0.0):
                 TARIF_TMP = 0.01
             # CALCULATE An ADJUSTED TARIF FOR SMALL TREES (Both DBH and TMP_DBH are used)
-            TARIF = TARIF_TMP * ( 0.5 * (TMP_DBH - DBH)**2 + (1.0 + 0.063 * (TMP_DBH - DBH)**2) )
+            DBH_DIFF = TMP_DBH - DBH
+            TARIF = TARIF_TMP * ( 0.5 * DBH_DIFF*DBH_DIFF + (1.0 + 0.063 * DBH_DIFF*DBH_DIFF) )
             if(TARIF <= 0.0):
                 TARIF = 0.01
             CVTS = TARIF * TERM
@@ -279,7 +495,7 @@ class Eq_3(Equation):
     #         # set floor of CVTS to zero (in case equation generates negative values)
     #         CVTS = max(0,CVTS)
 
-            CVT = TARIF * (0.9679 - 0.1051 * 0.5523**(DBH-1.5) ) * TERM / 0.912733
+            CVT = TARIF * _butt_shape(DBH) * TERM * _INV_TARIF_COEF
             CV4 = CF4 * BA * HT #(calculated with actual DBH and BA)
 
         if DBH < 5.0:
@@ -288,11 +504,7 @@ class Eq_3(Equation):
         #    pass # THEN KEEP CV4
 
         # set these attributes
-        attributes = {'DBH': DBH, 'HT': HT, 'CVTS': CVTS, 'TARIF': TARIF, 'CV4': CV4, 'CVT': CVT}
-        self.set_attributes(attributes)
-
-        # calculate and set the boardfoot volume metrics
-        self.calcBF()
+        self.DBH, self.HT, self.CVTS, self.TARIF, self.CV4, self.CVT = DBH, HT, CVTS, TARIF, CV4, CVT
 
         # return the requested metric
         return self.get(metric)
@@ -323,20 +535,14 @@ class Eq_4(Equation):
         """
         if DBH <=0 or HT <=0: return 0
 
-        BA = 0.005454154 * DBH**2
+        BA = _BA_COEF * DBH*DBH
         # note that math.log() uses natural logarithm while math.log10() uses log base 10
-        CVTSL = -8.521558 + 1.977243 * math.log(DBH) - 0.105288 * (math.log(HT))**2 + 136.0489/HT**2 + 1.99546 * math.log(HT)
-        CVTS = math.exp(CVTSL)
-        TARIF = (CVTS * 0.912733)/((1.033 * (1.0 + 1.382937 * math.exp(-4.015292 * DBH))) * (BA + 0.087266) - 0.174533)
-        CV4 = TARIF * (BA - 0.087266)/0.912733
-        CVT = TARIF * (0.9679 - 0.1051 * 0.5523**(DBH-1.5))*((1.033*(1.0 + 1.382937 * math.exp(-4.015292*(DBH/10.0))))*(BA + 0.087266)-0.174533)/0.912733
+        LOG_HT = math.log(HT)
+        CVTS = math.exp(-8.521558 + 1.977243 * math.log(DBH) - 0.105288 * LOG_HT*LOG_HT + 136.0489/(HT*HT) + 1.99546 * LOG_HT)
+        TARIF, CVT, CV4 = _tarif_cubic(CVTS, DBH, BA)
 
         # set these attributes
-        attributes = {'DBH': DBH, 'HT': HT, 'CVTS': CVTS, 'TARIF': TARIF, 'CV4': CV4, 'CVT': CVT}
-        self.set_attributes(attributes)
-
-        # calculate and set the boardfoot volume metrics
-        self.calcBF()
+        self.DBH, self.HT, self.CVTS, self.TARIF, self.CV4, self.CVT = DBH, HT, CVTS, TARIF, CV4, CVT
 
         # return the requested metric
         return self.get(metric)
@@ -370,21 +576,15 @@ class Eq_5(Equation):
         TMP_DBH = 6.0      # are only called in equations below if DBH <6. Assign TMP_DBH regardless.
 
         # CALCULATE BASAL AREA PER TREE USING DBH AND DBH_TEMP
-        BA = DBH**2 * 0.005454154
-        BA_TMP = TMP_DBH **2 * 0.005454154
+        BA = DBH*DBH * _BA_COEF
+        BA_TMP = TMP_DBH*TMP_DBH * _BA_COEF
 
         # CALCULATE A CUBIC FORM FACTOR (CF4) USING TMP_DBH and DBH
         # CF4 EQUATIONS VARY BY VOLUME EQUATION
         CF4 = 0.402060 - 0.899914 * (1/DBH)
-        if(CF4 < 0.3):
-            CF4=0.3
-        if(CF4 > 0.4):
-            CF4=0.4
+        CF4 = 0.4 if CF4 > 0.4 else (0.3 if CF4 < 0.3 else CF4)
         CF4_TMP = 0.402060 - 0.899914 * (1/TMP_DBH)
-        if (CF4_TMP < 0.3):
-            CF4_TMP=0.3
-        if (CF4_TMP > 0.4):
-            CF4_TMP=0.4
+        CF4_TMP = 0.4 if CF4_TMP > 0.4 else (0.3 if CF4_TMP < 0.3 else CF4_TMP)
 
         # ----------------
         # For ease of use and to improve readability of equations,
@@ -392,28 +592,30 @@ class Eq_5(Equation):
         # Note that actual DBH and BA are used for all trees.
         # Do not use TMP_DBH or BA_TMP here.
 
-        TERM = ((1.033 * (1.0 + 1.382937 * math.exp(-4.015292 * (DBH/10.0)))) * (BA + 0.087266) - 0.174533 )
+        TERM = _brackett_term(DBH, BA)
         # ----------------
 
         if DBH >= 6.0:
             CV4 = CF4 * BA * HT
-            TARIF = (CV4 * 0.912733) / (BA - 0.087266)
+            BA_4 = BA - _BA_4IN
+            TARIF = (CV4 * _TARIF_COEF) / BA_4
             if (TARIF <= 0.0):
                 TARIF=0.01
-            CVTS = (CV4 * TERM )/ (BA - 0.087266)
+            CVTS = (CV4 * TERM )/ BA_4
 
     #         # set floor of CVTS to zero (in case equation generates negative values)
     #         CVTS = max(0,CVTS)
 
-            CVT = TARIF * (0.9679 - 0.1051 * 0.5523**(DBH-1.5) ) * TERM / 0.912733
+            CVT = TARIF * _butt_shape(DBH) * TERM * _INV_TARIF_COEF
 
         elif DBH < 6.0:
             CV4_TMP = CF4_TMP *BA_TMP * HT
-            TARIF_TMP = (CV4_TMP * 0.912733) / (BA_TMP - 0.087266)
+            TARIF_TMP = (CV4_TMP * _TARIF_COEF) / (BA_TMP - _BA_4IN)
             if(TARIF_TMP <= 0.0):
                 TARIF_TMP = 0.01
             # CALCULATE An ADJUSTED TARIF FOR SMALL TREES (Both DBH and TMP_DBH are used)
-            TARIF = TARIF_TMP * ( 0.5 * (TMP_DBH - DBH)**2 + (1.0 + 0.063 * (TMP_DBH - DBH)**2) )
+            DBH_DIFF = TMP_DBH - DBH
+            TARIF = TARIF_TMP * ( 0.5 * DBH_DIFF*DBH_DIFF + (1.0 + 0.063 * DBH_DIFF*DBH_DIFF) )
             if(TARIF <= 0.0):
                 TARIF = 0.01
             CVTS = TARIF * TERM
@@ -421,7 +623,7 @@ class Eq_5(Equation):
     #         # set floor of CVTS to zero (in case equation generates negative values)
     #         CVTS = max(0,CVTS)
 
-            CVT = TARIF * (0.9679 - 0.1051 * 0.5523**(DBH-1.5) ) * TERM / 0.912733
+            CVT = TARIF * _butt_shape(DBH) * TERM * _INV_TARIF_COEF
             CV4 = CF4 * BA * HT #(calculated with actual DBH and BA)
 
         if DBH < 5.0:
@@ -430,11 +632,7 @@ class Eq_5(Equation):
         #    pass # THEN KEEP CV4
 
         # set these attributes
-        attributes = {'DBH': DBH, 'HT': HT, 'CVTS': CVTS, 'TARIF': TARIF, 'CV4': CV4, 'CVT': CVT}
-        self.set_attributes(attributes)
-
-        # calculate and set the boardfoot volume metrics
-        self.calcBF()
+        self.DBH, self.HT, self.CVTS, self.TARIF, self.CV4, self.CVT = DBH, HT, CVTS, TARIF, CV4, CVT
 
         # return the requested metric
         return self.get(metric)
@@ -464,20 +662,13 @@ class Eq_6(Equation):
         """
         if DBH <=0 or HT <=0: return 0
 
-        BA = 0.005454154 * DBH**2
+        BA = _BA_COEF * DBH*DBH
         # note that math.log() uses natural logarithm while math.log10() uses log base 10
-        CVTSL = -2.72170 + 2.00857 * math.log10(DBH) + 1.08620 * math.log10(HT) - 0.00568 * DBH
-        CVTS = 10**CVTSL
-        TARIF = (CVTS * 0.912733)/((1.033 * (1.0 + 1.382937 * math.exp(-4.015292 * DBH))) * (BA + 0.087266) - 0.174533)
-        CV4 = TARIF * (BA - 0.087266)/0.912733
-        CVT = TARIF * (0.9679 - 0.1051 * 0.5523**(DBH-1.5))*((1.033*(1.0 + 1.382937 * math.exp(-4.015292*(DBH/10.0))))*(BA + 0.087266)-0.174533)/0.912733
+        CVTS = 10**(-2.72170 + 2.00857 * math.log10(DBH) + 1.08620 * math.log10(HT) - 0.00568 * DBH)
+        TARIF, CVT, CV4 = _tarif_cubic(CVTS, DBH, BA)
 
         # set these attributes
-        attributes = {'DBH': DBH, 'HT': HT, 'CVTS': CVTS, 'TARIF': TARIF, 'CV4': CV4, 'CVT': CVT}
-        self.set_attributes(attributes)
-
-        # calculate and set the boardfoot volume metrics
-        self.calcBF()
+        self.DBH, self.HT, self.CVTS, self.TARIF, self.CV4, self.CVT = DBH, HT, CVTS, TARIF, CV4, CVT
 
         # return the requested metric
         return self.get(metric)
@@ -507,20 +698,12 @@ class Eq_7(Equation):
         """
         if DBH <=0 or HT <=0: return 0
 
-        BA = 0.005454154 * DBH**2
-        # note that math.log() uses natural logarithm while math.log10() uses log base 10
-        CVTSL = -2.663834 + 1.79023 * math.log10(DBH) + 1.124873 * math.log10(HT)
-        CVTS = 10**CVTSL
-        TARIF = (CVTS * 0.912733)/((1.033 * (1.0 + 1.382937 * math.exp(-4.015292 * DBH))) * (BA + 0.087266) - 0.174533)
-        CV4 = TARIF * (BA - 0.087266)/0.912733
-        CVT = TARIF * (0.9679 - 0.1051 * 0.5523**(DBH-1.5))*((1.033*(1.0 + 1.382937 * math.exp(-4.015292*(DBH/10.0))))*(BA + 0.087266)-0.174533)/0.912733
+        BA = _BA_COEF * DBH*DBH
+        CVTS = 10**-2.663834 * DBH**1.79023 * HT**1.124873
+        TARIF, CVT, CV4 = _tarif_cubic(CVTS, DBH, BA)
 
         # set these attributes
-        attributes = {'DBH': DBH, 'HT': HT, 'CVTS': CVTS, 'TARIF': TARIF, 'CV4': CV4, 'CVT': CVT}
-        self.set_attributes(attributes)
-
-        # calculate and set the boardfoot volume metrics
-        self.calcBF()
+        self.DBH, self.HT, self.CVTS, self.TARIF, self.CV4, self.CVT = DBH, HT, CVTS, TARIF, CV4, CVT
 
         # return the requested metric
         return self.get(metric)
@@ -553,20 +736,12 @@ class Eq_8(Equation):
         """
         if DBH <=0 or HT <=0: return 0
 
-        BA = 0.005454154 * DBH**2
-        # note that math.log() uses natural logarithm while math.log10() uses log base 10
-        CVTSL = -2.464614 + 1.701993 * math.log10(DBH) + 1.067038 * math.log10(HT)
-        CVTS = 10**CVTSL
-        TARIF = (CVTS * 0.912733)/((1.033 * (1.0 + 1.382937 * math.exp(-4.015292 * DBH))) * (BA + 0.087266) - 0.174533)
-        CV4 = TARIF * (BA - 0.087266)/0.912733
-        CVT = TARIF * (0.9679 - 0.1051 * 0.5523**(DBH-1.5))*((1.033*(1.0 + 1.382937 * math.exp(-4.015292*(DBH/10.0))))*(BA + 0.087266)-0.174533)/0.912733
+        BA = _BA_COEF * DBH*DBH
+        CVTS = 10**-2.464614 * DBH**1.701993 * HT**1.067038
+        TARIF, CVT, CV4 = _tarif_cubic(CVTS, DBH, BA)
 
         # set these attributes
-        attributes = {'DBH': DBH, 'HT': HT, 'CVTS': CVTS, 'TARIF': TARIF, 'CV4': CV4, 'CVT': CVT}
-        self.set_attributes(attributes)
-
-        # calculate and set the boardfoot volume metrics
-        self.calcBF()
+        self.DBH, self.HT, self.CVTS, self.TARIF, self.CV4, self.CVT = DBH, HT, CVTS, TARIF, CV4, CVT
 
         # return the requested metric
         return self.get(metric)
@@ -599,20 +774,12 @@ class Eq_9(Equation):
         """
         if DBH <=0 or HT <=0: return 0
 
-        BA = 0.005454154 * DBH**2
-        # note that math.log() uses natural logarithm while math.log10() uses log base 10
-        CVTSL = -2.379642 + 1.682300 * math.log10(DBH) + 1.039712 * math.log10(HT)
-        CVTS = 10**CVTSL
-        TARIF = (CVTS * 0.912733)/((1.033 * (1.0 + 1.382937 * math.exp(-4.015292 * DBH))) * (BA + 0.087266) - 0.174533)
-        CV4 = TARIF * (BA - 0.087266)/0.912733
-        CVT = TARIF * (0.9679 - 0.1051 * 0.5523**(DBH-1.5))*((1.033*(1.0 + 1.382937 * math.exp(-4.015292*(DBH/10.0))))*(BA + 0.087266)-0.174533)/0.912733
+        BA = _BA_COEF * DBH*DBH
+        CVTS = 10**-2.379642 * DBH**1.682300 * HT**1.039712
+        TARIF, CVT, CV4 = _tarif_cubic(CVTS, DBH, BA)
 
         # set these attributes
-        attributes = {'DBH': DBH, 'HT': HT, 'CVTS': CVTS, 'TARIF': TARIF, 'CV4': CV4, 'CVT': CVT}
-        self.set_attributes(attributes)
-
-        # calculate and set the boardfoot volume metrics
-        self.calcBF()
+        self.DBH, self.HT, self.CVTS, self.TARIF, self.CV4, self.CVT = DBH, HT, CVTS, TARIF, CV4, CVT
 
         # return the requested metric
         return self.get(metric)
@@ -645,20 +812,12 @@ class Eq_10(Equation):
         """
         if DBH <=0 or HT <=0: return 0
 
-        BA = 0.005454154 * DBH**2
-        # note that math.log() uses natural logarithm while math.log10() uses log base 10
-        CVTSL = -2.502332 + 1.864963 * math.log10(DBH) + 1.004903 * math.log10(HT)
-        CVTS = 10**CVTSL
-        TARIF = (CVTS * 0.912733)/((1.033 * (1.0 + 1.382937 * math.exp(-4.015292 * DBH))) * (BA + 0.087266) - 0.174533)
-        CV4 = TARIF * (BA - 0.087266)/0.912733
-        CVT = TARIF * (0.9679 - 0.1051 * 0.5523**(DBH-1.5))*((1.033*(1.0 + 1.382937 * math.exp(-4.015292*(DBH/10.0))))*(BA + 0.087266)-0.174533)/0.912733
+        BA = _BA_COEF * DBH*DBH
+        CVTS = 10**-2.502332 * DBH**1.864963 * HT**1.004903
+        TARIF, CVT, CV4 = _tarif_cubic(CVTS, DBH, BA)
 
         # set these attributes
-        attributes = {'DBH': DBH, 'HT': HT, 'CVTS': CVTS, 'TARIF': TARIF, 'CV4': CV4, 'CVT': CVT}
-        self.set_attributes(attributes)
-
-        # calculate and set the boardfoot volume metrics
-        self.calcBF()
+        self.DBH, self.HT, self.CVTS, self.TARIF, self.CV4, self.CVT = DBH, HT, CVTS, TARIF, CV4, CVT
 
         # return the requested metric
         return self.get(metric)
@@ -691,20 +850,12 @@ class Eq_11(Equation):
         """
         if DBH <=0 or HT <=0: return 0
 
-        BA = 0.005454154 * DBH**2
-        # note that math.log() uses natural logarithm while math.log10() uses log base 10
-        CVTSL = -2.575642 + 1.806775 * math.log10(DBH) + 1.094665 * math.log10(HT)
-        CVTS = 10**CVTSL
-        TARIF = (CVTS * 0.912733)/((1.033 * (1.0 + 1.382937 * math.exp(-4.015292 * DBH))) * (BA + 0.087266) - 0.174533)
-        CV4 = TARIF * (BA - 0.087266)/0.912733
-        CVT = TARIF * (0.9679 - 0.1051 * 0.5523**(DBH-1.5))*((1.033*(1.0 + 1.382937 * math.exp(-4.015292*(DBH/10.0))))*(BA + 0.087266)-0.174533)/0.912733
+        BA = _BA_COEF * DBH*DBH
+        CVTS = 10**-2.575642 * DBH**1.806775 * HT**1.094665
+        TARIF, CVT, CV4 = _tarif_cubic(CVTS, DBH, BA)
 
         # set these attributes
-        attributes = {'DBH': DBH, 'HT': HT, 'CVTS': CVTS, 'TARIF': TARIF, 'CV4': CV4, 'CVT': CVT}
-        self.set_attributes(attributes)
-
-        # calculate and set the boardfoot volume metrics
-        self.calcBF()
+        self.DBH, self.HT, self.CVTS, self.TARIF, self.CV4, self.CVT = DBH, HT, CVTS, TARIF, CV4, CVT
 
         # return the requested metric
         return self.get(metric)
@@ -737,20 +888,12 @@ class Eq_12(Equation):
         """
         if DBH <=0 or HT <=0: return 0
 
-        BA = 0.005454154 * DBH**2
-        # note that math.log() uses natural logarithm while math.log10() uses log base 10
-        CVTSL = -2.539944 + 1.841226 * math.log10(DBH) + 1.034051 * math.log10(HT)
-        CVTS = 10**CVTSL
-        TARIF = (CVTS * 0.912733)/((1.033 * (1.0 + 1.382937 * math.exp(-4.015292 * DBH))) * (BA + 0.087266) - 0.174533)
-        CV4 = TARIF * (BA - 0.087266)/0.912733
-        CVT = TARIF * (0.9679 - 0.1051 * 0.5523**(DBH-1.5))*((1.033*(1.0 + 1.382937 * math.exp(-4.015292*(DBH/10.0))))*(BA + 0.087266)-0.174533)/0.912733
+        BA = _BA_COEF * DBH*DBH
+        CVTS = 10**-2.539944 * DBH**1.841226 * HT**1.034051
+        TARIF, CVT, CV4 = _tarif_cubic(CVTS, DBH, BA)
 
         # set these attributes
-        attributes = {'DBH': DBH, 'HT': HT, 'CVTS': CVTS, 'TARIF': TARIF, 'CV4': CV4, 'CVT': CVT}
-        self.set_attributes(attributes)
-
-        # calculate and set the boardfoot volume metrics
-        self.calcBF()
+        self.DBH, self.HT, self.CVTS, self.TARIF, self.CV4, self.CVT = DBH, HT, CVTS, TARIF, CV4, CVT
 
         # return the requested metric
         return self.get(metric)
@@ -783,20 +926,12 @@ class Eq_13(Equation):
         """
         if DBH <=0 or HT <=0: return 0
 
-        BA = 0.005454154 * DBH**2
-        # note that math.log() uses natural logarithm while math.log10() uses log base 10
-        CVTSL = -2.700574 + 1.754171 * math.log10(DBH) + 1.164531 * math.log10(HT)
-        CVTS = 10**CVTSL
-        TARIF = (CVTS * 0.912733)/((1.033 * (1.0 + 1.382937 * math.exp(-4.015292 * DBH))) * (BA + 0.087266) - 0.174533)
-        CV4 = TARIF * (BA - 0.087266)/0.912733
-        CVT = TARIF * (0.9679 - 0.1051 * 0.5523**(DBH-1.5))*((1.033*(1.0 + 1.382937 * math.exp(-4.015292*(DBH/10.0))))*(BA + 0.087266)-0.174533)/0.912733
+        BA = _BA_COEF * DBH*DBH
+        CVTS = 10**-2.700574 * DBH**1.754171 * HT**1.164531
+        TARIF, CVT, CV4 = _tarif_cubic(CVTS, DBH, BA)
 
         # set these attributes
-        attributes = {'DBH': DBH, 'HT': HT, 'CVTS': CVTS, 'TARIF': TARIF, 'CV4': CV4, 'CVT': CVT}
-        self.set_attributes(attributes)
-
-        # calculate and set the boardfoot volume metrics
-        self.calcBF()
+        self.DBH, self.HT, self.CVTS, self.TARIF, self.CV4, self.CVT = DBH, HT, CVTS, TARIF, CV4, CVT
 
         # return the requested metric
         return self.get(metric)
@@ -837,13 +972,11 @@ class Eq_14(Equation):
             CVTS = 0.1
 
         # THERE IS NO BOARDFOOT VOLUME EQUATION
+        if metric in BF_METRICS:
+            return 0
 
         # set these attributes
-        attributes = {'DBH': DRC, 'HT': HT, 'CVTS': CVTS}
-        self.set_attributes(attributes)
-
-        # calculate and set the boardfoot volume metrics
-        self.calcBF()
+        self.DBH, self.HT, self.CVTS = DRC, HT, CVTS
 
         # return the requested metric
         return self.get(metric)
@@ -883,13 +1016,11 @@ class Eq_141(Equation):
             CVTS = 0.1
 
         # THERE IS NO BOARDFOOT VOLUME EQUATION
+        if metric in BF_METRICS:
+            return 0
 
         # set these attributes
-        attributes = {'DBH': DRC, 'HT': HT, 'CVTS': CVTS}
-        self.set_attributes(attributes)
-
-        # calculate and set the boardfoot volume metrics
-        self.calcBF()
+        self.DBH, self.HT, self.CVTS = DRC, HT, CVTS
 
         # return the requested metric
         return self.get(metric)
@@ -924,13 +1055,11 @@ class Eq_142(Equation):
             CVTS = 0.1
 
         # THERE IS NO BOARDFOOT VOLUME EQUATION
+        if metric in BF_METRICS:
+            return 0
 
         # set these attributes
-        attributes = {'DBH': DRC, 'HT': HT, 'CVTS': CVTS}
-        self.set_attributes(attributes)
-
-        # calculate and set the boardfoot volume metrics
-        self.calcBF()
+        self.DBH, self.HT, self.CVTS = DRC, HT, CVTS
 
         # return the requested metric
         return self.get(metric)
@@ -963,20 +1092,12 @@ class Eq_15(Equation):
         """
         if DBH <=0 or HT <=0: return 0
 
-        BA = 0.005454154 * DBH**2
-        # note that math.log() uses natural logarithm while math.log10() uses log base 10
-        CVTSL = -2.615591 + 1.847504 * math.log10(DBH) + 1.085772 * math.log10(HT)
-        CVTS = 10**CVTSL
-        TARIF = (CVTS * 0.912733)/((1.033 * (1.0 + 1.382937 * math.exp(-4.015292 * DBH))) * (BA + 0.087266) - 0.174533)
-        CV4 = TARIF * (BA - 0.087266)/0.912733
-        CVT = TARIF * (0.9679 - 0.1051 * 0.5523**(DBH-1.5))*((1.033*(1.0 + 1.382937 * math.exp(-4.015292*(DBH/10.0))))*(BA + 0.087266)-0.174533)/0.912733
+        BA = _BA_COEF * DBH*DBH
+        CVTS = 10**-2.615591 * DBH**1.847504 * HT**1.085772
+        TARIF, CVT, CV4 = _tarif_cubic(CVTS, DBH, BA)
 
         # set these attributes
-        attributes = {'DBH': DBH, 'HT': HT, 'CVTS': CVTS, 'TARIF': TARIF, 'CV4': CV4, 'CVT': CVT}
-        self.set_attributes(attributes)
-
-        # calculate and set the boardfoot volume metrics
-        self.calcBF()
+        self.DBH, self.HT, self.CVTS, self.TARIF, self.CV4, self.CVT = DBH, HT, CVTS, TARIF, CV4, CVT
 
         # return the requested metric
         return self.get(metric)
@@ -1010,21 +1131,15 @@ class Eq_16(Equation):
         TMP_DBH = 6.0      # are only called in equations below if DBH <6. Assign TMP_DBH regardless.
 
         # CALCULATE BASAL AREA PER TREE USING DBH AND DBH_TEMP
-        BA = DBH**2 * 0.005454154
-        BA_TMP = TMP_DBH **2 * 0.005454154
+        BA = DBH*DBH * _BA_COEF
+        BA_TMP = TMP_DBH*TMP_DBH * _BA_COEF
 
         # CALCULATE A CUBIC FORM FACTOR (CF4) USING TMP_DBH and DBH
         # CF4 EQUATIONS VARY BY VOLUME EQUATION
-        CF4 = 0.422709 - 0.0000612236 * (HT**2/DBH)
-        if(CF4 < 0.3):
-            CF4=0.3
-        if(CF4 > 0.4):
-            CF4=0.4
-        CF4_TMP = 0.422709 - 0.0000612236 * (HT**2/TMP_DBH)
-        if(CF4_TMP < 0.3):
-            CF4_TMP=0.3
-        if(CF4_TMP > 0.4):
-            CF4_TMP=0.4
+        CF4 = 0.422709 - 0.0000612236 * (HT*HT/DBH)
+        CF4 = 0.4 if CF4 > 0.4 else (0.3 if CF4 < 0.3 else CF4)
+        CF4_TMP = 0.422709 - 0.0000612236 * (HT*HT/TMP_DBH)
+        CF4_TMP = 0.4 if CF4_TMP > 0.4 else (0.3 if CF4_TMP < 0.3 else CF4_TMP)
 
         # ----------------
         # For ease of use and to improve readability of equations,
@@ -1032,28 +1147,30 @@ class Eq_16(Equation):
         # Note that actual DBH and BA are used for all trees.
         # Do not use TMP_DBH or BA_TMP here.
 
-        TERM = ((1.033 * (1.0 + 1.382937 * math.exp(-4.015292 * (DBH/10.0)))) * (BA + 0.087266) - 0.174533 )
+        TERM = _brackett_term(DBH, BA)
         # ----------------
 
         if DBH >= 6.0:
             CV4 = CF4 * BA * HT
-            TARIF = (CV4 * 0.912733) / (BA - 0.087266)
+            BA_4 = BA - _BA_4IN
+            TARIF = (CV4 * _TARIF_COEF) / BA_4
             if (TARIF <= 0.0):
                 TARIF=0.01
-            CVTS = (CV4 * TERM )/ (BA - 0.087266)
+            CVTS = (CV4 * TERM )/ BA_4
 
     #         # set floor of CVTS to zero (in case equation generates negative values)
     #         CVTS = max(0,CVTS)
 
-            CVT = TARIF * (0.9679 - 0.1051 * 0.5523**(DBH-1.5) ) * TERM / 0.912733
+            CVT = TARIF * _butt_shape(DBH) * TERM * _INV_TARIF_COEF
 
         elif DBH < 6.0:
             CV4_TMP = CF4_TMP *BA_TMP * HT
-            TARIF_TMP = (CV4_TMP * 0.912733) / (BA_TMP - 0.087266)
+            TARIF_TMP = (CV4_TMP * _TARIF_COEF) / (BA_TMP - _BA_4IN)
             if(TARIF_TMP <= 0.0):
                 TARIF_TMP = 0.01
             # CALCULATE An ADJUSTED TARIF FOR SMALL TREES (Both DBH and TMP_DBH are used)
-            TARIF = TARIF_TMP * ( 0.5 * (TMP_DBH - DBH)**2 + (1.0 + 0.063 * (TMP_DBH - DBH)**2) )
+            DBH_DIFF = TMP_DBH - DBH
+            TARIF = TARIF_TMP * ( 0.5 * DBH_DIFF*DBH_DIFF + (1.0 + 0.063 * DBH_DIFF*DBH_DIFF) )
             if(TARIF <= 0.0):
                 TARIF = 0.01
             CVTS = TARIF * TERM
@@ -1061,7 +1178,7 @@ class Eq_16(Equation):
     #         # set floor of CVTS to zero (in case equation generates negative values)
     #         CVTS = max(0,CVTS)
 
-            CVT = TARIF * (0.9679 - 0.1051 * 0.5523**(DBH-1.5) ) * TERM / 0.912733
+            CVT = TARIF * _butt_shape(DBH) * TERM * _INV_TARIF_COEF
             CV4 = CF4 * BA * HT #(calculated with actual DBH and BA)
 
         if DBH < 5.0:
@@ -1070,11 +1187,7 @@ class Eq_16(Equation):
         #    pass # THEN KEEP CV4
 
         # set these attributes
-        attributes = {'DBH': DBH, 'HT': HT, 'CVTS': CVTS, 'TARIF': TARIF, 'CV4': CV4, 'CVT': CVT}
-        self.set_attributes(attributes)
-
-        # calculate and set the boardfoot volume metrics
-        self.calcBF()
+        self.DBH, self.HT, self.CVTS, self.TARIF, self.CV4, self.CVT = DBH, HT, CVTS, TARIF, CV4, CVT
 
         # return the requested metric
         return self.get(metric)
@@ -1104,18 +1217,12 @@ class Eq_17(Equation):
         """
         if DBH <=0 or HT <=0: return 0
 
-        BA = 0.005454154 * DBH**2
+        BA = _BA_COEF * DBH*DBH
         CVTS = 0.001106485 * DBH**1.8140497 * HT**1.2744923
-        TARIF = (CVTS * 0.912733)/((1.033 * (1.0 + 1.382937 * math.exp(-4.015292 * DBH))) * (BA + 0.087266) - 0.174533)
-        CV4 = TARIF * (BA - 0.087266)/0.912733
-        CVT = TARIF * (0.9679 - 0.1051 * 0.5523**(DBH-1.5))*((1.033*(1.0 + 1.382937 * math.exp(-4.015292*(DBH/10.0))))*(BA + 0.087266)-0.174533)/0.912733
+        TARIF, CVT, CV4 = _tarif_cubic(CVTS, DBH, BA)
 
         # set these attributes
-        attributes = {'DBH': DBH, 'HT': HT, 'CVTS': CVTS, 'TARIF': TARIF, 'CV4': CV4, 'CVT': CVT}
-        self.set_attributes(attributes)
-
-        # calculate and set the boardfoot volume metrics
-        self.calcBF()
+        self.DBH, self.HT, self.CVTS, self.TARIF, self.CV4, self.CVT = DBH, HT, CVTS, TARIF, CV4, CVT
 
         # return the requested metric
         return self.get(metric)
@@ -1149,21 +1256,15 @@ class Eq_18(Equation):
         TMP_DBH = 6.0      # are only called in equations below if DBH <6. Assign TMP_DBH regardless.
 
         # CALCULATE BASAL AREA PER TREE USING DBH AND DBH_TEMP
-        BA = DBH**2 * 0.005454154
-        BA_TMP = TMP_DBH **2 * 0.005454154
+        BA = DBH*DBH * _BA_COEF
+        BA_TMP = TMP_DBH*TMP_DBH * _BA_COEF
 
         # CALCULATE A CUBIC FORM FACTOR (CF4) USING TMP_DBH and DBH
         # CF4 EQUATIONS VARY BY VOLUME EQUATION
         CF4 = 0.231237 + 0.028176 * (HT/DBH)
-        if(CF4 < 0.3):
-            CF4=0.3
-        if(CF4 > 0.4):
-            CF4=0.4
+        CF4 = 0.4 if CF4 > 0.4 else (0.3 if CF4 < 0.3 else CF4)
         CF4_TMP = 0.231237 + 0.028176 * (HT/TMP_DBH)
-        if(CF4_TMP < 0.3):
-            CF4_TMP=0.3
-        if(CF4_TMP > 0.4):
-            CF4_TMP=0.4
+        CF4_TMP = 0.4 if CF4_TMP > 0.4 else (0.3 if CF4_TMP < 0.3 else CF4_TMP)
 
         # ----------------
         # For ease of use and to improve readability of equations,
@@ -1171,28 +1272,30 @@ class Eq_18(Equation):
         # Note that actual DBH and BA are used for all trees.
         # Do not use TMP_DBH or BA_TMP here.
 
-        TERM = ((1.033 * (1.0 + 1.382937 * math.exp(-4.015292 * (DBH/10.0)))) * (BA + 0.087266) - 0.174533 )
+        TERM = _brackett_term(DBH, BA)
         # ----------------
 
         if DBH >= 6.0:
             CV4 = CF4 * BA * HT
-            TARIF = (CV4 * 0.912733) / (BA - 0.087266)
+            BA_4 = BA - _BA_4IN
+            TARIF = (CV4 * _TARIF_COEF) / BA_4
             if (TARIF <= 0.0):
                 TARIF=0.01
-            CVTS = (CV4 * TERM )/ (BA - 0.087266)
+            CVTS = (CV4 * TERM )/ BA_4
 
     #         # set floor of CVTS to zero (in case equation generates negative values)
     #         CVTS = max(0,CVTS)
 
-            CVT = TARIF * (0.9679 - 0.1051 * 0.5523**(DBH-1.5) ) * TERM / 0.912733
+            CVT = TARIF * _butt_shape(DBH) * TERM * _INV_TARIF_COEF
 
         elif DBH < 6.0:
             CV4_TMP = CF4_TMP *BA_TMP * HT
-            TARIF_TMP = (CV4_TMP * 0.912733) / (BA_TMP - 0.087266)
+            TARIF_TMP = (CV4_TMP * _TARIF_COEF) / (BA_TMP - _BA_4IN)
             if(TARIF_TMP <= 0.0):
                 TARIF_TMP = 0.01
             # CALCULATE An ADJUSTED TARIF FOR SMALL TREES (Both DBH and TMP_DBH are used)
-            TARIF = TARIF_TMP * ( 0.5 * (TMP_DBH - DBH)**2 + (1.0 + 0.063 * (TMP_DBH - DBH)**2) )
+            DBH_DIFF = TMP_DBH - DBH
+            TARIF = TARIF_TMP * ( 0.5 * DBH_DIFF*DBH_DIFF + (1.0 + 0.063 * DBH_DIFF*DBH_DIFF) )
             if(TARIF <= 0.0):
                 TARIF = 0.01
             CVTS = TARIF * TERM
@@ -1200,7 +1303,7 @@ class Eq_18(Equation):
     #         # set floor of CVTS to zero (in case equation generates negative values)
     #         CVTS = max(0,CVTS)
 
-            CVT = TARIF * (0.9679 - 0.1051 * 0.5523**(DBH-1.5) ) * TERM / 0.912733
+            CVT = TARIF * _butt_shape(DBH) * TERM * _INV_TARIF_COEF
             CV4 = CF4 * BA * HT #(calculated with actual DBH and BA)
 
         if DBH < 5.0:
@@ -1209,11 +1312,7 @@ class Eq_18(Equation):
         #    pass # THEN KEEP CV4
 
         # set these attributes
-        attributes = {'DBH': DBH, 'HT': HT, 'CVTS': CVTS, 'TARIF': TARIF, 'CV4': CV4, 'CVT': CVT}
-        self.set_attributes(attributes)
-
-        # calculate and set the boardfoot volume metrics
-        self.calcBF()
+        self.DBH, self.HT, self.CVTS, self.TARIF, self.CV4, self.CVT = DBH, HT, CVTS, TARIF, CV4, CVT
 
         # return the requested metric
         return self.get(metric)
@@ -1247,18 +1346,16 @@ class Eq_19(Equation):
         TMP_DBH = 6.0      # are only called in equations below if DBH <6. Assign TMP_DBH regardless.
 
         # CALCULATE BASAL AREA PER TREE USING DBH AND DBH_TEMP
-        BA = DBH**2 * 0.005454154
-        BA_TMP = TMP_DBH **2 * 0.005454154
+        BA = DBH*DBH * _BA_COEF
+        BA_TMP = TMP_DBH*TMP_DBH * _BA_COEF
 
         # CALCULATE A CUBIC FORM FACTOR (CF4) USING TMP_DBH and DBH
         # CF4 EQUATIONS VARY BY VOLUME EQUATION
         CF4 = 0.225786 + 4.44236 * (1/HT)
-        if(CF4 < 0.27):
-            CF4=0.27
+        CF4 = 0.27 if CF4 < 0.27 else CF4
 
         CF4_TMP = 0.225786 + 4.44236 * (1/HT)
-        if(CF4_TMP < 0.27):
-            CF4_TMP=0.27
+        CF4_TMP = 0.27 if CF4_TMP < 0.27 else CF4_TMP
 
         # ----------------
         # For ease of use and to improve readability of equations,
@@ -1266,28 +1363,30 @@ class Eq_19(Equation):
         # Note that actual DBH and BA are used for all trees.
         # Do not use TMP_DBH or BA_TMP here.
 
-        TERM = ((1.033 * (1.0 + 1.382937 * math.exp(-4.015292 * (DBH/10.0)))) * (BA + 0.087266) - 0.174533 )
+        TERM = _brackett_term(DBH, BA)
         # ----------------
 
         if DBH >= 6.0:
             CV4 = CF4 * BA * HT
-            TARIF = (CV4 * 0.912733) / (BA - 0.087266)
+            BA_4 = BA - _BA_4IN
+            TARIF = (CV4 * _TARIF_COEF) / BA_4
             if (TARIF <= 0.0):
                 TARIF=0.01
-            CVTS = (CV4 * TERM )/ (BA - 0.087266)
+            CVTS = (CV4 * TERM )/ BA_4
 
     #         # set floor of CVTS to zero (in case equation generates negative values)
     #         CVTS = max(0,CVTS)
 
-            CVT = TARIF * (0.9679 - 0.1051 * 0.5523**(DBH-1.5) ) * TERM / 0.912733
+            CVT = TARIF * _butt_shape(DBH) * TERM * _INV_TARIF_COEF
 
         elif DBH < 6.0:
             CV4_TMP = CF4_TMP *BA_TMP * HT
-            TARIF_TMP = (CV4_TMP * 0.912733) / (BA_TMP - 0.087266)
+            TARIF_TMP = (CV4_TMP * _TARIF_COEF) / (BA_TMP - _BA_4IN)
             if(TARIF_TMP <= 0.0):
                 TARIF_TMP = 0.01
             # CALCULATE An ADJUSTED TARIF FOR SMALL TREES (Both DBH and TMP_DBH are used)
-            TARIF = TARIF_TMP * ( 0.5 * (TMP_DBH - DBH)**2 + (1.0 + 0.063 * (TMP_DBH - DBH)**2) )
+            DBH_DIFF = TMP_DBH - DBH
+            TARIF = TARIF_TMP * ( 0.5 * DBH_DIFF*DBH_DIFF + (1.0 + 0.063 * DBH_DIFF*DBH_DIFF) )
             if(TARIF <= 0.0):
                 TARIF = 0.01
             CVTS = TARIF * TERM
@@ -1295,7 +1394,7 @@ class Eq_19(Equation):
     #         # set floor of CVTS to zero (in case equation generates negative values)
     #         CVTS = max(0,CVTS)
 
-            CVT = TARIF * (0.9679 - 0.1051 * 0.5523**(DBH-1.5) ) * TERM / 0.912733
+            CVT = TARIF * _butt_shape(DBH) * TERM * _INV_TARIF_COEF
             CV4 = CF4 * BA * HT #(calculated with actual DBH and BA)
 
         if DBH < 5.0:
@@ -1304,11 +1403,7 @@ class Eq_19(Equation):
         #    pass # THEN KEEP CV4
 
         # set these attributes
-        attributes = {'DBH': DBH, 'HT': HT, 'CVTS': CVTS, 'TARIF': TARIF, 'CV4': CV4, 'CVT': CVT}
-        self.set_attributes(attributes)
-
-        # calculate and set the boardfoot volume metrics
-        self.calcBF()
+        self.DBH, self.HT, self.CVTS, self.TARIF, self.CV4, self.CVT = DBH, HT, CVTS, TARIF, CV4, CVT
 
         # return the requested metric
         return self.get(metric)
@@ -1342,21 +1437,15 @@ class Eq_20(Equation):
         TMP_DBH = 6.0      # are only called in equations below if DBH <6. Assign TMP_DBH regardless.
 
         # CALCULATE BASAL AREA PER TREE USING DBH AND DBH_TEMP
-        BA = DBH**2 * 0.005454154
-        BA_TMP = TMP_DBH **2 * 0.005454154
+        BA = DBH*DBH * _BA_COEF
+        BA_TMP = TMP_DBH*TMP_DBH * _BA_COEF
 
         # CALCULATE A CUBIC FORM FACTOR (CF4) USING TMP_DBH and DBH
         # CF4 EQUATIONS VARY BY VOLUME EQUATION
         CF4 = 0.358550 - 0.488134 * (1/DBH)
-        if(CF4 < 0.3):
-            CF4=0.3
-        if(CF4 > 0.4):
-            CF4=0.4
+        CF4 = 0.4 if CF4 > 0.4 else (0.3 if CF4 < 0.3 else CF4)
         CF4_TMP = 0.358550 - 0.488134 * (1/ TMP_DBH)
-        if(CF4_TMP < 0.3):
-            CF4_TMP=0.3
-        if(CF4_TMP > 0.4):
-            CF4_TMP=0.4
+        CF4_TMP = 0.4 if CF4_TMP > 0.4 else (0.3 if CF4_TMP < 0.3 else CF4_TMP)
 
         # ----------------
         # For ease of use and to improve readability of equations,
@@ -1364,28 +1453,30 @@ class Eq_20(Equation):
         # Note that actual DBH and BA are used for all trees.
         # Do not use TMP_DBH or BA_TMP here.
 
-        TERM = ((1.033 * (1.0 + 1.382937 * math.exp(-4.015292 * (DBH/10.0)))) * (BA + 0.087266) - 0.174533 )
+        TERM = _brackett_term(DBH, BA)
         # ----------------
 
         if DBH >= 6.0:
             CV4 = CF4 * BA * HT
-            TARIF = (CV4 * 0.912733) / (BA - 0.087266)
+            BA_4 = BA - _BA_4IN
+            TARIF = (CV4 * _TARIF_COEF) / BA_4
             if (TARIF <= 0.0):
                 TARIF=0.01
-            CVTS = (CV4 * TERM )/ (BA - 0.087266)
+            CVTS = (CV4 * TERM )/ BA_4
 
     #         # set floor of CVTS to zero (in case equation generates negative values)
     #         CVTS = max(0,CVTS)
 
-            CVT = TARIF * (0.9679 - 0.1051 * 0.5523**(DBH-1.5) ) * TERM / 0.912733
+            CVT = TARIF * _butt_shape(DBH) * TERM * _INV_TARIF_COEF
 
         elif DBH < 6.0:
             CV4_TMP = CF4_TMP *BA_TMP * HT
-            TARIF_TMP = (CV4_TMP * 0.912733) / (BA_TMP - 0.087266)
+            TARIF_TMP = (CV4_TMP * _TARIF_COEF) / (BA_TMP - _BA_4IN)
             if(TARIF_TMP <= 0.0):
                 TARIF_TMP = 0.01
             # CALCULATE An ADJUSTED TARIF FOR SMALL TREES (Both DBH and TMP_DBH are used)
-            TARIF = TARIF_TMP * ( 0.5 * (TMP_DBH - DBH)**2 + (1.0 + 0.063 * (TMP_DBH - DBH)**2) )
+            DBH_DIFF = TMP_DBH - DBH
+            TARIF = TARIF_TMP * ( 0.5 * DBH_DIFF*DBH_DIFF + (1.0 + 0.063 * DBH_DIFF*DBH_DIFF) )
             if(TARIF <= 0.0):
                 TARIF = 0.01
             CVTS = TARIF * TERM
@@ -1393,7 +1484,7 @@ class Eq_20(Equation):
     #         # set floor of CVTS to zero (in case equation generates negative values)
     #         CVTS = max(0,CVTS)
 
-            CVT = TARIF * (0.9679 - 0.1051 * 0.5523**(DBH-1.5) ) * TERM / 0.912733
+            CVT = TARIF * _butt_shape(DBH) * TERM * _INV_TARIF_COEF
             CV4 = CF4 * BA * HT #(calculated with actual DBH and BA)
 
         if DBH < 5.0:
@@ -1402,11 +1493,7 @@ class Eq_20(Equation):
         #    pass # THEN KEEP CV4
 
         # set these attributes
-        attributes = {'DBH': DBH, 'HT': HT, 'CVTS': CVTS, 'TARIF': TARIF, 'CV4': CV4, 'CVT': CVT}
-        self.set_attributes(attributes)
-
-        # calculate and set the boardfoot volume metrics
-        self.calcBF()
+        self.DBH, self.HT, self.CVTS, self.TARIF, self.CV4, self.CVT = DBH, HT, CVTS, TARIF, CV4, CVT
 
         # return the requested metric
         return self.get(metric)
@@ -1435,12 +1522,13 @@ class Eq_21(Equation):
         """
         if DBH <=0 or HT <=0: return 0
 
-        BA = 0.005454154 * DBH**2
-        CVTS = 0.005454154 * (0.30708901 + 0.00086157622 * HT - 0.0037255243 * DBH * HT/(HT-4.5)) * DBH**2 * HT * (HT/(HT-4.5))**2
+        BA = _BA_COEF * DBH*DBH
+        HT_RATIO = HT/(HT-4.5)
+        CVTS = _BA_COEF * (0.30708901 + 0.00086157622 * HT - 0.0037255243 * DBH * HT/(HT-4.5)) * DBH*DBH * HT * HT_RATIO*HT_RATIO
 
-        TARIF = (CVTS * 0.912733)/((1.033 * (1.0 + 1.382937 * math.exp(-4.015292 * DBH))) * (BA + 0.087266) - 0.174533)
+        TARIF = (CVTS * _TARIF_COEF)/((1.033 * (1.0 + _BRACKETT_A * math.exp(-_BRACKETT_B * DBH))) * (BA + _BA_4IN) - _BA_4IN_X2)
         CV4 = (CVTS + 3.48) / (1.18052 + 0.32736 * math.exp(-0.1 * DBH)) - 2.948
-        CVT = TARIF * (0.9679 - 0.1051 * 0.5523**(DBH-1.5))*((1.033*(1.0 + 1.382937 * math.exp(-4.015292*(DBH/10.0))))*(BA + 0.087266)-0.174533)/0.912733
+        CVT = TARIF * _butt_shape(DBH) * _brackett_term(DBH, BA) * _INV_TARIF_COEF
 
         if CVTS < 0:
             CVTS = 2
@@ -1448,11 +1536,7 @@ class Eq_21(Equation):
             CV4 = 1
 
         # set these attributes
-        attributes = {'DBH': DBH, 'HT': HT, 'CVTS': CVTS, 'TARIF': TARIF, 'CV4': CV4, 'CVT': CVT}
-        self.set_attributes(attributes)
-
-        # calculate and set the boardfoot volume metrics
-        self.calcBF()
+        self.DBH, self.HT, self.CVTS, self.TARIF, self.CV4, self.CVT = DBH, HT, CVTS, TARIF, CV4, CVT
 
         # return the requested metric
         return self.get(metric)
@@ -1478,20 +1562,12 @@ class Eq_22(Equation):
         """
         if DBH <=0 or HT <=0: return 0
 
-        BA = 0.005454154 * DBH**2
-        # note that math.log() uses natural logarithm while math.log10() uses log base 10
-        CVTSL = -2.624325 + 1.847123 * math.log10(DBH) + 1.044007 * math.log10(HT)
-        CVTS = 10**CVTSL
-        TARIF = (CVTS * 0.912733)/((1.033 * (1.0 + 1.382937 * math.exp(-4.015292 * DBH))) * (BA + 0.087266) - 0.174533)
-        CV4 = TARIF * (BA - 0.087266)/0.912733
-        CVT = TARIF * (0.9679 - 0.1051 * 0.5523**(DBH-1.5))*((1.033*(1.0 + 1.382937 * math.exp(-4.015292*(DBH/10.0))))*(BA + 0.087266)-0.174533)/0.912733
+        BA = _BA_COEF * DBH*DBH
+        CVTS = 10**-2.624325 * DBH**1.847123 * HT**1.044007
+        TARIF, CVT, CV4 = _tarif_cubic(CVTS, DBH, BA)
 
         # set these attributes
-        attributes = {'DBH': DBH, 'HT': HT, 'CVTS': CVTS, 'TARIF': TARIF, 'CV4': CV4, 'CVT': CVT}
-        self.set_attributes(attributes)
-
-        # calculate and set the boardfoot volume metrics
-        self.calcBF()
+        self.DBH, self.HT, self.CVTS, self.TARIF, self.CV4, self.CVT = DBH, HT, CVTS, TARIF, CV4, CVT
 
         # return the requested metric
         return self.get(metric)
@@ -1525,21 +1601,15 @@ class Eq_23(Equation):
         TMP_DBH = 6.0      # are only called in equations below if DBH <6. Assign TMP_DBH regardless.
 
         # CALCULATE BASAL AREA PER TREE USING DBH AND DBH_TEMP
-        BA = DBH**2 * 0.005454154
-        BA_TMP = TMP_DBH **2 * 0.005454154
+        BA = DBH*DBH * _BA_COEF
+        BA_TMP = TMP_DBH*TMP_DBH * _BA_COEF
 
         # CALCULATE A CUBIC FORM FACTOR (CF4) USING TMP_DBH and DBH
         # CF4 EQUATIONS VARY BY VOLUME EQUATION
-        CF4 = 0.299039 + 1.91272 * (1/HT) + 0.0000367217 * (HT**2/DBH)
-        if(CF4 < 0.3):
-            CF4=0.3
-        if(CF4 > 0.4):
-            CF4=0.4
-        CF4_TMP = 0.299039 + 1.91272 * (1/HT) + 0.0000367217 * (HT**2/TMP_DBH)
-        if(CF4_TMP < 0.3):
-            CF4_TMP=0.3
-        if(CF4_TMP > 0.4):
-            CF4_TMP=0.4
+        CF4 = 0.299039 + 1.91272 * (1/HT) + 0.0000367217 * (HT*HT/DBH)
+        CF4 = 0.4 if CF4 > 0.4 else (0.3 if CF4 < 0.3 else CF4)
+        CF4_TMP = 0.299039 + 1.91272 * (1/HT) + 0.0000367217 * (HT*HT/TMP_DBH)
+        CF4_TMP = 0.4 if CF4_TMP > 0.4 else (0.3 if CF4_TMP < 0.3 else CF4_TMP)
 
         # ----------------
         # For ease of use and to improve readability of equations,
@@ -1547,28 +1617,30 @@ class Eq_23(Equation):
         # Note that actual DBH and BA are used for all trees.
         # Do not use TMP_DBH or BA_TMP here.
 
-        TERM = ((1.033 * (1.0 + 1.382937 * math.exp(-4.015292 * (DBH/10.0)))) * (BA + 0.087266) - 0.174533 )
+        TERM = _brackett_term(DBH, BA)
         # ----------------
 
         if DBH >= 6.0:
             CV4 = CF4 * BA * HT
-            TARIF = (CV4 * 0.912733) / (BA - 0.087266)
+            BA_4 = BA - _BA_4IN
+            TARIF = (CV4 * _TARIF_COEF) / BA_4
             if (TARIF <= 0.0):
                 TARIF=0.01
-            CVTS = (CV4 * TERM )/ (BA - 0.087266)
+            CVTS = (CV4 * TERM )/ BA_4
 
     #         # set floor of CVTS to zero (in case equation generates negative values)
     #         CVTS = max(0,CVTS)
 
-            CVT = TARIF * (0.9679 - 0.1051 * 0.5523**(DBH-1.5) ) * TERM / 0.912733
+            CVT = TARIF * _butt_shape(DBH) * TERM * _INV_TARIF_COEF
 
         elif DBH < 6.0:
             CV4_TMP = CF4_TMP *BA_TMP * HT
-            TARIF_TMP = (CV4_TMP * 0.912733) / (BA_TMP - 0.087266)
+            TARIF_TMP = (CV4_TMP * _TARIF_COEF) / (BA_TMP - _BA_4IN)
             if(TARIF_TMP <= 0.0):
                 TARIF_TMP = 0.01
             # CALCULATE An ADJUSTED TARIF FOR SMALL TREES (Both DBH and TMP_DBH are used)
-            TARIF = TARIF_TMP * ( 0.5 * (TMP_DBH - DBH)**2 + (1.0 + 0.063 * (TMP_DBH - DBH)**2) )
+            DBH_DIFF = TMP_DBH - DBH
+            TARIF = TARIF_TMP * ( 0.5 * DBH_DIFF*DBH_DIFF + (1.0 + 0.063 * DBH_DIFF*DBH_DIFF) )
             if(TARIF <= 0.0):
                 TARIF = 0.01
             CVTS = TARIF * TERM
@@ -1576,7 +1648,7 @@ class Eq_23(Equation):
     #         # set floor of CVTS to zero (in case equation generates negative values)
     #         CVTS = max(0,CVTS)
 
-            CVT = TARIF * (0.9679 - 0.1051 * 0.5523**(DBH-1.5) ) * TERM / 0.912733
+            CVT = TARIF * _butt_shape(DBH) * TERM * _INV_TARIF_COEF
             CV4 = CF4 * BA * HT #(calculated with actual DBH and BA)
 
         if DBH < 5.0:
@@ -1585,11 +1657,7 @@ class Eq_23(Equation):
         #    pass # THEN KEEP CV4
 
         # set these attributes
-        attributes = {'DBH': DBH, 'HT': HT, 'CVTS': CVTS, 'TARIF': TARIF, 'CV4': CV4, 'CVT': CVT}
-        self.set_attributes(attributes)
-
-        # calculate and set the boardfoot volume metrics
-        self.calcBF()
+        self.DBH, self.HT, self.CVTS, self.TARIF, self.CV4, self.CVT = DBH, HT, CVTS, TARIF, CV4, CVT
 
         # return the requested metric
         return self.get(metric)
@@ -1619,19 +1687,12 @@ class Eq_24(Equation):
         """
         if DBH <=0 or HT <=0: return 0
 
-        BA = 0.005454154 * DBH**2
-        # note that math.log() uses natural logarithm while math.log10() uses log base 10
-        CVTS = math.exp(-6.2597 + 1.9967 * math.log(DBH) + 0.9642 * math.log(HT))
-        TARIF = (CVTS * 0.912733)/((1.033 * (1.0 + 1.382937 * math.exp(-4.015292 * DBH))) * (BA + 0.087266) - 0.174533)
-        CV4 = TARIF * (BA - 0.087266) / 0.912733
-        CVT = TARIF * (0.9679 - 0.1051 * 0.5523**(DBH-1.5))*((1.033*(1.0 + 1.382937 * math.exp(-4.015292*(DBH/10.0))))*(BA + 0.087266)-0.174533)/0.912733
+        BA = _BA_COEF * DBH*DBH
+        CVTS = math.exp(-6.2597) * DBH**1.9967 * HT**0.9642
+        TARIF, CVT, CV4 = _tarif_cubic(CVTS, DBH, BA)
 
         # set these attributes
-        attributes = {'DBH': DBH, 'HT': HT, 'CVTS': CVTS, 'TARIF': TARIF, 'CV4': CV4, 'CVT': CVT}
-        self.set_attributes(attributes)
-
-        # calculate and set the boardfoot volume metrics
-        self.calcBF()
+        self.DBH, self.HT, self.CVTS, self.TARIF, self.CV4, self.CVT = DBH, HT, CVTS, TARIF, CV4, CVT
 
         # return the requested metric
         return self.get(metric)
@@ -1664,30 +1725,33 @@ class Eq_25(Equation):
         if HT <18:
             HT = 18
 
-        BA = 0.005454154 * DBH**2
+        BA = _BA_COEF * DBH*DBH
 
         Z = (HT - 0.5 - DBH/24.0)/(HT - 4.5)
 
-        F = 0.3651*Z**2.5 - 7.9032*(Z**2.5)*DBH/1000.0 + 3.295*(Z**2.5)*HT/1000.0 - 1.9856*(Z**2.5)*HT*DBH/100000.0 +             -2.9668*(Z**2.5)*(HT**2)/1000000.0 + 1.5092*(Z**2.5)*(HT**0.5)/1000.0 + 4.9395*(Z**4.0)*DBH/1000.0 +             -2.05937*(Z**4.0)*HT/1000.0 + 1.5042*(Z**33.0)*HT*DBH/1000000.0 - 1.1433*(Z**33.0)*(HT**0.5)/10000.0 +             1.809*(Z**41.0)*(HT**2)/10000000.0
+        # powers of Z that are used several times
+        Z25 = Z**2.5
+        Z4 = Z*Z*Z*Z
+        Z33 = Z**33.0
+        SQRT_HT = math.sqrt(HT)
+
+        F = 0.3651*Z25 - 7.9032*Z25*DBH/1000.0 + 3.295*Z25*HT/1000.0 - 1.9856*Z25*HT*DBH/100000.0 +             -2.9668*Z25*(HT*HT)/1000000.0 + 1.5092*Z25*SQRT_HT/1000.0 + 4.9395*Z4*DBH/1000.0 +             -2.05937*Z4*HT/1000.0 + 1.5042*Z33*HT*DBH/1000000.0 - 1.1433*Z33*SQRT_HT/10000.0 +             1.809*(Z**41.0)*(HT*HT)/10000000.0
 
-        CVT = 0.00545415 * DBH**2 * (HT-4.5)*F
-        TARIF = (CVT * 0.912733)/((0.9679 - 0.1051 * 0.5523**(DBH-1.5))*((1.033 * (1.0 + 1.382937 * math.exp(-4.015292 * (DBH/10.0)))) * (BA + 0.087266) - 0.174533))
-        CVTS = TARIF * ((1.0330*(1.0 + 1.382937 * math.exp(-4.015292*(DBH/10.0))))*(BA + 0.087266) - 0.174533)/0.912733
+        CVT = 0.00545415 * DBH*DBH * (HT-4.5)*F
+        TERM = _brackett_term(DBH, BA)
+        TARIF = (CVT * _TARIF_COEF)/(_butt_shape(DBH) * TERM)
+        CVTS = TARIF * TERM * _INV_TARIF_COEF
 
         # set floor of CVTS to zero (in case equation generates negative values)
         CVTS = max(0,CVTS)
 
-        CV4 = TARIF * (BA - 0.087266)/0.912733
-        RC8 = 0.983 - (0.983 * 0.65**(DBH-8.6))
+        CV4 = TARIF * (BA - _BA_4IN) * _INV_TARIF_COEF
+        RC8 = _rc8(DBH)
         CV8 = RC8 * CV4
         # CV4X = CV4 # this is not used in this set of equations, only in BF calculation and is calculated there
 
         # set these attributes
-        attributes = {'DBH': DBH, 'HT': HT, 'CVTS': CVTS, 'TARIF': TARIF, 'CV4': CV4, 'CVT': CVT, 'CV8': CV8}
-        self.set_attributes(attributes)
-
-        # calculate and set the boardfoot volume metrics
-        self.calcBF()
+        self.DBH, self.HT, self.CVTS, self.TARIF, self.CV4, self.CVT, self.CV8 = DBH, HT, CVTS, TARIF, CV4, CVT, CV8
 
         # return the requested metric
         return self.get(metric)
@@ -1698,274 +1762,79 @@ class Eq_25(Equation):
 # Brackett, Michael.  1977. Notes on TARIF tree-volume computation.  DNR report #24.
 # State of Washington, Department of Natural Resources, Olympia, WA. 132p.
 
-class Eq_26(Equation):
+class Eq_26(BrackettHWEquation):
+    calc_CVTS = _log_linear_CVTS(-2.672775, 1.920617, 1.074024)
+
     def __init__(self):
         self.eq_num = 26
         self.wood_type = 'HW'
 
-    def calc(self, DBH, HT, metric):
-        """
-        WHERE:
-        DBH (inches) = DBH (CM) CONVERTED TO INCHES (DBH/2.54)
-        HT (feet) = HT (M) CONVERTED TO FEET (HT/0.3048)
-        BA = BASAL AREA (DBH IN INCHES) BA= .005454154 x DBH2
-        CVTSL = LOG BASE 10, CUBIC FOOT VOLUME, INCLUDING TOP AND STUMP
-        CVTS = CUBIC FOOT VOLUME, INCLUDING TOP AND STUMP
-        TARIF = TARIF NUMBER EQUATION (REF. DNR NOTE NO.27, P.2)
-        CVT = CUBIC FOOT VOLUME ABOVE STUMP
-        CV4 = CUBIC FOOT VOLUME ABOVE STUMP, 4-INCH TOP
-        """
-        if DBH <=0 or HT <=0: return 0
-
-        BA = 0.005454154 * DBH**2
-        # note that math.log() uses natural logarithm while math.log10() uses log base 10
-        CVTSL = -2.672775 + 1.920617 * math.log10(DBH) + 1.074024 * math.log10(HT)
-        CVTS = 10**CVTSL
-        TARIF = (CVTS * 0.912733)/((1.033 * (1.0 + 1.382937 * math.exp(-4.015292 * DBH))) * (BA + 0.087266) - 0.174533)
-        CVT = TARIF * (0.9679 - 0.1051 * 0.5523**(DBH-1.5))*((1.033*(1.0 + 1.382937 * math.exp(-4.015292*(DBH/10.0))))*(BA + 0.087266)-0.174533)/0.912733
-        CV4 = TARIF * (BA - 0.087266)/0.912733
-        RC8 = 0.983 - (0.983 * 0.65**(DBH-8.6))
-        CV8 = RC8 * CV4
-        # CV4X = CV4 # this is not used in this set of equations, only in BF calculation and is calculated there
-
-        # set these attributes
-        attributes = {'DBH': DBH, 'HT': HT, 'CVTS': CVTS, 'TARIF': TARIF, 'CV4': CV4, 'CVT': CVT, 'CV8': CV8}
-        self.set_attributes(attributes)
-
-        # calculate and set the boardfoot volume metrics
-        self.calcBF()
-
-        # return the requested metric
-        return self.get(metric)
-
 
 # EQUATION 27 COTTONWOOD (BC-COTTONWOOD--DNR RPT#24,1977)
 
 # Brackett, Michael.  1977. Notes on TARIF tree-volume computation.  DNR report #24.
 # State of Washington, Department of Natural Resources, Olympia, WA. 132p.
 
-class Eq_27(Equation):
+class Eq_27(BrackettHWEquation):
+    calc_CVTS = _log_linear_CVTS(-2.945047, 1.803973, 1.238853)
+
     def __init__(self):
         self.eq_num = 27
         self.wood_type = 'HW'
 
-    def calc(self, DBH, HT, metric):
-        """
-        WHERE:
-        DBH (inches) = DBH (CM) CONVERTED TO INCHES (DBH/2.54)
-        HT (feet) = HT (M) CONVERTED TO FEET (HT/0.3048)
-        BA = BASAL AREA (DBH IN INCHES) BA= .005454154 x DBH2
-        CVTSL = LOG BASE 10, CUBIC FOOT VOLUME, INCLUDING TOP AND STUMP
-        CVTS = CUBIC FOOT VOLUME, INCLUDING TOP AND STUMP
-        TARIF = TARIF NUMBER EQUATION (REF. DNR NOTE NO.27, P.2)
-        CVT = CUBIC FOOT VOLUME ABOVE STUMP
-        CV4 = CUBIC FOOT VOLUME ABOVE STUMP, 4-INCH TOP
-        """
-        if DBH <=0 or HT <=0: return 0
-
-        BA = 0.005454154 * DBH**2
-        # note that math.log() uses natural logarithm while math.log10() uses log base 10
-        CVTSL = -2.945047 + 1.803973 * math.log10(DBH) + 1.238853 * math.log10(HT)
-        CVTS = 10**CVTSL
-        TARIF = (CVTS * 0.912733)/((1.033 * (1.0 + 1.382937 * math.exp(-4.015292 * DBH))) * (BA + 0.087266) - 0.174533)
-        CVT = TARIF * (0.9679 - 0.1051 * 0.5523**(DBH-1.5))*((1.033*(1.0 + 1.382937 * math.exp(-4.015292*(DBH/10.0))))*(BA + 0.087266)-0.174533)/0.912733
-        CV4 = TARIF * (BA - 0.087266)/0.912733
-        RC8 = 0.983 - (0.983 * 0.65**(DBH-8.6))
-        CV8 = RC8 * CV4
-        # CV4X = CV4 # this is not used in this set of equations, only in BF calculation and is calculated there
-
-        # set these attributes
-        attributes = {'DBH': DBH, 'HT': HT, 'CVTS': CVTS, 'TARIF': TARIF, 'CV4': CV4, 'CVT': CVT, 'CV8': CV8}
-        self.set_attributes(attributes)
-
-        # calculate and set the boardfoot volume metrics
-        self.calcBF()
-
-        # return the requested metric
-        return self.get(metric)
-
 
 # EQUATION 28 ASPEN (BC-ASPEN--DNR RPT#24,1977)
 
 # Brackett, Michael.  1977. Notes on TARIF tree-volume computation.  DNR report #24.
 # State of Washington, Department of Natural Resources, Olympia, WA. 132p.
 
-class Eq_28(Equation):
+class Eq_28(BrackettHWEquation):
+    calc_CVTS = _log_linear_CVTS(-2.635360, 1.946034, 1.024793)
+
     def __init__(self):
         self.eq_num = 28
         self.wood_type = 'HW'
 
-    def calc(self, DBH, HT, metric):
-        """
-        WHERE:
-        DBH (inches) = DBH (CM) CONVERTED TO INCHES (DBH/2.54)
-        HT (feet) = HT (M) CONVERTED TO FEET (HT/0.3048)
-        BA = BASAL AREA (DBH IN INCHES) BA= .005454154 x DBH2
-        CVTSL = LOG BASE 10, CUBIC FOOT VOLUME, INCLUDING TOP AND STUMP
-        CVTS = CUBIC FOOT VOLUME, INCLUDING TOP AND STUMP
-        TARIF = TARIF NUMBER EQUATION (REF. DNR NOTE NO.27, P.2)
-        CVT = CUBIC FOOT VOLUME ABOVE STUMP
-        CV4 = CUBIC FOOT VOLUME ABOVE STUMP, 4-INCH TOP
-        """
-        if DBH <=0 or HT <=0: return 0
-
-        BA = 0.005454154 * DBH**2
-        # note that math.log() uses natural logarithm while math.log10() uses log base 10
-        CVTSL = -2.635360 + 1.946034 * math.log10(DBH) + 1.024793 * math.log10(HT)
-        CVTS = 10**CVTSL
-        TARIF = (CVTS * 0.912733)/((1.033 * (1.0 + 1.382937 * math.exp(-4.015292 * DBH))) * (BA + 0.087266) - 0.174533)
-        CVT = TARIF * (0.9679 - 0.1051 * 0.5523**(DBH-1.5))*((1.033*(1.0 + 1.382937 * math.exp(-4.015292*(DBH/10.0))))*(BA + 0.087266)-0.174533)/0.912733
-        CV4 = TARIF * (BA - 0.087266)/0.912733
-        RC8 = 0.983 - (0.983 * 0.65**(DBH-8.6))
-        CV8 = RC8 * CV4
-        # CV4X = CV4 # this is not used in this set of equations, only in BF calculation and is calculated there
-
-        # set these attributes
-        attributes = {'DBH': DBH, 'HT': HT, 'CVTS': CVTS, 'TARIF': TARIF, 'CV4': CV4, 'CVT': CVT, 'CV8': CV8}
-        self.set_attributes(attributes)
-
-        # calculate and set the boardfoot volume metrics
-        self.calcBF()
-
-        # return the requested metric
-        return self.get(metric)
-
 
 # EQUATION 29 BIRCH (BC-BIRCH--DNR RPT#24,1977)
 
 # Brackett, Michael.  1977. Notes on TARIF tree-volume computation.  DNR report #24.
 # State of Washington, Department of Natural Resources, Olympia, WA. 132p.
 
-class Eq_29(Equation):
+class Eq_29(BrackettHWEquation):
+    calc_CVTS = _log_linear_CVTS(-2.757813, 1.911681, 1.105403)
+
     def __init__(self):
         self.eq_num = 29
         self.wood_type = 'HW'
 
-    def calc(self, DBH, HT, metric):
-        """
-        WHERE:
-        DBH (inches) = DBH (CM) CONVERTED TO INCHES (DBH/2.54)
-        HT (feet) = HT (M) CONVERTED TO FEET (HT/0.3048)
-        BA = BASAL AREA (DBH IN INCHES) BA= .005454154 x DBH2
-        CVTSL = LOG BASE 10, CUBIC FOOT VOLUME, INCLUDING TOP AND STUMP
-        CVTS = CUBIC FOOT VOLUME, INCLUDING TOP AND STUMP
-        TARIF = TARIF NUMBER EQUATION (REF. DNR NOTE NO.27, P.2)
-        CVT = CUBIC FOOT VOLUME ABOVE STUMP
-        CV4 = CUBIC FOOT VOLUME ABOVE STUMP, 4-INCH TOP
-        """
-        if DBH <=0 or HT <=0: return 0
 
-        BA = 0.005454154 * DBH**2
-        # note that math.log() uses natural logarithm while math.log10() uses log base 10
-        CVTSL = -2.757813 + 1.911681 * math.log10(DBH) + 1.105403 * math.log10(HT)
-        CVTS = 10**CVTSL
-        TARIF = (CVTS * 0.912733)/((1.033 * (1.0 + 1.382937 * math.exp(-4.015292 * DBH))) * (BA + 0.087266) - 0.174533)
-        CVT = TARIF * (0.9679 - 0.1051 * 0.5523**(DBH-1.5))*((1.033*(1.0 + 1.382937 * math.exp(-4.015292*(DBH/10.0))))*(BA + 0.087266)-0.174533)/0.912733
-        CV4 = TARIF * (BA - 0.087266)/0.912733
-        RC8 = 0.983 - (0.983 * 0.65**(DBH-8.6))
-        CV8 = RC8 * CV4
-        # CV4X = CV4 # this is not used in this set of equations, only in BF calculation and is calculated there
+# EQUATION 30 BIGLEAF MAPLE (BC-MAPLE--DNR RPT#24,1977)
 
-        # set these attributes
-        attributes = {'DBH': DBH, 'HT': HT, 'CVTS': CVTS, 'TARIF': TARIF, 'CV4': CV4, 'CVT': CVT, 'CV8': CV8}
-        self.set_attributes(attributes)
+# Brackett, Michael.  1977. Notes on TARIF tree-volume computation.  DNR report #24.
+# State of Washington, Department of Natural Resources, Olympia, WA. 132p.
 
-        # calculate and set the boardfoot volume metrics
-        self.calcBF()
+class Eq_30(BrackettHWEquation):
+    calc_CVTS = _log_linear_CVTS(-2.770324, 1.885813, 1.119043)
 
-        # return the requested metric
-        return self.get(metric)
+    def __init__(self):
+        self.eq_num = 30
+        self.wood_type = 'HW'
 
 
-# EQUATION 30 BIGLEAF MAPLE (BC-MAPLE--DNR RPT#24,1977)
+# EQUATION 31 EUCALYPTUS (MEMO,COLIN D. MacLEAN 1/27/83,(REVISED 2/7/83) )
 
-# Brackett, Michael.  1977. Notes on TARIF tree-volume computation.  DNR report #24.
-# State of Washington, Department of Natural Resources, Olympia, WA. 132p.
+# Colin MacLean and Tom Farrenkopf. 1983. Eucalyptus volume equation.  In-house memo
+# describing the volume equation for CVTS, to be used for all species of Eucalyptus.
+# The equation was developed from 111 trees.  On file at the PNW Research Station, Portland,OR.
 
-class Eq_30(Equation):
+class Eq_31(BrackettHWEquation):
     def __init__(self):
-        self.eq_num = 30
+        self.eq_num = 31
         self.wood_type = 'HW'
 
-    def calc(self, DBH, HT, metric):
-        """
-        WHERE:
-        DBH (inches) = DBH (CM) CONVERTED TO INCHES (DBH/2.54)
-        HT (feet) = HT (M) CONVERTED TO FEET (HT/0.3048)
-        BA = BASAL AREA (DBH IN INCHES) BA= .005454154 x DBH2
-        CVTSL = LOG BASE 10, CUBIC FOOT VOLUME, INCLUDING TOP AND STUMP
-        CVTS = CUBIC FOOT VOLUME, INCLUDING TOP AND STUMP
-        TARIF = TARIF NUMBER EQUATION (REF. DNR NOTE NO.27, P.2)
-        CVT = CUBIC FOOT VOLUME ABOVE STUMP
-        CV4 = CUBIC FOOT VOLUME ABOVE STUMP, 4-INCH TOP
-        """
-        if DBH <=0 or HT <=0: return 0
-
-        BA = 0.005454154 * DBH**2
-        # note that math.log() uses natural logarithm while math.log10() uses log base 10
-        CVTSL = -2.770324 + 1.885813 * math.log10(DBH) + 1.119043 * math.log10(HT)
-        CVTS = 10**CVTSL
-        TARIF = (CVTS * 0.912733)/((1.033 * (1.0 + 1.382937 * math.exp(-4.015292 * DBH))) * (BA + 0.087266) - 0.174533)
-        CVT = TARIF * (0.9679 - 0.1051 * 0.5523**(DBH-1.5))*((1.033*(1.0 + 1.382937 * math.exp(-4.015292*(DBH/10.0))))*(BA + 0.087266)-0.174533)/0.912733
-        CV4 = TARIF * (BA - 0.087266)/0.912733
-        RC8 = 0.983 - (0.983 * 0.65**(DBH-8.6))
-        CV8 = RC8 * CV4
-        # CV4X = CV4 # this is not used in this set of equations, only in BF calculation and is calculated there
-
-        # set these attributes
-        attributes = {'DBH': DBH, 'HT': HT, 'CVTS': CVTS, 'TARIF': TARIF, 'CV4': CV4, 'CVT': CVT, 'CV8': CV8}
-        self.set_attributes(attributes)
-
-        # calculate and set the boardfoot volume metrics
-        self.calcBF()
-
-        # return the requested metric
-        return self.get(metric)
-
-
-# EQUATION 31 EUCALYPTUS (MEMO,COLIN D. MacLEAN 1/27/83,(REVISED 2/7/83) )
-
-# Colin MacLean and Tom Farrenkopf. 1983. Eucalyptus volume equation.  In-house memo
-# describing the volume equation for CVTS, to be used for all species of Eucalyptus.
-# The equation was developed from 111 trees.  On file at the PNW Research Station, Portland,OR.
-
-class Eq_31(Equation):
-    def __init__(self):
-        self.eq_num = 31
-        self.wood_type = 'HW'
-
-    def calc(self, DBH, HT, metric):
-        """
-        WHERE:
-        DBH (inches) = DBH (CM) CONVERTED TO INCHES (DBH/2.54)
-        HT (feet) = HT (M) CONVERTED TO FEET (HT/0.3048)
-        BA = BASAL AREA (DBH IN INCHES) BA= .005454154 x DBH2
-        CVTS = CUBIC FOOT VOLUME, INCLUDING TOP AND STUMP
-        TARIF = TARIF NUMBER EQUATION (REF. DNR NOTE NO.27, P.2)
-        CVT = CUBIC FOOT VOLUME ABOVE STUMP
-        CV4 = CUBIC FOOT VOLUME ABOVE STUMP, 4-INCH TOP
-        """
-        if DBH <=0 or HT <=0: return 0
-
-        BA = 0.005454154 * DBH**2
-        # note that math.log() uses natural logarithm while math.log10() uses log base 10
-        CVTS = 0.0016144 * DBH**2 * HT
-        TARIF = (CVTS * 0.912733)/((1.033 * (1.0 + 1.382937 * math.exp(-4.015292 * DBH))) * (BA + 0.087266) - 0.174533)
-        CVT = TARIF * (0.9679 - 0.1051 * 0.5523**(DBH-1.5))*((1.033*(1.0 + 1.382937 * math.exp(-4.015292*(DBH/10.0))))*(BA + 0.087266)-0.174533)/0.912733
-        CV4 = TARIF * (BA - 0.087266)/0.912733
-        RC8 = 0.983 - (0.983 * 0.65**(DBH-8.6))
-        CV8 = RC8 * CV4
-        # CV4X = CV4 # this is not used in this set of equations, only in BF calculation and is calculated there
-
-        # set these attributes
-        attributes = {'DBH': DBH, 'HT': HT, 'CVTS': CVTS, 'TARIF': TARIF, 'CV4': CV4, 'CVT': CVT, 'CV8': CV8}
-        self.set_attributes(attributes)
-
-        # calculate and set the boardfoot volume metrics
-        self.calcBF()
-
-        # return the requested metric
-        return self.get(metric)
+    def calc_CVTS(self, DBH, HT):
+        return 0.0016144 * DBH*DBH * HT
 
 
 # EQUATION 32 G.CHINQUAPIN (PILLSBURY (H,D), CHARLES BOLSINGER 1/3/83)
@@ -1974,48 +1843,15 @@ class Eq_31(Equation):
 # Saw-log Volume for Thirteen California Hardwoods.  PNW Research Note, PNW-414.
 # Pacific Northwest Research Station, Portland Oregon. 52p.
 
-class Eq_32(Equation):
+class Eq_32(PillsburyEquation):
+    CVTS_COEFS = (0.0120372263, 2.02232, 0.68638)
+    CV4_COEFS = (0.0055212937, 2.07202, 0.77467)
+    CV8_COEFS = (0.0018985111, 2.38285, 0.77105)
+
     def __init__(self):
         self.eq_num = 32
         self.wood_type = 'HW'
 
-    def calc(self, DBH, HT, metric):
-        """
-        WHERE
-        DBH = DBH(CM) CONVERTED TO INCHES (DBH/2.54)
-        HT = HT (M) CONVERTED TO FEET (HT/0.3048)
-        BA = BASAL AREA (DBH IN INCHES) BA= .005454154 x DBH2
-        CVTS = CUBIC FOOT VOLUME, TOTAL STEM, WITH TOP AND STUMP
-        TARIF = TARIF NUMBER EQUATION
-        CVT = CUBIC FOOT VOLUME ABOVE STUMP
-        CV4 = CUBIC FOOT VOLUME, 4-IN TOP
-        CV8 = CUBIC FOOT VOLUME, SAWLOG (8-IN TOP)
-        """
-        if DBH <=0 or HT <=0: return 0
-
-        BA = 0.005454154 * DBH**2
-        CVTS = 0.0120372263 * DBH**2.02232 * HT**0.68638
-        CV4 = 0.0055212937 * DBH**2.07202 * HT**0.77467
-        CV8 = 0.0018985111 * DBH**2.38285 * HT**0.77105
-        RTS = 0.9679 - 0.1051 * 0.5523**(DBH - 1.5) # RTS is not defined in the documentation
-        CVT = CVTS * RTS #  RTS appears to be proportion of cubic volume in tree above stump
-        # CV4X = CVT * (0.99875 - 43.336/DBH**3 - 124.717/DBH**4 + (0.193437*HT)/DBH**3 + 479.83/(DBH**3 * HT))
-            # this is not used in this set of equations, only in BF calculation and is calculated there
-        try:
-            TARIF = (CV8 * 0.912733)/((0.983 - 0.983 * 0.65**(DBH-8.6)) * (BA - 0.087266))
-        except ZeroDivisionError:
-            TARIF = 0.01
-
-        # set these attributes
-        attributes = {'DBH': DBH, 'HT': HT, 'CVTS': CVTS, 'TARIF': TARIF, 'CV4': CV4, 'CVT': CVT, 'CV8': CV8}
-        self.set_attributes(attributes)
-
-        # calculate and set the boardfoot volume metrics
-        self.calcBF()
-
-        # return the requested metric
-        return self.get(metric)
-
 
 # EQUATION 33 C.LAUREL (PILLSBURY (H,D), CHARLES BOLSINGER 1/3/83)
 
@@ -2023,48 +1859,15 @@ class Eq_32(Equation):
 # Saw-log Volume for Thirteen California Hardwoods.  PNW Research Note, PNW-414.
 # Pacific Northwest Research Station, Portland Oregon. 52p.
 
-class Eq_33(Equation):
+class Eq_33(PillsburyEquation):
+    CVTS_COEFS = (0.0057821322, 1.94553, 0.88389)
+    CV4_COEFS = (0.0016380753, 2.05910, 1.05293)
+    CV8_COEFS = (0.0007741517, 2.23009, 1.03700)
+
     def __init__(self):
         self.eq_num = 33
         self.wood_type = 'HW'
 
-    def calc(self, DBH, HT, metric):
-        """
-        WHERE
-        DBH = DBH(CM) CONVERTED TO INCHES (DBH/2.54)
-        HT = HT (M) CONVERTED TO FEET (HT/0.3048)
-        BA = BASAL AREA (DBH IN INCHES) BA= .005454154 x DBH2
-        CVTS = CUBIC FOOT VOLUME, TOTAL STEM, WITH TOP AND STUMP
-        TARIF = TARIF NUMBER EQUATION
-        CVT = CUBIC FOOT VOLUME ABOVE STUMP
-        CV4 = CUBIC FOOT VOLUME, 4-IN TOP
-        CV8 = CUBIC FOOT VOLUME, SAWLOG (8-IN TOP)
-        """
-        if DBH <=0 or HT <=0: return 0
-
-        BA = 0.005454154 * DBH**2
-        CVTS = 0.0057821322 * DBH**1.94553 * HT**0.88389
-        CV4 = 0.0016380753 * DBH**2.05910 * HT**1.05293
-        CV8 = 0.0007741517 * DBH**2.23009 * HT**1.03700
-        RTS = 0.9679 - 0.1051 * 0.5523**(DBH - 1.5) # RTS is not defined in the documentation
-        CVT = CVTS * RTS #  RTS appears to be proportion of cubic volume in tree above stump
-        # CV4X = CVT * (0.99875 - 43.336/DBH**3 - 124.717/DBH**4 + (0.193437*HT)/DBH**3 + 479.83/(DBH**3 * HT))
-            # this is not used in this set of equations, only in BF calculation and is calculated there
-        try:
-            TARIF = (CV8 * 0.912733)/((0.983 - 0.983 * 0.65**(DBH-8.6)) * (BA - 0.087266))
-        except ZeroDivisionError:
-            TARIF = 0.01
-
-        # set these attributes
-        attributes = {'DBH': DBH, 'HT': HT, 'CVTS': CVTS, 'TARIF': TARIF, 'CV4': CV4, 'CVT': CVT, 'CV8': CV8}
-        self.set_attributes(attributes)
-
-        # calculate and set the boardfoot volume metrics
-        self.calcBF()
-
-        # return the requested metric
-        return self.get(metric)
-
 
 # EQUATION 34 TANOAK (PILLSBURY (H,D), CHARLES BOLSINGER 1/3/83)
 
@@ -2072,50 +1875,19 @@ class Eq_33(Equation):
 # Saw-log Volume for Thirteen California Hardwoods.  PNW Research Note, PNW-414.
 # Pacific Northwest Research Station, Portland Oregon. 52p.
 
-class Eq_34(Equation):
+class Eq_34(PillsburyEquation):
+    CVTS_COEFS = (0.0058870024, 1.94165, 0.86562)
+    CV4_COEFS = (0.0005774970, 2.19576, 1.14078)
+    CV8_COEFS = (0.0002526443, 2.30949, 1.21069)
+
     def __init__(self):
         self.eq_num = 34
         self.wood_type = 'HW'
 
     def calc(self, DBH, HT, metric):
-        """
-        WHERE
-        DBH = DBH(CM) CONVERTED TO INCHES (DBH/2.54)
-        HT = HT (M) CONVERTED TO FEET (HT/0.3048)
-        BA = BASAL AREA (DBH IN INCHES) BA= .005454154 x DBH2
-        CVTS = CUBIC FOOT VOLUME, TOTAL STEM, WITH TOP AND STUMP
-        TARIF = TARIF NUMBER EQUATION
-        CVT = CUBIC FOOT VOLUME ABOVE STUMP
-        CV4 = CUBIC FOOT VOLUME, 4-IN TOP
-        CV8 = CUBIC FOOT VOLUME, SAWLOG (8-IN TOP)
-        """
-        if DBH <=0 or HT <=0: return 0
-
-        if HT > 120:
-            HT = 120
-
-        BA = 0.005454154 * DBH**2
-        CVTS = 0.0058870024 * DBH**1.94165 * HT**0.86562
-        CV4 = 0.0005774970 * DBH**2.19576 * HT**1.14078
-        CV8 = 0.0002526443 * DBH**2.30949 * HT**1.21069
-        RTS = 0.9679 - 0.1051 * 0.5523**(DBH - 1.5) # RTS is not defined in the documentation
-        CVT = CVTS * RTS #  RTS appears to be proportion of cubic volume in tree above stump
-        # CV4X = CVT * (0.99875 - 43.336/DBH**3 - 124.717/DBH**4 + (0.193437*HT)/DBH**3 + 479.83/(DBH**3 * HT))
-            # this is not used in this set of equations, only in BF calculation and is calculated there
-        try:
-            TARIF = (CV8 * 0.912733)/((0.983 - 0.983 * 0.65**(DBH-8.6)) * (BA - 0.087266))
-        except ZeroDivisionError:
-            TARIF = 0.01
-
-        # set these attributes
-        attributes = {'DBH': DBH, 'HT': HT, 'CVTS': CVTS, 'TARIF': TARIF, 'CV4': CV4, 'CVT': CVT, 'CV8': CV8}
-        self.set_attributes(attributes)
-
-        # calculate and set the boardfoot volume metrics
-        self.calcBF()
-
-        # return the requested metric
-        return self.get(metric)
+        # height is capped at 120 feet
+        HT = 120 if HT > 120 else HT
+        return PillsburyEquation.calc(self, DBH, HT, metric)
 
 
 # EQUATION 35 CALIF WHITE OAK (PILLSBURY (H,D), CHARLES BOLSINGER 1/3/83)
@@ -2124,48 +1896,15 @@ class Eq_34(Equation):
 # Saw-log Volume for Thirteen California Hardwoods.  PNW Research Note, PNW-414.
 # Pacific Northwest Research Station, Portland Oregon. 52p.
 
-class Eq_35(Equation):
+class Eq_35(PillsburyEquation):
+    CVTS_COEFS = (0.0042870077, 2.33631, 0.74872)
+    CV4_COEFS = (0.0009684363, 2.39565, 0.98878)
+    CV8_COEFS = (0.0001880044, 1.87346, 1.62443)
+
     def __init__(self):
         self.eq_num = 35
         self.wood_type = 'HW'
 
-    def calc(self, DBH, HT, metric):
-        """
-        WHERE
-        DBH = DBH(CM) CONVERTED TO INCHES (DBH/2.54)
-        HT = HT (M) CONVERTED TO FEET (HT/0.3048)
-        BA = BASAL AREA (DBH IN INCHES) BA= .005454154 x DBH2
-        CVTS = CUBIC FOOT VOLUME, TOTAL STEM, WITH TOP AND STUMP
-        TARIF = TARIF NUMBER EQUATION
-        CVT = CUBIC FOOT VOLUME ABOVE STUMP
-        CV4 = CUBIC FOOT VOLUME, 4-IN TOP
-        CV8 = CUBIC FOOT VOLUME, SAWLOG (8-IN TOP)
-        """
-        if DBH <=0 or HT <=0: return 0
-
-        BA = 0.005454154 * DBH**2
-        CVTS = 0.0042870077  * DBH**2.33631 * HT**0.74872
-        CV4 = 0.0009684363 * DBH**2.39565 * HT**0.98878
-        CV8 = 0.0001880044 * DBH**1.87346 * HT**1.62443
-        RTS = 0.9679 - 0.1051 * 0.5523**(DBH - 1.5) # RTS is not defined in the documentation
-        CVT = CVTS * RTS #  RTS appears to be proportion of cubic volume in tree above stump
-        # CV4X = CVT * (0.99875 - 43.336/DBH**3 - 124.717/DBH**4 + (0.193437*HT)/DBH**3 + 479.83/(DBH**3 * HT))
-            # this is not used in this set of equations, only in BF calculation and is calculated there
-        try:
-            TARIF = (CV8 * 0.912733)/((0.983 - 0.983 * 0.65**(DBH-8.6)) * (BA - 0.087266))
-        except ZeroDivisionError:
-            TARIF = 0.01
-
-        # set these attributes
-        attributes = {'DBH': DBH, 'HT': HT, 'CVTS': CVTS, 'TARIF': TARIF, 'CV4': CV4, 'CVT': CVT, 'CV8': CV8}
-        self.set_attributes(attributes)
-
-        # calculate and set the boardfoot volume metrics
-        self.calcBF()
-
-        # return the requested metric
-        return self.get(metric)
-
 
 # EQUATION 36 ENGELMANN OAK (PILLSBURY (H,D), CHARLES BOLSINGER 1/3/83)
 
@@ -2173,48 +1912,15 @@ class Eq_35(Equation):
 # Saw-log Volume for Thirteen California Hardwoods.  PNW Research Note, PNW-414.
 # Pacific Northwest Research Station, Portland Oregon. 52p.
 
-class Eq_36(Equation):
+class Eq_36(PillsburyEquation):
+    CVTS_COEFS = (0.0191453191, 2.40248, 0.28060)
+    CV4_COEFS = (0.0053866353, 2.61268, 0.31103)
+    CV8_COEFS = CV4_COEFS
+
     def __init__(self):
         self.eq_num = 36
         self.wood_type = 'HW'
 
-    def calc(self, DBH, HT, metric):
-        """
-        WHERE
-        DBH = DBH(CM) CONVERTED TO INCHES (DBH/2.54)
-        HT = HT (M) CONVERTED TO FEET (HT/0.3048)
-        BA = BASAL AREA (DBH IN INCHES) BA= .005454154 x DBH2
-        CVTS = CUBIC FOOT VOLUME, TOTAL STEM, WITH TOP AND STUMP
-        TARIF = TARIF NUMBER EQUATION
-        CVT = CUBIC FOOT VOLUME ABOVE STUMP
-        CV4 = CUBIC FOOT VOLUME, 4-IN TOP
-        CV8 = CUBIC FOOT VOLUME, SAWLOG (8-IN TOP)
-        """
-        if DBH <=0 or HT <=0: return 0
-
-        BA = 0.005454154 * DBH**2
-        CVTS = 0.0191453191* DBH**2.40248 * HT**0.28060
-        CV4 = 0.0053866353 * DBH**2.61268 * HT**0.31103
-        CV8 = CV4
-        RTS = 0.9679 - 0.1051 * 0.5523**(DBH - 1.5) # RTS is not defined in the documentation
-        CVT = CVTS * RTS #  RTS appears to be proportion of cubic volume in tree above stump
-        # CV4X = CVT * (0.99875 - 43.336/DBH**3 - 124.717/DBH**4 + (0.193437*HT)/DBH**3 + 479.83/(DBH**3 * HT))
-            # this is not used in this set of equations, only in BF calculation and is calculated there
-        try:
-            TARIF = (CV8 * 0.912733)/((0.983 - 0.983 * 0.65**(DBH-8.6)) * (BA - 0.087266))
-        except ZeroDivisionError:
-            TARIF = 0.01
-
-        # set these attributes
-        attributes = {'DBH': DBH, 'HT': HT, 'CVTS': CVTS, 'TARIF': TARIF, 'CV4': CV4, 'CVT': CVT, 'CV8': CV8}
-        self.set_attributes(attributes)
-
-        # calculate and set the boardfoot volume metrics
-        self.calcBF()
-
-        # return the requested metric
-        return self.get(metric)
-
 
 # EQUATION 37 BIGLEAF MAPLE (PILLSBURY (H,D,FC), CHARLES BOLSINGER 1/3/83)
 
@@ -2223,6 +1929,8 @@ class Eq_36(Equation):
 # Pacific Northwest Research Station, Portland Oregon. 52p.
 
 class Eq_37(Equation):
+    FC_FACTOR = 10**0.40017 # FC**0.40017 with FC = 10, for the CV8 equation
+
     def __init__(self):
         self.eq_num = 37
         self.wood_type = 'HW'
@@ -2245,9 +1953,17 @@ class Eq_37(Equation):
         """
         if DBH <=0 or HT <=0: return 0
 
-        BA = 0.005454154 * DBH**2
-        CVTS = 0.0101786350 * DBH**2.22462 * HT**0.57561
-        CV4 = 0.0034214162 * DBH**2.35347 * HT**0.69586
+        BA = _BA_COEF * DBH*DBH
+        lnD, lnH = math.log(DBH), math.log(HT)
+        CVTS = 0.0101786350 * math.exp(2.22462*lnD + 0.57561*lnH)
+
+        # skip the other volumes when only CVTS was requested, as in PillsburyEquation
+        if metric == 'CVTS':
+            self.DBH, self.HT, self.CVTS = DBH, HT, CVTS
+            self.TARIF = self.CV4 = self.CVT = self.CV8 = None
+            return self.get(metric)
+
+        CV4 = 0.0034214162 * math.exp(2.35347*lnD + 0.69586*lnH)
 
         # no method provided in documentation to calculte FC from DBH and HT
         # using FVS default form classes to estimate diameter at 8 ft above a 1 ft stump
@@ -2266,43 +1982,14 @@ class Eq_37(Equation):
         # 98, 84, 81, 80, 79                            # FVS CA Variant, Rogue River NF, Bigleaf Maple
         # 98, 84, 81, 80, 79                            # FVS CA Variant, Siskiyou NF, Bigleaf Maple
 
-        # define form factors for each diameter range
-        if DBH <11:
-            FF = 84
-        elif DBH >= 11 and DBH < 21:
-            FF = 84
-        elif DBH >= 21 and DBH < 31:
-            FF = 82
-        elif DBH >= 31 and DBH < 41:
-            FF = 81
-        elif DBH >= 41:
-            FF = 80
-
-        FF_9ft = 100 + (FF - 100) * (9 - 4.5)/(16 - 4.5) # calculate form factor at 9 ft above ground by linear interpolation
-        diam_9ft = FF_9ft/100.0 * DBH # calculate diameter at 9 ft
-
-        # If tree height >= 9 ft and diam_9ft >= 9 in., set Pillsbury FC variable to 10, else 1
-        if diam_9ft >= 9 and HT >= 9:
-            FC = 10
-        else:
-            FC = 1
-
-        CV8 = 0.0004236332 * DBH**2.10316 * HT**1.08584 * FC**0.40017
-        RTS = 0.9679 - 0.1051 * 0.5523**(DBH - 1.5) # RTS is not defined in the documentation
-        CVT = CVTS * RTS #  RTS appears to be proportion of cubic volume in tree above stump
+        # form factors for each diameter range; FC is 10 if tree height >= 9 ft and diameter at 9 ft >= 9 in., else 1
+        CV8 = 0.0004236332 * math.exp(2.10316*lnD + 1.08584*lnH) * _form_class_factor(DBH, HT, (84, 84, 82, 81, 80), self.FC_FACTOR)
         # CV4X = CVT * (0.99875 - 43.336/DBH**3 - 124.717/DBH**4 + (0.193437*HT)/DBH**3 + 479.83/(DBH**3 * HT))
             # this is not used in this set of equations, only in BF calculation and is calculated there
-        try:
-            TARIF = (CV8 * 0.912733)/((0.983 - 0.983 * 0.65**(DBH-8.6)) * (BA - 0.087266))
-        except ZeroDivisionError:
-            TARIF = 0.01
+        CVT, TARIF = _pillsbury_block(CVTS, CV8, DBH, BA)
 
         # set these attributes
-        attributes = {'DBH': DBH, 'HT': HT, 'CVTS': CVTS, 'TARIF': TARIF, 'CV4': CV4, 'CVT': CVT, 'CV8': CV8}
-        self.set_attributes(attributes)
-
-        # calculate and set the boardfoot volume metrics
-        self.calcBF()
+        self.DBH, self.HT, self.CVTS, self.TARIF, self.CV4, self.CVT, self.CV8 = DBH, HT, CVTS, TARIF, CV4, CVT, CV8
 
         # return the requested metric
         return self.get(metric)
@@ -2315,6 +2002,8 @@ class Eq_37(Equation):
 # Pacific Northwest Research Station, Portland Oregon. 52p.
 
 class Eq_38(Equation):
+    FC_FACTOR = 10**0.28385 # FC**0.28385 with FC = 10, for the CV8 equation
+
     def __init__(self):
         self.eq_num = 38
         self.wood_type = 'HW'
@@ -2337,9 +2026,17 @@ class Eq_38(Equation):
         """
         if DBH <=0 or HT <=0: return 0
 
-        BA = 0.005454154 * DBH**2
-        CVTS = 0.0070538108 * DBH**1.97437 * HT**0.85034
-        CV4 = 0.0036795695 * DBH**2.12635 * HT**0.83339
+        BA = _BA_COEF * DBH*DBH
+        lnD, lnH = math.log(DBH), math.log(HT)
+        CVTS = 0.0070538108 * math.exp(1.97437*lnD + 0.85034*lnH)
+
+        # skip the other volumes when only CVTS was requested, as in PillsburyEquation
+        if metric == 'CVTS':
+            self.DBH, self.HT, self.CVTS = DBH, HT, CVTS
+            self.TARIF = self.CV4 = self.CVT = self.CV8 = None
+            return self.get(metric)
+
+        CV4 = 0.0036795695 * math.exp(2.12635*lnD + 0.83339*lnH)
 
         # no method provided in documentation to calculte FC from DBH and HT
         # using FVS default form classes to estimate diameter at 8 ft above a 1 ft stump
@@ -2358,43 +2055,14 @@ class Eq_38(Equation):
         # 98, 88, 84, 81, 81                            # FVS CA Variant, Rogue River NF, Black Oak
         # 98, 88, 84, 81, 81                            # FVS CA Variant, Siskiyou NF, Black Oak
 
-        # define form factors for each diameter range
-        if DBH <11:
-            FF = 95
-        elif DBH >= 11 and DBH < 21:
-            FF = 95
-        elif DBH >= 21 and DBH < 31:
-            FF = 84
-        elif DBH >= 31 and DBH < 41:
-            FF = 82
-        elif DBH >= 41:
-            FF = 82
-
-        FF_9ft = 100 + (FF - 100) * (9 - 4.5)/(16 - 4.5) # calculate form factor at 9 ft above ground by linear interpolation
-        diam_9ft = FF_9ft/100.0 * DBH # calculate diameter at 9 ft
-
-        # If tree height >= 9 ft and diam_9ft >= 9 in., set Pillsbury FC variable to 10, else 1
-        if diam_9ft >= 9 and HT >= 9:
-            FC = 10
-        else:
-            FC = 1
-
-        CV8 = 0.0012478663 * DBH**2.68099 * HT**0.42441 * FC**0.28385
-        RTS = 0.9679 - 0.1051 * 0.5523**(DBH - 1.5) # RTS is not defined in the documentation
-        CVT = CVTS * RTS #  RTS appears to be proportion of cubic volume in tree above stump
+        # form factors for each diameter range; FC is 10 if tree height >= 9 ft and diameter at 9 ft >= 9 in., else 1
+        CV8 = 0.0012478663 * math.exp(2.68099*lnD + 0.42441*lnH) * _form_class_factor(DBH, HT, (95, 95, 84, 82, 82), self.FC_FACTOR)
         # CV4X = CVT * (0.99875 - 43.336/DBH**3 - 124.717/DBH**4 + (0.193437*HT)/DBH**3 + 479.83/(DBH**3 * HT))
             # this is not used in this set of equations, only in BF calculation and is calculated there
-        try:
-            TARIF = (CV8 * 0.912733)/((0.983 - 0.983 * 0.65**(DBH-8.6)) * (BA - 0.087266))
-        except ZeroDivisionError:
-            TARIF = 0.01
+        CVT, TARIF = _pillsbury_block(CVTS, CV8, DBH, BA)
 
         # set these attributes
-        attributes = {'DBH': DBH, 'HT': HT, 'CVTS': CVTS, 'TARIF': TARIF, 'CV4': CV4, 'CVT': CVT, 'CV8': CV8}
-        self.set_attributes(attributes)
-
-        # calculate and set the boardfoot volume metrics
-        self.calcBF()
+        self.DBH, self.HT, self.CVTS, self.TARIF, self.CV4, self.CVT, self.CV8 = DBH, HT, CVTS, TARIF, CV4, CVT, CV8
 
         # return the requested metric
         return self.get(metric)
@@ -2407,6 +2075,8 @@ class Eq_38(Equation):
 # Pacific Northwest Research Station, Portland Oregon. 52p.
 
 class Eq_39(Equation):
+    FC_FACTOR = 10**0.15958 # FC**0.15958 with FC = 10, for the CV8 equation
+
     def __init__(self):
         self.eq_num = 39
         self.wood_type = 'HW'
@@ -2429,9 +2099,17 @@ class Eq_39(Equation):
         """
         if DBH <=0 or HT <=0: return 0
 
-        BA = 0.005454154 * DBH**2
-        CVTS = 0.0125103008 * DBH**2.33089 * HT**0.46100
-        CV4 = 0.0042324071 * DBH**2.53987 * HT**0.50591
+        BA = _BA_COEF * DBH*DBH
+        lnD, lnH = math.log(DBH), math.log(HT)
+        CVTS = 0.0125103008 * math.exp(2.33089*lnD + 0.46100*lnH)
+
+        # skip the other volumes when only CVTS was requested, as in PillsburyEquation
+        if metric == 'CVTS':
+            self.DBH, self.HT, self.CVTS = DBH, HT, CVTS
+            self.TARIF = self.CV4 = self.CVT = self.CV8 = None
+            return self.get(metric)
+
+        CV4 = 0.0042324071 * math.exp(2.53987*lnD + 0.50591*lnH)
 
         # no method provided in documentation to calculte FC from DBH and HT
         # using FVS default form classes to estimate diameter at 8 ft above a 1 ft stump
@@ -2442,43 +2120,14 @@ class Eq_39(Equation):
         # 95, 95, 95, 86, 86                            # FVS CA Variant, Rogue River NF, Blue Oak
         # 95, 95, 86, 82, 82                            # FVS CA Variant, Siskiyou NF, Bllue Oak
 
-        # define form factors for each diameter range
-        if DBH <11:
-            FF = 95
-        elif DBH >= 11 and DBH < 21:
-            FF = 95
-        elif DBH >= 21 and DBH < 31:
-            FF = 86
-        elif DBH >= 31 and DBH < 41:
-            FF = 82
-        elif DBH >= 41:
-            FF = 82
-
-        FF_9ft = 100 + (FF - 100) * (9 - 4.5)/(16 - 4.5) # calculate form factor at 9 ft above ground by linear interpolation
-        diam_9ft = FF_9ft/100.0 * DBH # calculate diameter at 9 ft
-
-        # If tree height >= 9 ft and diam_9ft >= 9 in., set Pillsbury FC variable to 10, else 1
-        if diam_9ft >= 9 and HT >= 9:
-            FC = 10
-        else:
-            FC = 1
-
-        CV8 = 0.0036912408 * DBH**1.79732 * HT**0.83884 * FC**0.15958
-        RTS = 0.9679 - 0.1051 * 0.5523**(DBH - 1.5) # RTS is not defined in the documentation
-        CVT = CVTS * RTS #  RTS appears to be proportion of cubic volume in tree above stump
+        # form factors for each diameter range; FC is 10 if tree height >= 9 ft and diameter at 9 ft >= 9 in., else 1
+        CV8 = 0.0036912408 * math.exp(1.79732*lnD + 0.83884*lnH) * _form_class_factor(DBH, HT, (95, 95, 86, 82, 82), self.FC_FACTOR)
         # CV4X = CVT * (0.99875 - 43.336/DBH**3 - 124.717/DBH**4 + (0.193437*HT)/DBH**3 + 479.83/(DBH**3 * HT))
             # this is not used in this set of equations, only in BF calculation and is calculated there
-        try:
-            TARIF = (CV8 * 0.912733)/((0.983 - 0.983 * 0.65**(DBH-8.6)) * (BA - 0.087266))
-        except ZeroDivisionError:
-            TARIF = 0.01
+        CVT, TARIF = _pillsbury_block(CVTS, CV8, DBH, BA)
 
         # set these attributes
-        attributes = {'DBH': DBH, 'HT': HT, 'CVTS': CVTS, 'TARIF': TARIF, 'CV4': CV4, 'CVT': CVT, 'CV8': CV8}
-        self.set_attributes(attributes)
-
-        # calculate and set the boardfoot volume metrics
-        self.calcBF()
+        self.DBH, self.HT, self.CVTS, self.TARIF, self.CV4, self.CVT, self.CV8 = DBH, HT, CVTS, TARIF, CV4, CVT, CV8
 
         # return the requested metric
         return self.get(metric)
@@ -2491,6 +2140,8 @@ class Eq_39(Equation):
 # Pacific Northwest Research Station, Portland Oregon. 52p.
 
 class Eq_40(Equation):
+    FC_FACTOR = 10**0.37868 # FC**0.37868 with FC = 10, for the CV8 equation
+
     def __init__(self):
         self.eq_num = 40
         self.wood_type = 'HW'
@@ -2513,12 +2164,19 @@ class Eq_40(Equation):
         """
         if DBH <=0 or HT <=0: return 0
 
-        if HT > 120:
-            HT = 120
+        HT = 120 if HT > 120 else HT
+
+        BA = _BA_COEF * DBH*DBH
+        lnD, lnH = math.log(DBH), math.log(HT)
+        CVTS = 0.0067322665 * math.exp(1.96628*lnD + 0.83458*lnH)
 
-        BA = 0.005454154 * DBH**2
-        CVTS = 0.0067322665 * DBH**1.96628 * HT**0.83458
-        CV4 = 0.0025616425 * DBH**1.99295 * HT**1.01532
+        # skip the other volumes when only CVTS was requested, as in PillsburyEquation
+        if metric == 'CVTS':
+            self.DBH, self.HT, self.CVTS = DBH, HT, CVTS
+            self.TARIF = self.CV4 = self.CVT = self.CV8 = None
+            return self.get(metric)
+
+        CV4 = 0.0025616425 * math.exp(1.99295*lnD + 1.01532*lnH)
 
         # no method provided in documentation to calculte FC from DBH and HT
         # using FVS default form classes to estimate diameter at 8 ft above a 1 ft stump
@@ -2529,43 +2187,14 @@ class Eq_40(Equation):
         # 95, 86, 82, 79, 79                            # FVS CA Variant, Rogue River NF, Pacific madrone
         # 98, 88, 84, 81, 81                            # FVS CA Variant, Siskiyou NF, Pacific madrone
 
-        # define form factors for each diameter range
-        if DBH <11:
-            FF = 95
-        elif DBH >= 11 and DBH < 21:
-            FF = 86
-        elif DBH >= 21 and DBH < 31:
-            FF = 82
-        elif DBH >= 31 and DBH < 41:
-            FF = 79
-        elif DBH >= 41:
-            FF = 79
-
-        FF_9ft = 100 + (FF - 100) * (9 - 4.5)/(16 - 4.5) # calculate form factor at 9 ft above ground by linear interpolation
-        diam_9ft = FF_9ft/100.0 * DBH # calculate diameter at 9 ft
-
-        # If tree height >= 9 ft and diam_9ft >= 9 in., set Pillsbury FC variable to 10, else 1
-        if diam_9ft >= 9 and HT >= 9:
-            FC = 10
-        else:
-            FC = 1
-
-        CV8 = 0.0006181530 * DBH**1.72635 * HT**1.26462 * FC**0.37868
-        RTS = 0.9679 - 0.1051 * 0.5523**(DBH - 1.5) # RTS is not defined in the documentation
-        CVT = CVTS * RTS #  RTS appears to be proportion of cubic volume in tree above stump
+        # form factors for each diameter range; FC is 10 if tree height >= 9 ft and diameter at 9 ft >= 9 in., else 1
+        CV8 = 0.0006181530 * math.exp(1.72635*lnD + 1.26462*lnH) * _form_class_factor(DBH, HT, (95, 86, 82, 79, 79), self.FC_FACTOR)
         # CV4X = CVT * (0.99875 - 43.336/DBH**3 - 124.717/DBH**4 + (0.193437*HT)/DBH**3 + 479.83/(DBH**3 * HT))
             # this is not used in this set of equations, only in BF calculation and is calculated there
-        try:
-            TARIF = (CV8 * 0.912733)/((0.983 - 0.983 * 0.65**(DBH-8.6)) * (BA - 0.087266))
-        except ZeroDivisionError:
-            TARIF = 0.01
+        CVT, TARIF = _pillsbury_block(CVTS, CV8, DBH, BA)
 
         # set these attributes
-        attributes = {'DBH': DBH, 'HT': HT, 'CVTS': CVTS, 'TARIF': TARIF, 'CV4': CV4, 'CVT': CVT, 'CV8': CV8}
-        self.set_attributes(attributes)
-
-        # calculate and set the boardfoot volume metrics
-        self.calcBF()
+        self.DBH, self.HT, self.CVTS, self.TARIF, self.CV4, self.CVT, self.CV8 = DBH, HT, CVTS, TARIF, CV4, CVT, CV8
 
         # return the requested metric
         return self.get(metric)
@@ -2578,6 +2207,8 @@ class Eq_40(Equation):
 # Pacific Northwest Research Station, Portland Oregon. 52p.
 
 class Eq_41(Equation):
+    FC_FACTOR = 10**0.32652 # FC**0.32652 with FC = 10, for the CV8 equation
+
     def __init__(self):
         self.eq_num = 41
         self.wood_type = 'HW'
@@ -2600,9 +2231,17 @@ class Eq_41(Equation):
         """
         if DBH <=0 or HT <=0: return 0
 
-        BA = 0.005454154 * DBH**2
-        CVTS = 0.0072695058 * DBH**2.14321 * HT**0.74220
-        CV4 = 0.0024277027 * DBH**2.25575 * HT**0.87108
+        BA = _BA_COEF * DBH*DBH
+        lnD, lnH = math.log(DBH), math.log(HT)
+        CVTS = 0.0072695058 * math.exp(2.14321*lnD + 0.74220*lnH)
+
+        # skip the other volumes when only CVTS was requested, as in PillsburyEquation
+        if metric == 'CVTS':
+            self.DBH, self.HT, self.CVTS = DBH, HT, CVTS
+            self.TARIF = self.CV4 = self.CVT = self.CV8 = None
+            return self.get(metric)
+
+        CV4 = 0.0024277027 * math.exp(2.25575*lnD + 0.87108*lnH)
 
         # no method provided in documentation to calculte FC from DBH and HT
         # using FVS default form classes to estimate diameter at 8 ft above a 1 ft stump
@@ -2621,43 +2260,14 @@ class Eq_41(Equation):
         # 89, 89, 89, 89, 89                            # FVS CA Variant, Rogue River NF, White Oak
         # 95, 95, 95, 95, 95                            # FVS CA Variant, Siskiyou NF, White Oak
 
-        # define form factors for each diameter range
-        if DBH <11:
-            FF = 95
-        elif DBH >= 11 and DBH < 21:
-            FF = 95
-        elif DBH >= 21 and DBH < 31:
-            FF = 89
-        elif DBH >= 31 and DBH < 41:
-            FF = 89
-        elif DBH >= 41:
-            FF = 89
-
-        FF_9ft = 100 + (FF - 100) * (9 - 4.5)/(16 - 4.5) # calculate form factor at 9 ft above ground by linear interpolation
-        diam_9ft = FF_9ft/100.0 * DBH # calculate diameter at 9 ft
-
-        # If tree height >= 9 ft and diam_9ft >= 9 in., set Pillsbury FC variable to 10, else 1
-        if diam_9ft >= 9 and HT >= 9:
-            FC = 10
-        else:
-            FC = 1
-
-        CV8 = 0.0008281647 * DBH**2.10651 * HT**0.91215 * FC**0.32652
-        RTS = 0.9679 - 0.1051 * 0.5523**(DBH - 1.5) # RTS is not defined in the documentation
-        CVT = CVTS * RTS #  RTS appears to be proportion of cubic volume in tree above stump
+        # form factors for each diameter range; FC is 10 if tree height >= 9 ft and diameter at 9 ft >= 9 in., else 1
+        CV8 = 0.0008281647 * math.exp(2.10651*lnD + 0.91215*lnH) * _form_class_factor(DBH, HT, (95, 95, 89, 89, 89), self.FC_FACTOR)
         # CV4X = CVT * (0.99875 - 43.336/DBH**3 - 124.717/DBH**4 + (0.193437*HT)/DBH**3 + 479.83/(DBH**3 * HT))
             # this is not used in this set of equations, only in BF calculation and is calculated there
-        try:
-            TARIF = (CV8 * 0.912733)/((0.983 - 0.983 * 0.65**(DBH-8.6)) * (BA - 0.087266))
-        except ZeroDivisionError:
-            TARIF = 0.01
+        CVT, TARIF = _pillsbury_block(CVTS, CV8, DBH, BA)
 
         # set these attributes
-        attributes = {'DBH': DBH, 'HT': HT, 'CVTS': CVTS, 'TARIF': TARIF, 'CV4': CV4, 'CVT': CVT, 'CV8': CV8}
-        self.set_attributes(attributes)
-
-        # calculate and set the boardfoot volume metrics
-        self.calcBF()
+        self.DBH, self.HT, self.CVTS, self.TARIF, self.CV4, self.CVT, self.CV8 = DBH, HT, CVTS, TARIF, CV4, CVT, CV8
 
         # return the requested metric
         return self.get(metric)
@@ -2670,6 +2280,8 @@ class Eq_41(Equation):
 # Pacific Northwest Research Station, Portland Oregon. 52p.
 
 class Eq_42(Equation):
+    FC_FACTOR = 10**0.43381 # FC**0.43381 with FC = 10, for the CV8 equation
+
     def __init__(self):
         self.eq_num = 42
         self.wood_type = 'HW'
@@ -2692,9 +2304,17 @@ class Eq_42(Equation):
         """
         if DBH <=0 or HT <=0: return 0
 
-        BA = 0.005454154 * DBH**2
-        CVTS = 0.0097438611 * DBH**2.20527 * HT**0.61190
-        CV4 = 0.0031670596 * DBH**2.32519 * HT**0.74348
+        BA = _BA_COEF * DBH*DBH
+        lnD, lnH = math.log(DBH), math.log(HT)
+        CVTS = 0.0097438611 * math.exp(2.20527*lnD + 0.61190*lnH)
+
+        # skip the other volumes when only CVTS was requested, as in PillsburyEquation
+        if metric == 'CVTS':
+            self.DBH, self.HT, self.CVTS = DBH, HT, CVTS
+            self.TARIF = self.CV4 = self.CVT = self.CV8 = None
+            return self.get(metric)
+
+        CV4 = 0.0031670596 * math.exp(2.32519*lnD + 0.74348*lnH)
 
         # no method provided in documentation to calculte FC from DBH and HT
         # using FVS default form classes to estimate diameter at 8 ft above a 1 ft stump
@@ -2705,43 +2325,14 @@ class Eq_42(Equation):
         # 94, 94, 85, 80, 80                            # FVS CA Variant, Rogue River NF, Canyon live oak
         # 95, 95, 86, 82, 82                            # FVS CA Variant, Siskiyou NF, Canyon live oak
 
-        # define form factors for each diameter range
-        if DBH <11:
-            FF = 94
-        elif DBH >= 11 and DBH < 21:
-            FF = 94
-        elif DBH >= 21 and DBH < 31:
-            FF = 85
-        elif DBH >= 31 and DBH < 41:
-            FF = 80
-        elif DBH >= 41:
-            FF = 80
-
-        FF_9ft = 100 + (FF - 100) * (9 - 4.5)/(16 - 4.5) # calculate form factor at 9 ft above ground by linear interpolation
-        diam_9ft = FF_9ft/100.0 * DBH # calculate diameter at 9 ft
-
-        # If tree height >= 9 ft and diam_9ft >= 9 in., set Pillsbury FC variable to 10, else 1
-        if diam_9ft >= 9 and HT >= 9:
-            FC = 10
-        else:
-            FC = 1
-
-        CV8 = 0.0006540144 * DBH**2.24437 * HT**0.81358 * FC**0.43381
-        RTS = 0.9679 - 0.1051 * 0.5523**(DBH - 1.5) # RTS is not defined in the documentation
-        CVT = CVTS * RTS #  RTS appears to be proportion of cubic volume in tree above stump
+        # form factors for each diameter range; FC is 10 if tree height >= 9 ft and diameter at 9 ft >= 9 in., else 1
+        CV8 = 0.0006540144 * math.exp(2.24437*lnD + 0.81358*lnH) * _form_class_factor(DBH, HT, (94, 94, 85, 80, 80), self.FC_FACTOR)
         # CV4X = CVT * (0.99875 - 43.336/DBH**3 - 124.717/DBH**4 + (0.193437*HT)/DBH**3 + 479.83/(DBH**3 * HT))
             # this is not used in this set of equations, only in BF calculation and is calculated there
-        try:
-            TARIF = (CV8 * 0.912733)/((0.983 - 0.983 * 0.65**(DBH-8.6)) * (BA - 0.087266))
-        except ZeroDivisionError:
-            TARIF = 0.01
+        CVT, TARIF = _pillsbury_block(CVTS, CV8, DBH, BA)
 
         # set these attributes
-        attributes = {'DBH': DBH, 'HT': HT, 'CVTS': CVTS, 'TARIF': TARIF, 'CV4': CV4, 'CVT': CVT, 'CV8': CV8}
-        self.set_attributes(attributes)
-
-        # calculate and set the boardfoot volume metrics
-        self.calcBF()
+        self.DBH, self.HT, self.CVTS, self.TARIF, self.CV4, self.CVT, self.CV8 = DBH, HT, CVTS, TARIF, CV4, CVT, CV8
 
         # return the requested metric
         return self.get(metric)
@@ -2754,6 +2345,8 @@ class Eq_42(Equation):
 # Pacific Northwest Research Station, Portland Oregon. 52p.
 
 class Eq_43(Equation):
+    FC_FACTOR = 10**0.43381 # FC**0.43381 with FC = 10, for the CV8 equation
+
     def __init__(self):
         self.eq_num = 43
         self.wood_type = 'HW'
@@ -2776,9 +2369,17 @@ class Eq_43(Equation):
         """
         if DBH <=0 or HT <=0: return 0
 
-        BA = 0.005454154 * DBH**2
-        CVTS = 0.0065261029 * DBH**2.31958 * HT**0.62528
-        CV4 = 0.0024574847 * DBH**2.53284 * HT**0.60764
+        BA = _BA_COEF * DBH*DBH
+        lnD, lnH = math.log(DBH), math.log(HT)
+        CVTS = 0.0065261029 * math.exp(2.31958*lnD + 0.62528*lnH)
+
+        # skip the other volumes when only CVTS was requested, as in PillsburyEquation
+        if metric == 'CVTS':
+            self.DBH, self.HT, self.CVTS = DBH, HT, CVTS
+            self.TARIF = self.CV4 = self.CVT = self.CV8 = None
+            return self.get(metric)
+
+        CV4 = 0.0024574847 * math.exp(2.53284*lnD + 0.60764*lnH)
 
         # no method provided in documentation to calculte FC from DBH and HT
         # using FVS default form classes to estimate diameter at 8 ft above a 1 ft stump
@@ -2791,43 +2392,14 @@ class Eq_43(Equation):
         # 95, 95, 86, 82, 82                            # FVS CA Variant, Siskiyou NF, Coast live oak
         # 95, 95, 95, 95, 95                            # FVS CA Variant, Siskiyou NF, California buckeye
 
-        # define form factors for each diameter range
-        if DBH <11:
-            FF = 95
-        elif DBH >= 11 and DBH < 21:
-            FF = 95
-        elif DBH >= 21 and DBH < 31:
-            FF = 86
-        elif DBH >= 31 and DBH < 41:
-            FF = 82
-        elif DBH >= 41:
-            FF = 82
-
-        FF_9ft = 100 + (FF - 100) * (9 - 4.5)/(16 - 4.5) # calculate form factor at 9 ft above ground by linear interpolation
-        diam_9ft = FF_9ft/100.0 * DBH # calculate diameter at 9 ft
-
-        # If tree height >= 9 ft and diam_9ft >= 9 in., set Pillsbury FC variable to 10, else 1
-        if diam_9ft >= 9 and HT >= 9:
-            FC = 10
-        else:
-            FC = 1
-
-        CV8 = 0.0006540144 * DBH**2.24437 * HT**0.81358 * FC**0.43381
-        RTS = 0.9679 - 0.1051 * 0.5523**(DBH - 1.5) # RTS is not defined in the documentation
-        CVT = CVTS * RTS #  RTS appears to be proportion of cubic volume in tree above stump
+        # form factors for each diameter range; FC is 10 if tree height >= 9 ft and diameter at 9 ft >= 9 in., else 1
+        CV8 = 0.0006540144 * math.exp(2.24437*lnD + 0.81358*lnH) * _form_class_factor(DBH, HT, (95, 95, 86, 82, 82), self.FC_FACTOR)
         # CV4X = CVT * (0.99875 - 43.336/DBH**3 - 124.717/DBH**4 + (0.193437*HT)/DBH**3 + 479.83/(DBH**3 * HT))
             # this is not used in this set of equations, only in BF calculation and is calculated there
-        try:
-            TARIF = (CV8 * 0.912733)/((0.983 - 0.983 * 0.65**(DBH-8.6)) * (BA - 0.087266))
-        except ZeroDivisionError:
-            TARIF = 0.01
+        CVT, TARIF = _pillsbury_block(CVTS, CV8, DBH, BA)
 
         # set these attributes
-        attributes = {'DBH': DBH, 'HT': HT, 'CVTS': CVTS, 'TARIF': TARIF, 'CV4': CV4, 'CVT': CVT, 'CV8': CV8}
-        self.set_attributes(attributes)
-
-        # calculate and set the boardfoot volume metrics
-        self.calcBF()
+        self.DBH, self.HT, self.CVTS, self.TARIF, self.CV4, self.CVT, self.CV8 = DBH, HT, CVTS, TARIF, CV4, CVT, CV8
 
         # return the requested metric
         return self.get(metric)
@@ -2840,6 +2412,8 @@ class Eq_43(Equation):
 # Pacific Northwest Research Station, Portland Oregon. 52p.
 
 class Eq_44(Equation):
+    FC_FACTOR = 10**0.43381 # FC**0.43381 with FC = 10, for the CV8 equation
+
     def __init__(self):
         self.eq_num = 44
         self.wood_type = 'HW'
@@ -2862,9 +2436,17 @@ class Eq_44(Equation):
         """
         if DBH <=0 or HT <=0: return 0
 
-        BA = 0.005454154 * DBH**2
-        CVTS = 0.0136818837 * DBH**2.02989 * HT**0.63257
-        CV4 = 0.0041192264 * DBH**2.14915 * HT**0.77843
+        BA = _BA_COEF * DBH*DBH
+        lnD, lnH = math.log(DBH), math.log(HT)
+        CVTS = 0.0136818837 * math.exp(2.02989*lnD + 0.63257*lnH)
+
+        # skip the other volumes when only CVTS was requested, as in PillsburyEquation
+        if metric == 'CVTS':
+            self.DBH, self.HT, self.CVTS = DBH, HT, CVTS
+            self.TARIF = self.CV4 = self.CVT = self.CV8 = None
+            return self.get(metric)
+
+        CV4 = 0.0041192264 * math.exp(2.14915*lnD + 0.77843*lnH)
 
         # no method provided in documentation to calculte FC from DBH and HT
         # using FVS default form classes to estimate diameter at 8 ft above a 1 ft stump
@@ -2875,34 +2457,14 @@ class Eq_44(Equation):
         # 95, 95, 95, 95, 95                            # FVS CA Variant, Rogue River NF, Interior live oak
         # 95, 95, 95, 95, 95                            # FVS CA Variant, Siskiyou NF, Interior live oak
 
-        # define form factors for each diameter range
-        FF = 95
-
-        FF_9ft = 100 + (FF - 100) * (9 - 4.5)/(16 - 4.5) # calculate form factor at 9 ft above ground by linear interpolation
-        diam_9ft = FF_9ft/100.0 * DBH # calculate diameter at 9 ft
-
-        # If tree height >= 9 ft and diam_9ft >= 9 in., set Pillsbury FC variable to 10, else 1
-        if diam_9ft >= 9 and HT >= 9:
-            FC = 10
-        else:
-            FC = 1
-
-        CV8 = 0.0006540144 * DBH**2.24437 * HT**0.81358 * FC**0.43381
-        RTS = 0.9679 - 0.1051 * 0.5523**(DBH - 1.5) # RTS is not defined in the documentation
-        CVT = CVTS * RTS #  RTS appears to be proportion of cubic volume in tree above stump
+        # form factors for each diameter range; FC is 10 if tree height >= 9 ft and diameter at 9 ft >= 9 in., else 1
+        CV8 = 0.0006540144 * math.exp(2.24437*lnD + 0.81358*lnH) * _form_class_factor(DBH, HT, (95, 95, 95, 95, 95), self.FC_FACTOR)
         # CV4X = CVT * (0.99875 - 43.336/DBH**3 - 124.717/DBH**4 + (0.193437*HT)/DBH**3 + 479.83/(DBH**3 * HT))
             # this is not used in this set of equations, only in BF calculation and is calculated there
-        try:
-            TARIF = (CV8 * 0.912733)/((0.983 - 0.983 * 0.65**(DBH-8.6)) * (BA - 0.087266))
-        except ZeroDivisionError:
-            TARIF = 0.01
+        CVT, TARIF = _pillsbury_block(CVTS, CV8, DBH, BA)
 
         # set these attributes
-        attributes = {'DBH': DBH, 'HT': HT, 'CVTS': CVTS, 'TARIF': TARIF, 'CV4': CV4, 'CVT': CVT, 'CV8': CV8}
-        self.set_attributes(attributes)
-
-        # calculate and set the boardfoot volume metrics
-        self.calcBF()
+        self.DBH, self.HT, self.CVTS, self.TARIF, self.CV4, self.CVT, self.CV8 = DBH, HT, CVTS, TARIF, CV4, CVT, CV8
 
         # return the requested metric
         return self.get(metric)
@@ -2935,24 +2497,18 @@ class Eq_45(Equation):
         else: # not originally in equations, but calculation will halt without a value for Factor
             Factor = 1 # when DRC <3"
 
-        if STEMS == 1:
-            VOLUME = (-0.13363 + (0.128222 * (Factor**(1./3.))) + 0.080208)**3
-        elif STEMS > 1:
+        # STEMS below 1 is treated as a single stemmed tree, rather than leaving VOLUME unassigned
+        if STEMS > 1:
             VOLUME = (-0.13363 + (0.128222 * (Factor**(1./3.))))**3
-
-        if VOLUME <= 0:
-            VOLUME = 0.1
+        else:
+            VOLUME = (-0.13363 + (0.128222 * (Factor**(1./3.))) + 0.080208)**3
 
         # in other equations, CVTS is total cubic volume including top and stump
         # this variable name is used here to maintain consistency with other equations
-        CVTS = VOLUME
+        CVTS = 0.1 if VOLUME <= 0 else VOLUME
 
         # set these attributes
-        attributes = {'DBH': DRC, 'HT': HT, 'CVTS': CVTS}
-        self.set_attributes(attributes)
-
-        # calculate and set the boardfoot volume metrics
-        self.calcBF()
+        self.DBH, self.HT, self.CVTS = DRC, HT, CVTS
 
         # return the requested metric
         return self.get(metric)
@@ -2983,39 +2539,37 @@ class Eq_46(Equation):
     #     if DRC >= 3 and HT >0:
     #         Factor = DRC * DRC * HT   # Factor is not used in the equation, not clear why it's calculated here
 
+        X = DRC*DRC * HT/1000
+
         if STEMS > 1:
-            if DRC**2 * HT/1000 <= 2:
-                VOLUME = 0.020 + 1.8972 * DRC**2 * HT/1000 + 0.5756 * (DRC**2 * HT/1000)**2
+            if X <= 2:
+                VOLUME = 0.020 + 1.8972 * X + 0.5756 * X*X
             else:
-                VOLUME = 6.927 + 1.8972 * DRC**2 * HT/1000 - 9.210/(DRC**2 * HT/1000)
+                VOLUME = 6.927 + 1.8972 * X - 9.210/X
 
-        elif STEMS == 1:
-            if DRC**2 * HT/1000 <= 2:
-                VOLUME = -0.043 + 2.3378 * DRC**2 * HT/1000 + 0.8024 * (DRC**2 * HT/1000)**2
+        # STEMS below 1 is treated as a single stemmed tree, rather than leaving VOLUME unassigned
+        else:
+            if X <= 2:
+                VOLUME = -0.043 + 2.3378 * X + 0.8024 * X*X
             else:
-                VOLUME =  9.586 + 2.3378 * DRC**2 * HT/1000 - 12.839/(DRC**2 * HT/1000)
-
-        if VOLUME <= 0:
-            VOLUME = 0.1
+                VOLUME =  9.586 + 2.3378 * X - 12.839/X
 
         # in other equations, CVTS is total cubic volume including top and stump
         # this variable name is used here to maintain consistency with other equations
-        CVTS = VOLUME
+        CVTS = 0.1 if VOLUME <= 0 else VOLUME
 
         # set these attributes
-        attributes = {'DBH': DRC, 'HT': HT, 'CVTS': CVTS}
-        self.set_attributes(attributes)
-
-        # calculate and set the boardfoot volume metrics
-        self.calcBF()
+        self.DBH, self.HT, self.CVTS = DRC, HT, CVTS
 
         # return the requested metric
         return self.get(metric)
 
 
 # For calculating boardfoot volume of softwoods
-def SW_BFConversion(DBH, CV4, TARIF, metric):
+def _SW_scribner(DBH, CV4, TARIF):
     """
+    Calculates the softwood cubic and Scribner volumes to a 6-inch top, which is all the general metrics need.
+    Returns RC6, CV6, TARIF (no less than 0.01), B4, RS616L, RS616, RS632, SV616 and SV632.
     Where:
     B4 = BINGO FACTOR
     CUBUS = CUBIC FOOT VOLUME, UPPER-STEM PORTION
@@ -3028,26 +2582,25 @@ def SW_BFConversion(DBH, CV4, TARIF, metric):
     RI6 = RATIO TO CONVERT CUBIC 6-INCH TOP TO INTERNATIONAL ¼ INCH 6-INCH TOP
     XINT6 = INTERNATIONAL ¼ INCH VOLUME--6-INCH TOP (IN 16-FT LOGS)
     """
-    RC6 = 0.993-(0.993*0.62**(DBH-6.0))
+    RC6 = 0.993-(0.993*math.exp(_LOG_0_62 * (DBH-6.0)))
 
     CV6 = RC6 * CV4
     if CV6 > CV4:
         CV6 = CV4
 
-    CUBUS = CV4-CV6
-
     #If TARIF <0 then set it to 0.01
     if TARIF < 0.01: # this may occur for small trees (DBH or height) and create a negative logarithm in the equations below
         TARIF = 0.01 # this check was not included in original CAR/ARB equations for softwoods
 
-    B4 = TARIF/0.912733
+    B4 = TARIF * _INV_TARIF_COEF
 
     # note that math.log() uses natural logarithm while math.log10() uses log base 10
-    RS616L = 0.174439 + 0.117594 * math.log10(DBH) * math.log10(B4) - 8.210585/DBH**2 + 0.236693 * math.log10(B4) - 0.00001345 * (B4**2) - 0.00001937 * DBH**2
+    LOG_B4 = math.log10(B4)
+    RS616L = 0.174439 + 0.117594 * math.log10(DBH) * LOG_B4 - 8.210585/(DBH*DBH) + 0.236693 * LOG_B4 - 0.00001345 * (B4*B4) - 0.00001937 * DBH*DBH
 
     RS616 = 10.0**RS616L
 
-    RS632 = 1.001491 - 6.924097/TARIF + 0.00001351 * DBH**2
+    RS632 = 1.001491 - 6.924097/TARIF + 0.00001351 * DBH*DBH
 
     SV616 = RS616 * CV6
 
@@ -3057,48 +2610,64 @@ def SW_BFConversion(DBH, CV4, TARIF, metric):
     # West-side Scribner conifer volumes are based on 32 foot logs,
     # for areas other than western Oregon and western Washington Scribner volumes are based on 16 foot logs
 
-    RI6 = -2.904154 + 3.466328 * math.log10(DBH * TARIF) - 0.02765985 * DBH - 0.00008205 * TARIF**2 + 11.29598/DBH**2
+    return RC6, CV6, TARIF, B4, RS616L, RS616, RS632, SV616, SV632
+
+
+def _SW_BF_volumes(DBH, CV4, TARIF):
+    """
+    Calculates every softwood boardfoot conversion at once, returned as a dict keyed on metric.
+    Where:
+    CUBUS = CUBIC FOOT VOLUME, UPPER-STEM PORTION
+    RI6 = RATIO TO CONVERT CUBIC 6-INCH TOP TO INTERNATIONAL ¼ INCH 6-INCH TOP
+    XINT6 = INTERNATIONAL ¼ INCH VOLUME--6-INCH TOP (IN 16-FT LOGS)
+    (see _SW_scribner for the others)
+    """
+    RC6, CV6, TARIF, B4, RS616L, RS616, RS632, SV616, SV632 = _SW_scribner(DBH, CV4, TARIF)
+
+    CUBUS = CV4-CV6
+
+    RI6 = -2.904154 + 3.466328 * math.log10(DBH * TARIF) - 0.02765985 * DBH - 0.00008205 * TARIF*TARIF + 11.29598/(DBH*DBH)
 
     XINT6 = RI6 * CV6
 
-    # record these values in a dictionary
-    metric_dict = {}
-    for each_metric in ['RC6', 'CV6', 'CUBUS', 'B4', 'RS616L', 'RS616', 'RS632','SV616', 'SV632', 'RI6', 'XINT6']:
-        metric_dict[each_metric] = eval(each_metric)
+    return {'RC6': RC6, 'CV6': CV6, 'CUBUS': CUBUS, 'B4': B4, 'RS616L': RS616L, 'RS616': RS616, 'RS632': RS632,
+            'SV616': SV616, 'SV632': SV632, 'RI6': RI6, 'XINT6': XINT6}
 
-    # check for general types of metrics
-    if metric == 'sawlog_cubic':
-        return CV6
-    elif metric == 'boardfoot_16ft':
-        return SV616
-    elif metric == 'boardfoot_32ft':
+
+def SW_BFConversion(DBH, CV4, TARIF, metric):
+    """
+    Converts softwood cubic volume to one boardfoot volume metric (see _SW_BF_volumes for the metrics).
+    """
+    # check for general types of metrics, which do not need the dict of every metric
+    if metric in ('sawlog_cubic', 'boardfoot_16ft', 'boardfoot_32ft'):
+        RC6, CV6, TARIF, B4, RS616L, RS616, RS632, SV616, SV632 = _SW_scribner(DBH, CV4, TARIF)
+        if metric == 'sawlog_cubic':
+            return CV6
+        elif metric == 'boardfoot_16ft':
+            return SV616
         return SV632
 
     # or if the user is requesting a specific metric
-    else:
-        return metric_dict[metric]
+    return _SW_BF_volumes(DBH, CV4, TARIF)[metric]
 
 
 # For calculating boardfoot volume of hardwoods
-def HW_BFConversion(CV4, CV8, DBH, eq_number, CVT, TARIF, HT, metric):
+def _HW_scribner(CV8, DBH, eq_number, CVT, TARIF, HT):
     """
+    Calculates the hardwood cubic volume to a 6-inch top and Scribner volumes, which is all the general metrics need.
+    Returns RC6, CV4X, TARIFX, CV6, B4, RS616L, RS616, SV616, RS816 and SV816.
     WHERE:
     B4 = BINGO FACTOR
-    CUBUS = CUBIC FOOT VOLUME, UPPER-STEM PORTION
     RC6 = RATIO TO CONVERT CUBIC 4-INCH TOP TO CUBIC 6-INCH TOP
     CV6 = CUBIC FOOT VOLUME, 6-INCH TOP (SAWLOG)
     RS616 = RATIO TO CONVERT CUBIC 6-INCH TOP TO SCRIB 6-INCH TOP IN 16-FT LOGS
     SV616 = SCRIBNER VOLUME--6-INCH TOP (IN 16-FT LOGS)
     RS816 = RATIO TO CONVERT CUBIC 6-INCH TOP TO SCRIB 8-INCH TOP IN 16-FT LOGS
     SV816 = SCRIBNER VOLUME--8-INCH TOP (IN 16-FT LOGS)
-    XINT6 = INTERNATIONAL ¼ INCH VOLUME--6-INCH TOP (IN 16-FT LOGS)
-    RI8 =RATIO TO CONVERT INTERNATIONAL ¼ INCH 6-INCH TOP TO INTERNATIONAL ¼ INCH 8-INCH TOP
-    XINT8 = INTERNATIONAL ¼ INCH VOLUME--8-INCH TOP (IN 8-FT LOGS)
     """
-    BA = 0.005454154 * DBH**2
-    CUBUS = CV4 - CV8
+    BA = _BA_COEF * DBH*DBH
 
-    RC6 = 0.993 - 0.993 * 0.62**(DBH-6.0)
+    RC6 = 0.993 - 0.993 * math.exp(_LOG_0_62 * (DBH-6.0))
 
     # If Hardwood Equation Number is 25-31
     if eq_number >= 25 and eq_number <= 31:
@@ -3109,8 +2678,9 @@ def HW_BFConversion(CV4, CV8, DBH, eq_number, CVT, TARIF, HT, metric):
     # Otherwise,
     else:
         # for all other hardwood equation numbers, calculate CV4X and TARIFX as follows:
-        CV4X = CVT * (0.99875 - 43.336/DBH**3 - 124.717/DBH**4 + 0.193437*HT/DBH**3 + 479.83/(DBH**3 * HT))
-        TARIFX = CV8 * 0.912733 / (0.983 - 0.983 * 0.65**(DBH-8.6) * BA - 0.087266)
+        DBH3 = DBH*DBH*DBH
+        CV4X = CVT * (0.99875 - 43.336/DBH3 - 124.717/(DBH3*DBH) + 0.193437*HT/DBH3 + 479.83/(DBH3 * HT))
+        TARIFX = _tarif_from_CV8(CV8, DBH, BA)
 
     #If TARIF or TARIFX are <0 then set them to 0.01
     if TARIF < 0:
@@ -3120,37 +2690,148 @@ def HW_BFConversion(CV4, CV8, DBH, eq_number, CVT, TARIF, HT, metric):
 
     CV6 = RC6 * CV4X
 
-    B4 = TARIFX/0.912733
+    B4 = TARIFX * _INV_TARIF_COEF
 
     # note that math.log() uses natural logarithm while math.log10() uses log base 10
-    RS616L = 0.174439 + 0.117594 * math.log10(B4) - 8.210585/DBH**2 + 0.236693 * math.log10(B4) - 0.00001345 * B4**2 - 0.00001937 * DBH**2
+    LOG_B4 = math.log10(B4)
+    RS616L = 0.174439 + 0.117594 * LOG_B4 - 8.210585/(DBH*DBH) + 0.236693 * LOG_B4 - 0.00001345 * B4*B4 - 0.00001937 * DBH*DBH
     RS616 = 10.0**RS616L
     SV616 = RS616 * CV6
 
-    RI6 = -2.904154 + 3.466328 * math.log10(DBH * TARIFX) - 0.02765985 * DBH - 0.00008205 * TARIFX**2 + 11.29598/DBH**2
-    XINT6 = RI6 * CV6
-
-    RS816 = 0.990 - 0.58 * (0.484**(DBH-9.5))
+    RS816 = 0.990 - 0.58 * math.exp(_LOG_0_484 * (DBH-9.5))
     SV816 = RS816 * SV616
 
-    RI8 = 0.990 - 0.55 * (0.485**(DBH-9.5))
+    return RC6, CV4X, TARIFX, CV6, B4, RS616L, RS616, SV616, RS816, SV816
+
+
+def _HW_BF_volumes(CV4, CV8, DBH, eq_number, CVT, TARIF, HT):
+    """
+    Calculates every hardwood boardfoot conversion at once, returned as a dict keyed on metric.
+    WHERE:
+    CUBUS = CUBIC FOOT VOLUME, UPPER-STEM PORTION
+    XINT6 = INTERNATIONAL ¼ INCH VOLUME--6-INCH TOP (IN 16-FT LOGS)
+    RI8 =RATIO TO CONVERT INTERNATIONAL ¼ INCH 6-INCH TOP TO INTERNATIONAL ¼ INCH 8-INCH TOP
+    XINT8 = INTERNATIONAL ¼ INCH VOLUME--8-INCH TOP (IN 8-FT LOGS)
+    (see _HW_scribner for the others)
+    """
+    RC6, CV4X, TARIFX, CV6, B4, RS616L, RS616, SV616, RS816, SV816 = _HW_scribner(CV8, DBH, eq_number, CVT, TARIF, HT)
+
+    CUBUS = CV4 - CV8
+
+    RI6 = -2.904154 + 3.466328 * math.log10(DBH * TARIFX) - 0.02765985 * DBH - 0.00008205 * TARIFX*TARIFX + 11.29598/(DBH*DBH)
+    XINT6 = RI6 * CV6
+
+    RI8 = 0.990 - 0.55 * math.exp(_LOG_0_485 * (DBH-9.5))
     XINT8 = XINT6 * RI8
 
-    # record these values in a dictionary
-    metric_dict = {}
-    for each_metric in ['RC6', 'CV6', 'CV8', 'TARIFX', 'CV4X', 'CUBUS', 'B4', 'RS616L', 'RS616', 'SV616', 'RI6','XINT6',
-                        'RS816', 'SV816', 'RI8', 'XINT8']:
-        metric_dict[each_metric] = eval(each_metric)
+    return {'RC6': RC6, 'CV6': CV6, 'CV8': CV8, 'TARIFX': TARIFX, 'CV4X': CV4X, 'CUBUS': CUBUS, 'B4': B4,
+            'RS616L': RS616L, 'RS616': RS616, 'SV616': SV616, 'RI6': RI6, 'XINT6': XINT6, 'RS816': RS816,
+            'SV816': SV816, 'RI8': RI8, 'XINT8': XINT8}
+
 
-    # check for general types of metrics
+def HW_BFConversion(CV4, CV8, DBH, eq_number, CVT, TARIF, HT, metric):
+    """
+    Converts hardwood cubic volume to one boardfoot volume metric (see _HW_BF_volumes for the metrics).
+    """
+    # check for general types of metrics, which do not need the dict of every metric
     if metric == 'sawlog_cubic':
         return CV8
     elif metric.startswith('boardfoot'): # and DBH >= 11:
+        RC6, CV4X, TARIFX, CV6, B4, RS616L, RS616, SV616, RS816, SV816 = _HW_scribner(CV8, DBH, eq_number, CVT,
+                                                                                     TARIF, HT)
         return SV816
 
     # or if the user is requesting a specific metric
-    else:
-        return metric_dict[metric]
+    return _HW_BF_volumes(CV4, CV8, DBH, eq_number, CVT, TARIF, HT)[metric]
+
+
+# Volume equations keyed on the equation number used in the ARB tables, e.g. VOLUME_EQUATIONS[14.1] is Eq_141
+VOLUME_EQUATIONS = {1: Eq_1, 2: Eq_2, 3: Eq_3, 4: Eq_4, 5: Eq_5, 6: Eq_6, 7: Eq_7, 8: Eq_8, 9: Eq_9, 10: Eq_10,
+                    11: Eq_11, 12: Eq_12, 13: Eq_13, 14: Eq_14, 14.1: Eq_141, 14.2: Eq_142, 15: Eq_15, 16: Eq_16,
+                    17: Eq_17, 18: Eq_18, 19: Eq_19, 20: Eq_20, 21: Eq_21, 22: Eq_22, 23: Eq_23, 24: Eq_24,
+                    25: Eq_25, 26: Eq_26, 27: Eq_27, 28: Eq_28, 29: Eq_29, 30: Eq_30, 31: Eq_31, 32: Eq_32,
+                    33: Eq_33, 34: Eq_34, 35: Eq_35, 36: Eq_36, 37: Eq_37, 38: Eq_38, 39: Eq_39, 40: Eq_40,
+                    41: Eq_41, 42: Eq_42, 43: Eq_43, 44: Eq_44, 45: Eq_45, 46: Eq_46}
+
+# the calc methods of one instance of each equation per thread, keyed the same way, so that calc_volume neither
+# looks up the class nor creates an instance for every tree; calc stores each tree's values on its instance,
+# so each thread gets instances of its own
+_thread_calcs = threading.local()
+
+
+def _volume_calcs():
+    '''
+    Returns the calc methods used by calc_volume in the current thread, creating them on first use.
+    '''
+    try:
+        return _thread_calcs.calcs
+    except AttributeError:
+        _thread_calcs.calcs = {eq_number: eqn().calc for eq_number, eqn in VOLUME_EQUATIONS.items()}
+        return _thread_calcs.calcs
+
+
+def calc_volume(eq_number, DBH, HT, metric):
+    '''
+    Calculates a volume metric for a tree using the volume equation with the given number.
+    WHERE:
+    eq_number = the ARB volume equation number, e.g. 3 or 14.1
+    DBH = tree diameter at breast height, in inches
+    HT = tree height, in feet
+    metric = the cubic or boardfoot volume metric requested by the user
+    Can be called from several threads at once, as each thread uses its own equation instances.
+    '''
+    return _volume_calcs()[eq_number](DBH, HT, metric)
+
+
+def volume_function(eq_number, metric):
+    '''
+    Returns a function of (DBH, HT) that calculates one volume metric with one volume equation.
+    The equation is looked up and instantiated once, so the returned function can be applied to
+    many trees without repeating that work for each tree. The instance stores each tree's values
+    as it calculates, so the returned function should not be shared between threads.
+    WHERE:
+    eq_number = the ARB volume equation number, e.g. 3 or 14.1
+    metric = the cubic or boardfoot volume metric requested by the user
+    '''
+    calc = VOLUME_EQUATIONS[eq_number]().calc
+
+    def volume(DBH, HT):
+        return calc(DBH, HT, metric)
+
+    return volume
+
+
+def calc_volumes(eq_numbers, DBHs, HTs, metric):
+    '''
+    Calculates a volume metric for many trees that may use different volume equations.
+    Trees are grouped by equation number so that each equation is looked up and instantiated once, and
+    trees of the same equation with the same DBH and HT are only calculated once.
+    Returns a list with the volume of each tree, in the order the trees were given.
+    WHERE:
+    eq_numbers = the ARB volume equation number of each tree, e.g. 3 or 14.1
+    DBHs = the diameter at breast height of each tree, in inches
+    HTs = the height of each tree, in feet
+    metric = the cubic or boardfoot volume metric requested by the user
+    '''
+    DBHs = list(DBHs)
+    HTs = list(HTs)
+
+    trees_by_eq = {}
+    for idx, eq_number in enumerate(eq_numbers):
+        trees_by_eq.setdefault(eq_number, []).append(idx)
+
+    volumes = [None] * len(DBHs)
+    for eq_number, idxs in trees_by_eq.items():
+        volume = volume_function(eq_number, metric)
+        # volumes of the distinct (DBH, HT) pairs of this equation, calculated once each
+        pair_volumes = {}
+        for idx in idxs:
+            pair = (DBHs[idx], HTs[idx])
+            if pair not in pair_volumes:
+                pair_volumes[pair] = volume(*pair)
+            volumes[idx] = pair_volumes[pair]
+
+    return volumes
 
 
 def graph_equations(equations='all', metrics=['CVTS']):
@@ -3163,10 +2844,7 @@ def graph_equations(equations='all', metrics=['CVTS']):
     import matplotlib.pyplot as plt
 
     if equations == 'all':
-        test_eq = [Eq_1, Eq_2, Eq_3, Eq_4, Eq_5, Eq_6, Eq_7, Eq_8, Eq_9, Eq_10, Eq_11, Eq_12, Eq_13,
-                Eq_14, Eq_141, Eq_142, Eq_15, Eq_16, Eq_17, Eq_18, Eq_19, Eq_20, Eq_21, Eq_22, Eq_23,
-                Eq_24, Eq_25, Eq_26, Eq_27, Eq_28, Eq_29, Eq_30, Eq_31, Eq_32, Eq_33, Eq_34, Eq_35,
-                Eq_36, Eq_37, Eq_38, Eq_39, Eq_40, Eq_41, Eq_42, Eq_43, Eq_44, Eq_45, Eq_46]
+        test_eq = list(VOLUME_EQUATIONS.values())
     else: test_eq = equations
 
     for metric in metrics:
@@ -3200,10 +2878,7 @@ def test_negatives(equations='all', metrics=['CVTS']):
     metrics = a list of metrics to test
     '''
     if equations == 'all':
-        test_eq = [Eq_1, Eq_2, Eq_3, Eq_4, Eq_5, Eq_6, Eq_7, Eq_8, Eq_9, Eq_10, Eq_11, Eq_12, Eq_13,
-                Eq_14, Eq_141, Eq_142, Eq_15, Eq_16, Eq_17, Eq_18, Eq_19, Eq_20, Eq_21, Eq_22, Eq_23,
-                Eq_24, Eq_25, Eq_26, Eq_27, Eq_28, Eq_29, Eq_30, Eq_31, Eq_32, Eq_33, Eq_34, Eq_35,
-                Eq_36, Eq_37, Eq_38, Eq_39, Eq_40, Eq_41, Eq_42, Eq_43, Eq_44, Eq_45, Eq_46]
+        test_eq = list(VOLUME_EQUATIONS.values())
     else: test_eq = equations
 
     negatives = []
@@ -3211,15 +2886,18 @@ def test_negatives(equations='all', metrics=['CVTS']):
 
     for metric in metrics:
         for eqn in test_eq:
+            eq = eqn()
             for DBH in range(0,100,1):
                 for HT in range (0, 400, 10):
-                    if eqn().calc(DBH,HT,metric) <0:
+                    vol = eq.calc(DBH,HT,metric)
+                    if vol <0:
                         if eqn.__name__ not in neg_eqs:
                             neg_eqs.append(eqn.__name__)
-                        negatives.append([DBH, HT, eqn().calc(DBH,HT,metric)])
+                        negatives.append([DBH, HT, vol])
 
     if len(negatives) > 0:
         print("These equations created negatives.")
+        print(neg_eqs)
         print(negatives)
     elif len(negatives) == 0:
         print("No negatives!")
@@ -21,8 +21,10 @@ Options:
 """
 
 import os
+import sys
 from docopt import docopt
 import pandas as pd
+import numpy as np
 import math
 import time
 from ARB_Volume_Equations import *
@@ -32,27 +34,39 @@ from ARB_Equation_Assignments import *
 
 if __name__ == "__main__":
 
-    args = docopt(doc, version='1.0')
+    args = docopt(__doc__, version='1.0')
 
     properties_to_run = args['--property']
     report_yr = args['--year']
     region = args['--region']
 
 
+# the columns used from each FPS table, and the types of their measurements, so the rest of each CSV is skipped when it is read
+DBHCLS_COLS = ['RPT_YR', 'STD_ID', 'PlotTree', 'GRP', 'SPECIES', 'TREES', 'DBH', 'HEIGHT']
+DBHCLS_DTYPES = {'TREES': float, 'DBH': float, 'HEIGHT': float}
+ADMIN_COLS = ['STD_ID', 'RPT_YR', 'MSMT_YR', 'Property', 'AREA_GIS', 'AREA_RPT']
+ADMIN_DTYPES = {'AREA_GIS': float, 'AREA_RPT': float}
+
 # Read in the CSV files that were exported from FPS
 try:
-    FPS_DBHCLS = pd.read_csv('DBHCLS.csv')
-    FPS_ADMIN = pd.read_csv('ADMIN.csv')
-    print "Successfully read in DBHCLS and ADMIN tables.\n"
+    FPS_DBHCLS = pd.read_csv('DBHCLS.csv', usecols=DBHCLS_COLS, dtype=DBHCLS_DTYPES)
+    FPS_ADMIN = pd.read_csv('ADMIN.csv', usecols=ADMIN_COLS, dtype=ADMIN_DTYPES)
+    print("Successfully read in DBHCLS and ADMIN tables.\n")
 except IOError:
-    print "Could not find your DBHCLS and ADMIN CSV files. Please export them from your FPS database in to the same folder as this script.\n"
+    print("Could not find your DBHCLS and ADMIN CSV files. Please export them from your FPS database in to the same folder as this script.\n")
+    sys.exit(1)
+
+
+# read in the user's species crosswalk and the equations and wood specs ARB assigns to each species
+# species_classes is a dictionary of Species classes keyed by the user's species code
+species_classes, ARB_species_attributes = load_species('Your_species_codes.xlsx', 'ARB_Volume_and_Biomass_Tables.xlsx')
 
 
 # stand_list, a dataframe of all stands in the ADMIN table
-stand_list = FPS_ADMIN[['STD_ID', 'RPT_YR', 'MSMT_YR', 'Property', 'AREA_GIS', 'AREA_RPT']]
+stand_list = FPS_ADMIN[ADMIN_COLS]
 
 # tree_list, a dataframe of all the trees in the DBHCLS table
-tree_list = FPS_DBHCLS[['RPT_YR', 'STD_ID', 'PlotTree', 'GRP', 'SPECIES', 'TREES', 'DBH', 'HEIGHT']]
+tree_list = FPS_DBHCLS[DBHCLS_COLS]
 
 # add Property Name and GIS_Area to tree_list
 tree_list = tree_list.merge(stand_list[['STD_ID', 'AREA_GIS', 'AREA_RPT', 'Property']], on='STD_ID')
@@ -65,64 +79,76 @@ tree_list = tree_list.merge(stand_list[['STD_ID', 'AREA_GIS', 'AREA_RPT', 'Prope
 
 # Prompt user to specify a single property
 all_properties = pd.unique(stand_list['Property']).tolist()
-if not properties_to_run:
-    print str(len(all_properties)) + ' properties found in the ADMIN table:',
-    print ', '.join(str(prop) for prop in all_properties) + "\n"
+if properties_to_run:
+    properties_to_run = all_properties if properties_to_run.lower() == 'all' else [properties_to_run]
+else:
+    print(str(len(all_properties)) + ' properties found in the ADMIN table:', end=' ')
+    print(', '.join(str(prop) for prop in all_properties) + "\n")
 
     while True:
-        chosen_prop = raw_input('Choose a property to run, or type ALL: ')
+        chosen_prop = input('Choose a property to run, or type ALL: ')
         if chosen_prop.lower() == 'all':
             properties_to_run = all_properties
-            print 'Running carbon calculations for all properties.\n'
+            print('Running carbon calculations for all properties.\n')
             break
         elif chosen_prop in all_properties:
             properties_to_run = [chosen_prop]
-            print 'Running carbon calculations for ' + properties_to_run[0] + '\n'
+            print('Running carbon calculations for ' + properties_to_run[0] + '\n')
             break
         else:
-            print 'Property not recognized. Try again.\n'
+            print('Property not recognized. Try again.\n')
 
 
 # Prompt user to specify a region
 if not region:
     while True:
-        region = raw_input('Choose which regional volume equations to use (WOR, EOR, WWA, EWA, or CA): ')
+        region = input('Choose which regional volume equations to use (WOR, EOR, WWA, EWA, or CA): ')
         if region in ['WOR', 'EOR', 'WWA', 'EWA', 'CA']:
-            print 'All calculations to be done using ' + region + ' equations.\n'
+            print('All calculations to be done using ' + region + ' equations.\n')
             break
         else:
-            print 'Region not recognized. Try again.\n'
+            print('Region not recognized. Try again.\n')
 
 
 # Prompt user to specify a single report year
 all_years = sorted(pd.unique(tree_list['RPT_YR']).tolist())
-if not report_yr:
+if report_yr:
+    report_yr = all_years if report_yr.lower() == 'all' else [int(report_yr)]
+else:
     while True:
-        report_yr = raw_input('Choose a year to run (RPT_YR from DBHCLS table), or type ALL: ')
+        report_yr = input('Choose a year to run (RPT_YR from DBHCLS table), or type ALL: ')
         if report_yr.lower() == 'all':
             report_yr = all_years
-            print 'Running all years.\n'
+            print('Running all years.\n')
             break
         elif int(report_yr) in all_years:
             report_yr = [int(report_yr)]
-            print 'Running calculations for ' + str(report_yr[0]) + ' only.\n'
+            print('Running calculations for ' + str(report_yr[0]) + ' only.\n')
             break
         else:
-            print report_yr + ' not found in DBHCLS table. Try again using one of these:'
-            print ', '.join(str(yr) for yr in all_years) + '\n'
+            print(report_yr + ' not found in DBHCLS table. Try again using one of these:')
+            print(', '.join(str(yr) for yr in all_years) + '\n')
 
 
 # check if all species are recognized from user's crosswalk table
 DBHCLS_spp = pd.unique(FPS_DBHCLS.SPECIES) # the species found in the FPS Database
-spp_used_list = species_used.Your_species_code.tolist() # species found in the user's crosswalk table
-print "Found " + str(len(species_used)) + " species in the species crosswalk spreadsheet and " + str(len(DBHCLS_spp)) + " species in the FPS DBHCLS table.\n"
+spp_used_list = list(species_classes) # species found in the user's crosswalk table
+print("Found " + str(len(spp_used_list)) + " species in the species crosswalk spreadsheet and " + str(len(DBHCLS_spp)) + " species in the FPS DBHCLS table.\n")
 # if not, list the species that are not recognized
-missing_spp = [spp for spp in DBHCLS_spp if spp not in spp_used_list] # species_used comes from crosswalk table, in ARB_Equation_Assignments script
+missing_spp = [spp for spp in DBHCLS_spp if spp not in species_classes] # species_classes comes from crosswalk table, via load_species
 if len(missing_spp) >0:
-    print str(len(missing_spp)) + " species found in the FPS DBHCLS table but missing from the species crosswalk spreadsheet will not have carbon storage calculated:"
-    print "(" + ', '.join(str(spp) for spp in missing_spp) + ")\n"
+    print(str(len(missing_spp)) + " species found in the FPS DBHCLS table but missing from the species crosswalk spreadsheet will not have carbon storage calculated:")
+    print("(" + ', '.join(str(spp) for spp in missing_spp) + ")\n")
 else:
-    print "All species will have carbon calculations.\n"
+    print("All species will have carbon calculations.\n")
+
+# look up the equations and wood density of each species once, rather than once for every tree
+# species_classes contains class objects with attributes for each species such as the volume and biomass equation numbers, etc.
+found_spp = [spp for spp in DBHCLS_spp if spp in species_classes]
+vol_fn = {spp: getattr(species_classes[spp], region+'_VOL') for spp in found_spp}
+bb_fn = {spp: getattr(species_classes[spp], region+'_BB') for spp in found_spp}
+blb_fn = {spp: getattr(species_classes[spp], region+'_BLB') for spp in found_spp}
+wood_dens = {spp: species_classes[spp].wood_dens for spp in found_spp}
 
 
 # hold out RPT_YR years that were not requested by user
@@ -133,14 +159,13 @@ stands_in_properties_to_run = pd.unique(stand_list['STD_ID'].loc[stand_list['Pro
 tree_list = tree_list.loc[tree_list['STD_ID'].isin(stands_in_properties_to_run)]
 
 # hold out any trees that were not in species crosswalk spreadsheet
-if len(missing_spp) >0:
-    missing_trees = tree_list.loc[tree_list['SPECIES'].isin(missing_spp)]
-    tree_list = tree_list.loc[~tree_list['SPECIES'].isin(missing_spp)]
+missing_trees = tree_list.loc[tree_list['SPECIES'].isin(missing_spp)]
+tree_list = tree_list.loc[~tree_list['SPECIES'].isin(missing_spp)]
 
 # hold out any trees that are not living, based on a GRP code
 live_trees = ['..', '.R', '.I', '.L', '.W'] # codes for live, residual, ingrowth, leave, and wildlife trees
 dead_trees = tree_list.loc[~tree_list['GRP'].isin(live_trees)] # trees with codes other than live_trees
-tree_list = tree_list.loc[tree_list['GRP'].isin(live_trees)] # trees only with recognized live_trees codes
+tree_list = tree_list.loc[tree_list['GRP'].isin(live_trees)].copy() # trees only with recognized live_trees codes
 
 
 # add new columns to the tree_list for individual trees:
@@ -149,51 +174,78 @@ tree_list = tree_list.loc[tree_list['GRP'].isin(live_trees)] # trees only with r
 tree_list['FIA_Region'] = region
 
 # record the ARB Volume Equation Number to be used for each tree
-tree_list['Vol_Eq'] = tree_list['SPECIES'].apply(lambda x: getattr(species_classes[x], region+'_VOL').__name__.split('_')[1])
-# species_classe is a dictionary from ARB_Equation_Assignments.py
-# species_classes contains class objects with attributes for each species such as the volume and biomass equation numbers, etc.
+tree_list['Vol_Eq'] = tree_list['SPECIES'].map({spp: fn.__name__.split('_')[1] for spp, fn in vol_fn.items()})
+
+# positions of the trees of each species in tree_list, so the equations for a species are looked up once
+# and called with the plain values of each of its trees, rather than with one dataframe row at a time
+species_rows = tree_list.groupby('SPECIES').indices
+
+def by_species(calc_trees, *columns):
+    '''
+    Returns an array with a value for each tree in tree_list. calc_trees is called once per species with the
+    species code followed by arrays of the named columns for the trees of that species, and returns a value for each of those trees.
+    The equations themselves are scalar, so calc_trees still evaluates them one tree at a time.
+    '''
+    arrays = [tree_list[col].values for col in columns]
+    values = np.full(len(tree_list), np.nan)
+    for spp, rows in species_rows.items():
+        values[rows] = calc_trees(spp, *[arr[rows] for arr in arrays])
+    return values
 
 # calculate Total Cubic Volume (CVTS, cubic volume including top and stump) for each tree
-def get_vol(row):
-    return getattr(species_classes[row.SPECIES], region+'_VOL')().calc(row.DBH, row.HEIGHT, 'CVTS')
-tree_list['CVTS_ft3'] = tree_list.apply(get_vol, axis = 1) # calculate cubic volume for each row
+def get_vol(spp, DBHs, HTs):
+    vol_eq = vol_fn[spp]()
+    return [vol_eq.calc(DBH, HT, 'CVTS') for DBH, HT in zip(DBHs, HTs)]
+tree_list['CVTS_ft3'] = by_species(get_vol, 'DBH', 'HEIGHT')
 
 # calculate boardfoot volume for each tree
-def get_BF(row):
-    if getattr(species_classes[row.SPECIES], 'wood_type') == 'HW':
-        return getattr(species_classes[row.SPECIES], region+'_VOL')().calc(row.DBH, row.HEIGHT, 'SV816')
-    elif getattr(species_classes[row.SPECIES], 'wood_type') == 'SW' and region in ['WWA', 'WOR']:
-        return getattr(species_classes[row.SPECIES], region+'_VOL')().calc(row.DBH, row.HEIGHT, 'SV632')
-    elif getattr(species_classes[row.SPECIES], 'wood_type') == 'SW' and region in ['EWA', 'EOR', 'CA']:
-        return getattr(species_classes[row.SPECIES], region+'_VOL')().calc(row.DBH, row.HEIGHT, 'SV616')
-tree_list['Scrib_BF'] = tree_list.apply(get_BF, axis = 1) # calculate scribner volume for each row
+def get_BF(spp, DBHs, HTs):
+    wood_type = species_classes[spp].wood_type
+    if wood_type == 'HW':
+        metric = 'SV816'
+    elif wood_type == 'SW' and region in ['WWA', 'WOR']:
+        metric = 'SV632'
+    elif wood_type == 'SW' and region in ['EWA', 'EOR', 'CA']:
+        metric = 'SV616'
+    else:
+        return np.full(len(DBHs), np.nan)
+    vol_eq = vol_fn[spp]()
+    return [vol_eq.calc(DBH, HT, metric) for DBH, HT in zip(DBHs, HTs)]
+tree_list['Scrib_BF'] = by_species(get_BF, 'DBH', 'HEIGHT')
 
 # Wood Density and Stem Biomass, density in units of lbs/ft3 and cubic volume in ft3
-tree_list['Wood_density_lbs_ft3'] = tree_list['SPECIES'].apply(lambda x: getattr(species_classes[x], 'wood_dens'))
+tree_list['Wood_density_lbs_ft3'] = tree_list['SPECIES'].map(wood_dens)
 tree_list['Stem_biomass_UStons'] = (tree_list['CVTS_ft3'] * tree_list['Wood_density_lbs_ft3'])/2000.0
 tree_list['Stem_biomass_kg'] = (tree_list['CVTS_ft3'] * tree_list['Wood_density_lbs_ft3'])*0.453592
 
+# the biomass equations use metric units, so convert DBH and HT from English to Metric units for all trees at once
+tree_list['DBH_cm'] = tree_list['DBH'] * 2.54
+tree_list['HT_m'] = tree_list['HEIGHT'] * 0.3048
+
 # Bark biomass equation and calculation
-tree_list['BarkBio_Eq'] = tree_list['SPECIES'].apply(lambda x: getattr(species_classes[x], region+'_BB').func_name.split('_')[1])
-def get_bark_bio(row): # convert DBH and HT from English to Metric units
-    # equations use metric units, so convert DBH and HT from English to Metric units
-    # equations return units of kg
-    return check_BB(row.DBH*2.54, row.HEIGHT*0.3048, row.Wood_density_lbs_ft3, getattr(species_classes[row.SPECIES], region+'_BB'))
-tree_list['Bark_biomass_kg'] = tree_list.apply(get_bark_bio, axis = 1)
+tree_list['BarkBio_Eq'] = tree_list['SPECIES'].map({spp: fn.__name__.split('_')[1] for spp, fn in bb_fn.items()})
+def get_bark_bio(spp, DBHs, HTs):
+    # equations use metric units (DBH in cm, HT in m) and return units of kg
+    BB_eqn, dens = bb_fn[spp], wood_dens[spp]
+    return [check_BB(DBH, HT, dens, BB_eqn) for DBH, HT in zip(DBHs, HTs)]
+tree_list['Bark_biomass_kg'] = by_species(get_bark_bio, 'DBH_cm', 'HT_m')
 
 # Branch biomass equation and calculation
-tree_list['BranchBio_Eq'] = tree_list['SPECIES'].apply(lambda x: getattr(species_classes[x], region+'_BLB').func_name.split('_')[1])
-def get_branch_bio(row):
-    # equations use metric units, so convert DBH and HT from English to Metric units
-    # equations return units of kg
-    return check_BLB(row.DBH*2.54, row.HEIGHT*0.3048, getattr(species_classes[row.SPECIES], region+'_BLB'))
-tree_list['Branch_biomass_kg'] = tree_list.apply(get_branch_bio, axis = 1)
+tree_list['BranchBio_Eq'] = tree_list['SPECIES'].map({spp: fn.__name__.split('_')[1] for spp, fn in blb_fn.items()})
+def get_branch_bio(spp, DBHs, HTs):
+    # equations use metric units (DBH in cm, HT in m) and return units of kg
+    BLB_eqn = blb_fn[spp]
+    return [check_BLB(DBH, HT, BLB_eqn) for DBH, HT in zip(DBHs, HTs)]
+tree_list['Branch_biomass_kg'] = by_species(get_branch_bio, 'DBH_cm', 'HT_m')
 
 # Above-ground biomass
 tree_list['Aboveground_biomass_kg'] = tree_list['Stem_biomass_kg'] + tree_list['Bark_biomass_kg'] + tree_list['Branch_biomass_kg']
 
 # Below-ground biomass, calculated using Cairns et al. (1997) Equation #1
-tree_list['Belowground_biomass_kg'] = tree_list['Aboveground_biomass_kg'].apply(cairns)
+tree_list['Belowground_biomass_kg'] = cairns(tree_list['Aboveground_biomass_kg'].values) # all trees at once
+
+# Live tree biomass, above- and below-ground
+tree_list['LiveTree_biomass_kg'] = tree_list['Aboveground_biomass_kg'] + tree_list['Belowground_biomass_kg']
 
 # Live CO2e for each tree
 tree_list['AbovegroundLive_tCO2e'] = tree_list['Aboveground_biomass_kg'] / 1000.0 *  0.5 * 44.0/12.0
@@ -211,7 +263,7 @@ tree_list['LiveTree_carbon_tCO2e_total_AreaRPT'] = tree_list['LiveTree_carbon_tC
 
 
 # add back in unrecognized species and dead_trees
-tree_list = tree_list.append([missing_trees, dead_trees], ignore_index=True)
+tree_list = pd.concat([tree_list, missing_trees, dead_trees], ignore_index=True)
 
 
 # sort the tree_list
@@ -232,7 +284,7 @@ if not os.path.exists('FPS2ARB_Outputs'):
 
 num_files = 0
 for prop in properties_to_run:
-    tree_list.loc[tree_list['Property'] == prop].to_csv(os.getcwd() + '/FPS2ARB_Outputs/' + 'FPS2ARB_' + prop + '_' + time.strftime('%Y-%m-%d') + '.csv', columns = cols, index = False)
+    tree_list.loc[tree_list['Property'] == prop].to_csv(os.path.join(os.getcwd(), 'FPS2ARB_Outputs', 'FPS2ARB_' + prop + '_' + time.strftime('%Y-%m-%d') + '.csv'), columns = cols, index = False)
     num_files += 1
 
-print 'FPS2ARB calculations completed. \n' + str(num_files) + ' CSV file(s) successfully written to ' + os.getcwd() + '\FPS2ARB_Outputs \n'
+print('FPS2ARB calculations completed. \n' + str(num_files) + ' CSV file(s) successfully written to ' + os.path.join(os.getcwd(), 'FPS2ARB_Outputs') + '\n')